@@ -46,40 +46,120 @@
     }, { passive: true });
   }
 
-  // Lightbox
+  // Lightbox: the painting image and its detail views (data-full / data-thumb)
   var lightbox = document.getElementById('lightbox');
-  var trigger = document.getElementById('painting-image');
+  var triggers = document.querySelectorAll('.painting-image-trigger, .painting-view');
 
-  if (lightbox && trigger) {
+  if (lightbox && triggers.length) {
     var lightboxImg = lightbox.querySelector('.lightbox-img');
     var closeBtn = lightbox.querySelector('.lightbox-close');
     var previousFocus = null;
+    var currentFull = null;
+    var timing = null;
 
-    function openLightbox() {
+    // Per-image candidates (derivatives + source, with byte sizes) written by
+    // schilderijen/single.html, keyed here by the trigger's data-full
+    var lightboxManifest = {};
+    var manifestEl = document.getElementById('lightbox-manifest');
+    if (manifestEl) {
+      try {
+        JSON.parse(manifestEl.textContent).forEach(function (entry) {
+          lightboxManifest[entry.full] = entry.candidates;
+        });
+      } catch (e) { /* no manifest: fall back to data-full */ }
+    }
+    var connection = navigator.connection || {};
+    var prefetched = {};
+
+    // Smallest candidate that fills the lightbox (90vw x 90vh) at this pixel
+    // density, then stepped down to what the connection fetches in about a
+    // second. Browsers without navigator.connection get the size cap only.
+    function chooseSrc(trigger) {
+      var fullSrc = trigger.getAttribute('data-full');
+      var candidates = lightboxManifest[fullSrc];
+      if (!candidates || !candidates.length) return fullSrc;
+
+      var img = trigger.querySelector('img');
+      var webp = /\.webp$/i.test(img ? img.currentSrc : '') &&
+        candidates.some(function (c) { return c.type === 'webp'; });
+      var list = candidates.filter(function (c) {
+        return c.src === fullSrc || (webp ? c.type === 'webp' : c.type !== 'webp');
+      });
+
+      var dpr = window.devicePixelRatio || 1;
+      var ratio = list[0].w / list[0].h;
+      var target = Math.min(window.innerWidth * 0.9, window.innerHeight * 0.9 * ratio) * dpr;
+      var i = 0;
+      while (i < list.length - 1 && list[i].w < target) i++;
+
+      var budget = connection.saveData ? 0 : connection.downlink ? connection.downlink * 125000 : Infinity;
+      while (i > 0 && list[i].bytes > budget) i--;
+
+      // Never swap the thumbnail for something no larger
+      var thumbSrc = trigger.getAttribute('data-thumb');
+      var thumb = candidates.filter(function (c) { return c.src === thumbSrc; })[0];
+      return thumb && thumb.w >= list[i].w ? thumbSrc : list[i].src;
+    }
+
+    // Start the download on hover or focus, unless the user asked to save data
+    function prefetch(trigger) {
+      if (connection.saveData || /2g/.test(connection.effectiveType || '')) return;
+      var src = chooseSrc(trigger);
+      if (src && !prefetched[src]) {
+        prefetched[src] = new Image();
+        prefetched[src].src = src;
+      }
+    }
+
+    // Click-to-display timing: a "lightbox" performance measure per open, ending
+    // when the chosen image has loaded in the lightbox (scripts/bench_lightbox.py)
+    lightboxImg.addEventListener('load', function () {
+      if (!timing || lightboxImg.getAttribute('src') !== timing.src) return;
+      try {
+        performance.measure('lightbox', {
+          start: timing.start,
+          detail: { src: timing.src, prefetch: timing.prefetch }
+        });
+      } catch (e) { /* User Timing Level 3 not supported */ }
+      timing = null;
+    });
+
+    function openLightbox(trigger) {
+      var start = window.performance ? performance.now() : 0;
       previousFocus = document.activeElement;
-      // Show thumbnail immediately, then load full-res
+      // Show the prefetched image, or the thumbnail until the chosen size loads
       var thumbSrc = trigger.getAttribute('data-thumb') || trigger.querySelector('img').src;
-      var fullSrc = trigger.getAttribute('data-full');
+      var fullSrc = chooseSrc(trigger) || thumbSrc;
       var altText = trigger.querySelector('img') ? trigger.querySelector('img').alt : '';
+      var pending = prefetched[fullSrc];
+      var ready = pending && pending.complete && pending.naturalWidth > 0;
 
-      lightboxImg.src = thumbSrc;
+      currentFull = fullSrc;
+      timing = window.performance ? {
+        start: start,
+        src: fullSrc,
+        prefetch: ready ? 'hit' : pending ? 'pending' : 'miss'
+      } : null;
+      lightboxImg.src = ready ? fullSrc : thumbSrc;
       lightboxImg.alt = altText;
       lightbox.hidden = false;
       document.documentElement.style.overflow = 'hidden';
       document.body.style.overflow = 'hidden';
       closeBtn.focus();
 
-      // Load full-res in background
-      if (fullSrc && fullSrc !== thumbSrc) {
-        var preload = new Image();
-        preload.onload = function () {
-          lightboxImg.src = fullSrc;
-        };
-        preload.src = fullSrc;
+      // Load full-res in background; ignore it if another image was opened meanwhile
+      if (!ready && fullSrc !== thumbSrc) {
+        var preload = pending || new Image();
+        preload.addEventListener('load', function () {
+          if (!lightbox.hidden && currentFull === fullSrc) lightboxImg.src = fullSrc;
+        });
+        if (!pending) preload.src = fullSrc;
       }
     }
 
     function closeLightbox() {
+      currentFull = null;
+      timing = null;
       lightbox.hidden = true;
       lightboxImg.src = '';
       document.documentElement.style.overflow = '';
@@ -87,7 +167,11 @@
       if (previousFocus) previousFocus.focus();
     }
 
-    trigger.addEventListener('click', openLightbox);
+    Array.prototype.forEach.call(triggers, function (trigger) {
+      trigger.addEventListener('click', function () { openLightbox(trigger); });
+      trigger.addEventListener('pointerenter', function () { prefetch(trigger); });
+      trigger.addEventListener('focus', function () { prefetch(trigger); });
+    });
 
     closeBtn.addEventListener('click', closeLightbox);
 
@@ -124,6 +208,170 @@
     });
   }
 
+  // Search: index shards from scripts/build_search_index.py, fetched on demand
+  var search = document.getElementById('site-search');
+  if (search && window.fetch && window.Promise) {
+    var searchInput = document.getElementById('search-input');
+    var searchStatus = document.getElementById('search-status');
+    var searchResults = document.getElementById('search-results');
+    var indexUrl = search.getAttribute('data-index');
+    var siteBase = search.getAttribute('data-base');
+    var searchDocs = null;
+    var shards = {};
+    var querySeq = 0;
+    var debounce = null;
+
+    search.hidden = false;
+
+    function loadSearchDocs() {
+      if (!searchDocs) {
+        searchDocs = fetch(indexUrl + 'docs.json').then(function (r) {
+          if (!r.ok) throw new Error(r.status);
+          return r.json();
+        });
+        searchDocs.catch(function () { searchDocs = null; });
+      }
+      return searchDocs;
+    }
+
+    function loadShard(m, key) {
+      if (!(key in m.shards)) return Promise.resolve({ p: {}, g: {} });
+      if (!shards[key]) {
+        shards[key] = fetch(indexUrl + key + '.json?v=' + m.shards[key]).then(function (r) {
+          if (!r.ok) throw new Error(r.status);
+          return r.json();
+        });
+        shards[key].catch(function () { delete shards[key]; });
+      }
+      return shards[key];
+    }
+
+    function shardKey(term) {
+      return /[a-z0-9]/.test(term[0]) ? term[0] : '_';
+    }
+
+    function trigrams(token) {
+      var grams = [];
+      for (var i = 0; i + 3 <= token.length; i++) {
+        if (grams.indexOf(token.substr(i, 3)) === -1) grams.push(token.substr(i, 3));
+      }
+      return grams;
+    }
+
+    function tokenize(m, text) {
+      var normalized = text.normalize ? text.normalize('NFKD').replace(/[\u0300-\u036f]/g, '') : text;
+      return normalized.toLowerCase().split(/[^a-z0-9]+/).filter(function (t) {
+        return t.length >= m.minPrefix && m.stop.indexOf(t) === -1;
+      });
+    }
+
+    // Score one token: prefix hits count double their field weight; otherwise a
+    // doc matching >= 70% of the token's trigrams scores the matched fraction.
+    function scoreToken(m, token, loaded) {
+      var scores = {};
+      var prefix = token.slice(0, m.maxPrefix);
+      (loaded[shardKey(prefix)].p[prefix] || []).forEach(function (hit) {
+        scores[hit[0]] = hit[1] * 2;
+      });
+      var grams = trigrams(token);
+      if (grams.length) {
+        var counts = {};
+        grams.forEach(function (gram) {
+          (loaded[shardKey(gram)].g[gram] || []).forEach(function (id) {
+            counts[id] = (counts[id] || 0) + 1;
+          });
+        });
+        Object.keys(counts).forEach(function (id) {
+          var fraction = counts[id] / grams.length;
+          if (!(id in scores) && fraction >= 0.7) scores[id] = fraction;
+        });
+      }
+      return scores;
+    }
+
+    function renderResults(m, ranked) {
+      searchResults.textContent = '';
+      ranked.slice(0, 20).forEach(function (hit) {
+        var doc = m.docs[hit.id];
+        var li = document.createElement('li');
+        var a = document.createElement('a');
+        a.href = siteBase + doc.u;
+        a.textContent = doc.t;
+        var meta = document.createElement('span');
+        meta.className = 'search-result-meta';
+        var kind = search.getAttribute('data-kind-' + doc.k) || '';
+        meta.textContent = doc.s ? kind + ' · ' + doc.s : kind;
+        li.appendChild(a);
+        li.appendChild(meta);
+        searchResults.appendChild(li);
+      });
+      searchStatus.textContent = ranked.length
+        ? ranked.length + ' ' + search.getAttribute('data-results')
+        : search.getAttribute('data-no-results');
+    }
+
+    function runSearch() {
+      var seq = ++querySeq;
+      var query = searchInput.value;
+      loadSearchDocs().then(function (m) {
+        var tokens = tokenize(m, query);
+        if (!tokens.length) {
+          searchResults.textContent = '';
+          searchStatus.textContent = '';
+          return;
+        }
+        var keys = [];
+        tokens.forEach(function (token) {
+          [token].concat(trigrams(token)).forEach(function (term) {
+            if (keys.indexOf(shardKey(term)) === -1) keys.push(shardKey(term));
+          });
+        });
+        return Promise.all(keys.map(function (key) { return loadShard(m, key); })).then(function (loadedShards) {
+          if (seq !== querySeq) return;
+          var loaded = {};
+          keys.forEach(function (key, i) { loaded[key] = loadedShards[i]; });
+
+          // Every token must match (AND); scores add up
+          var total = null;
+          tokens.forEach(function (token) {
+            var scores = scoreToken(m, token, loaded);
+            var next = {};
+            Object.keys(total || scores).forEach(function (id) {
+              if (id in scores) next[id] = (total ? total[id] : 0) + scores[id];
+            });
+            total = next;
+          });
+          var ranked = Object.keys(total).map(function (id) {
+            return { id: Number(id), score: total[id] };
+          }).sort(function (a, b) {
+            return b.score - a.score || m.docs[a.id].t.localeCompare(m.docs[b.id].t);
+          });
+          renderResults(m, ranked);
+        });
+      }).catch(function () {
+        if (seq === querySeq) searchStatus.textContent = search.getAttribute('data-no-results');
+      });
+    }
+
+    search.querySelector('form').addEventListener('submit', function (e) {
+      e.preventDefault();
+      runSearch();
+    });
+    searchInput.addEventListener('focus', function () {
+      loadSearchDocs().catch(function () {});
+    }, { once: true });
+    searchInput.addEventListener('input', function () {
+      clearTimeout(debounce);
+      debounce = setTimeout(runSearch, 120);
+    });
+    searchInput.addEventListener('keydown', function (e) {
+      if (e.key === 'Escape' && searchInput.value) {
+        searchInput.value = '';
+        runSearch();
+      }
+    });
+  }
+
   // Pre-fill inquiry form from URL params
   var params = new URLSearchParams(window.location.search);
   var paintingParam = params.get('painting');
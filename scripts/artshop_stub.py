@@ -0,0 +1,466 @@
+"""
+Local stand-in for sanderveen-artshop.nl, for offline scraper tests and benchmarks.
+
+Serves a fixture tree whose file paths mirror the URL paths of the live shop
+(category pages, detail pages and /data/upload/Shop/images/ files). Supports a
+configurable per-request latency, strong ETags with If-None-Match -> 304, and
+single-range "Range: bytes=..." requests -> 206.
+
+Fixtures can be recorded from the live shop, or synthesized offline from the
+current content/schilderijen front matter and assets/images/paintings.
+Synthesized detail pages list the painting's image plus --variants detail
+shots: copies of the JPEG with a distinct comment segment, so they hash (and
+deduplicate) as different files without needing an image library.
+
+Usage:
+    python scripts/artshop_stub.py synth                 # build fixtures from content/
+    python scripts/artshop_stub.py synth --variants 0    # one image per painting
+    python scripts/artshop_stub.py record                # record fixtures from the live shop
+    python scripts/artshop_stub.py serve --latency 0.05  # serve on http://127.0.0.1:8765/
+
+    ARTSHOP_BASE_URL=http://127.0.0.1:8765 python scripts/scrape.py
+
+Fixtures live in scripts/.cache/artshop/ (gitignored).
+"""
+
+import argparse
+import contextlib
+import hashlib
+import html
+import mimetypes
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+FIXTURES_DIR = SCRIPTS_DIR / ".cache" / "artshop"
+
+SHOP_IMAGE_PREFIX = "/data/upload/Shop/images/"
+
+# NL front matter category -> scrape.CATEGORIES key
+CATEGORY_KEYS = {"Abstract": "abstract", "Surrealistisch": "magisch-realisme"}
+
+
+class StubStats:
+    """Thread-safe request counters shared by all handler threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.status_counts = {}
+
+    def record(self, status, nbytes):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += nbytes
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "status_counts": dict(self.status_counts),
+            }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve files from `root`; configured per server via class attributes."""
+
+    root = FIXTURES_DIR
+    latency = 0.0
+    stats = None
+    _etags = {}  # path -> (mtime_ns, size, etag)
+    _etag_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        # Quiet by default; the scraper already prints progress
+        pass
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def _resolve(self):
+        url_path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        target = (self.root / url_path.lstrip("/")).resolve()
+        # Refuse anything that escapes the fixture root via ../
+        try:
+            target.relative_to(self.root.resolve())
+        except ValueError:
+            return None
+        if target.is_dir():
+            target = target / "index.html"
+        return target if target.is_file() else None
+
+    def _etag_for(self, path):
+        st = path.stat()
+        with self._etag_lock:
+            cached = self._etags.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        etag = f'"{digest}"'
+        with self._etag_lock:
+            self._etags[path] = (st.st_mtime_ns, st.st_size, etag)
+        return etag
+
+    def _send(self, status, headers, body=b"", head=False):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        sent = 0
+        if body and not head:
+            self.wfile.write(body)
+            sent = len(body)
+        if self.stats is not None:
+            self.stats.record(status, sent)
+
+    def _serve(self, head):
+        if self.latency:
+            time.sleep(self.latency)
+
+        path = self._resolve()
+        if path is None:
+            self._send(404, {"Content-Length": "0"}, head=head)
+            return
+
+        etag = self._etag_for(path)
+        ctype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if ctype.startswith("text/"):
+            ctype += "; charset=utf-8"
+        base_headers = {"ETag": etag, "Accept-Ranges": "bytes", "Content-Type": ctype}
+
+        inm = self.headers.get("If-None-Match")
+        if inm and (inm.strip() == "*" or etag in [t.strip() for t in inm.split(",")]):
+            self._send(304, {"ETag": etag}, head=head)
+            return
+
+        data = path.read_bytes()
+        size = len(data)
+
+        byte_range = parse_range(self.headers.get("Range"), size)
+        if byte_range == "unsatisfiable":
+            self._send(416, {"Content-Range": f"bytes */{size}", "Content-Length": "0"}, head=head)
+            return
+        if byte_range:
+            start, end = byte_range
+            body = data[start:end + 1]
+            headers = dict(base_headers)
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            headers["Content-Length"] = str(len(body))
+            self._send(206, headers, body, head=head)
+            return
+
+        headers = dict(base_headers)
+        headers["Content-Length"] = str(size)
+        self._send(200, headers, data, head=head)
+
+
+def parse_range(header, size):
+    """Parse a single-range "bytes=" header.
+
+    Returns (start, end) inclusive, None to serve the full body (absent,
+    malformed or multi-range headers), or "unsatisfiable" for a 416.
+    """
+    if not header:
+        return None
+    m = re.match(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", header)
+    if not m or (m.group(1) == "" and m.group(2) == ""):
+        return None
+    first, last = m.group(1), m.group(2)
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return "unsatisfiable"
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if start >= size:
+        return "unsatisfiable"
+    end = min(int(last), size - 1) if last else size - 1
+    if end < start:
+        return None
+    return start, end
+
+
+def start_server(root=FIXTURES_DIR, host="127.0.0.1", port=0, latency=0.0):
+    """Start the stub server in a daemon thread.
+
+    Returns (server, stats). The base URL is f"http://{host}:{server.server_port}".
+    Call server.shutdown() when done.
+    """
+    stats = StubStats()
+    handler = type("ConfiguredStubHandler", (StubHandler,), {
+        "root": Path(root),
+        "latency": latency,
+        "stats": stats,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, stats
+
+
+@contextlib.contextmanager
+def patched_scraper(base_url, output_dir, manifest_path):
+    """Point scripts/scrape.py at `base_url` and redirect its outputs.
+
+    Restores the module constants on exit.
+    """
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import scrape
+
+    saved = {
+        name: getattr(scrape, name)
+        for name in ("BASE_URL", "OUTPUT_DIR", "MANIFEST_PATH", "URL_CACHE_PATH", "POLITE_DELAY", "IMAGE_WORKERS")
+    }
+    scrape.BASE_URL = base_url.rstrip("/")
+    scrape.OUTPUT_DIR = Path(output_dir)
+    scrape.MANIFEST_PATH = Path(manifest_path)
+    scrape.URL_CACHE_PATH = Path(manifest_path).with_name("image-urls.json")
+    scrape.POLITE_DELAY = 0
+    try:
+        yield scrape
+    finally:
+        for name, value in saved.items():
+            setattr(scrape, name, value)
+
+
+@contextlib.contextmanager
+def stub_artshop(root=FIXTURES_DIR, latency=0.0):
+    """Serve `root` for the duration of the block; yields (base_url, stats)."""
+    server, stats = start_server(root, latency=latency)
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", stats
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# --- Fixture creation ---
+
+def _fixture_path(root, url_path):
+    return Path(root) / url_path.lstrip("/")
+
+
+def _link_or_copy(src, dest):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def _detail_html(title_nl, title_en, image_urls, medium, dimensions, price):
+    esc = html.escape
+    views = "".join(f'<a href="{esc(u)}"><img src="{esc(u)}" alt="{esc(title_nl)}"></a>' for u in image_urls[1:])
+    return f"""<!DOCTYPE html>
+<html lang="nl">
+<head>
+<meta charset="utf-8">
+<title>{esc(title_nl)} / {esc(title_en)}</title>
+<meta property="og:title" content="{esc(title_nl)}">
+<meta property="og:image" content="{esc(image_urls[0])}">
+</head>
+<body>
+<div class="product-image"><img src="{esc(image_urls[0])}" alt="{esc(title_nl)}"></div>
+<div class="product-thumbs">{views}</div>
+<div class="product-price">€ {price}</div>
+<div class="product-text">{esc(medium)} / {esc(dimensions)}</div>
+</body>
+</html>
+"""
+
+
+def _variant_bytes(data, n):
+    """The JPEG with a COM segment naming detail view `n`, or None for other formats."""
+    if data[:2] != b"\xff\xd8":
+        return None
+    comment = f"detail view {n}".encode("ascii")
+    return data[:2] + b"\xff\xfe" + (len(comment) + 2).to_bytes(2, "big") + comment + data[2:]
+
+
+def synthesize_fixtures(root=FIXTURES_DIR, variants=2):
+    """Build a fixture tree from content/schilderijen and assets/images/paintings.
+
+    Each JPEG painting gets `variants` extra detail-shot images.
+
+    Returns the number of detail pages written.
+    """
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from scrape import CATEGORIES, slugify
+    from validate_content import COLLECTIONS, parse_front_matter
+
+    root = Path(root)
+    if root.exists():
+        shutil.rmtree(root)
+
+    nl_folder = COLLECTIONS["paintings"]["nl"]["folder"]
+    en_folder = COLLECTIONS["paintings"]["en"]["folder"]
+    en_titles = {}
+    for md_file in en_folder.glob("*.md"):
+        fm = parse_front_matter(md_file)
+        if fm and "translationKey" in fm:
+            en_titles[fm["translationKey"]] = fm.get("title", "")
+
+    links = {key: [] for key in CATEGORIES}
+    count = 0
+    for product_id, md_file in enumerate(sorted(nl_folder.glob("*.md")), start=1000):
+        if md_file.name == "_index.md":
+            continue
+        fm = parse_front_matter(md_file)
+        if not fm or not fm.get("image"):
+            continue
+        src = ROOT / "assets" / str(fm["image"]).lstrip("/")
+        if not src.exists():
+            continue
+        cat_key = CATEGORY_KEYS.get(fm.get("category", ""), "abstract")
+        key = fm.get("translationKey", md_file.stem)
+        title_en = en_titles.get(key) or fm.get("title", "")
+        detail_slug = f"{key}--{slugify(title_en)}"
+        detail_path = f"{CATEGORIES[cat_key]}detail/{product_id}/{detail_slug}.html"
+        image_url = SHOP_IMAGE_PREFIX + src.name
+        image_urls = [image_url]
+
+        _link_or_copy(src, _fixture_path(root, image_url))
+        master = src.read_bytes() if variants else b""
+        for n in range(1, variants + 1):
+            body = _variant_bytes(master, n)
+            if body is None:
+                break
+            variant_url = f"{SHOP_IMAGE_PREFIX}{src.stem}-detail-{n}{src.suffix}"
+            _fixture_path(root, variant_url).write_bytes(body)
+            image_urls.append(variant_url)
+        page = _detail_html(
+            fm.get("title", ""), title_en, image_urls,
+            fm.get("medium", ""), fm.get("dimensions", ""),
+            f"{(product_id % 9 + 4) * 100},00",
+        )
+        dest = _fixture_path(root, detail_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(page, encoding="utf-8")
+        links[cat_key].append(detail_path)
+        count += 1
+
+    for cat_key, cat_path in CATEGORIES.items():
+        items = "\n".join(f'<li><a href="{p}">{p.rsplit("/", 1)[-1]}</a></li>' for p in links[cat_key])
+        dest = _fixture_path(root, cat_path) / "index.html"
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(f"<!DOCTYPE html>\n<html><body><ul>\n{items}\n</ul></body></html>\n", encoding="utf-8")
+
+    return count
+
+
+def _get_bytes(url):
+    req = urllib.request.Request(url, headers={
+        "User-Agent": "Mozilla/5.0 (sanderveen.art migration script)"
+    })
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return resp.read()
+
+
+def record_fixtures(root=FIXTURES_DIR, base_url="https://sanderveen-artshop.nl"):
+    """Record category pages, detail pages and images from the live shop."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from scrape import CATEGORIES, LinkExtractor, extract_product_data
+
+    root = Path(root)
+    recorded = 0
+    for category, cat_path in CATEGORIES.items():
+        print(f"\n--- Category: {category} ---")
+        body = _get_bytes(base_url + cat_path)
+        dest = _fixture_path(root, cat_path) / "index.html"
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(body)
+
+        parser = LinkExtractor()
+        parser.feed(body.decode("utf-8", errors="replace"))
+        for link in parser.links:
+            url_path = urllib.parse.urlsplit(link).path
+            try:
+                detail = _get_bytes(base_url + url_path)
+            except Exception as e:
+                print(f"  Failed {url_path}: {e}")
+                continue
+            _fixture_path(root, url_path).parent.mkdir(parents=True, exist_ok=True)
+            _fixture_path(root, url_path).write_bytes(detail)
+            recorded += 1
+
+            data = extract_product_data(detail.decode("utf-8", errors="replace"), url_path)
+            for img in data["images"]:
+                img_path = urllib.parse.urlsplit(img).path
+                dest = _fixture_path(root, img_path)
+                if dest.exists():
+                    continue
+                try:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    dest.write_bytes(_get_bytes(base_url + img_path))
+                except Exception as e:
+                    print(f"  Failed {img_path}: {e}")
+            print(f"  Recorded: {url_path.rsplit('/', 1)[-1]}")
+            time.sleep(0.5)  # Be polite
+    return recorded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for sanderveen-artshop.nl")
+    parser.add_argument("--root", type=Path, default=FIXTURES_DIR, help="Fixture directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Serve the fixture tree")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per request")
+
+    synth = sub.add_parser("synth", help="Build fixtures from content/ and assets/")
+    synth.add_argument("--variants", type=int, default=2, help="Detail-shot images per painting")
+
+    record = sub.add_parser("record", help="Record fixtures from the live shop")
+    record.add_argument("--base-url", default="https://sanderveen-artshop.nl")
+
+    args = parser.parse_args()
+
+    if args.command == "synth":
+        count = synthesize_fixtures(args.root, args.variants)
+        print(f"Synthesized {count} detail pages in {args.root}")
+    elif args.command == "record":
+        count = record_fixtures(args.root, args.base_url)
+        print(f"\nRecorded {count} detail pages in {args.root}")
+    else:
+        if not args.root.exists():
+            print(f"Fixture directory not found: {args.root}")
+            print("Run: python scripts/artshop_stub.py synth")
+            sys.exit(1)
+        server, stats = start_server(args.root, args.host, args.port, args.latency)
+        print(f"Serving {args.root} on http://{args.host}:{server.server_port}/ (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+            print(f"\n{stats.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Lightbox click-to-display benchmark: serves the built site (public/) with
+simulated latency and bandwidth, plus a benchmark page that opens each
+painting's lightbox with and without a hover first.
+
+main.js records a "lightbox" performance measure per open, from the click to
+the chosen image loading in the lightbox, tagged with whether the hover
+prefetch had finished ("hit"), was still loading ("pending") or never ran
+("miss"). The benchmark page loads every painting page in a 1280x800 iframe
+twice:
+    click   click the painting straight away (no prefetch)
+    hover   hover it, wait --dwell ms, then click
+and posts the measures back here; the summary is printed and appended to
+scripts/.cache/bench-lightbox.jsonl (gitignored).
+
+Every trial sets a new cookie and responses carry `Vary: Cookie`, so each
+trial starts with a cold HTTP cache while the prefetch and the lightbox
+within one trial share it. Bandwidth is limited per connection.
+
+Usage:
+    hugo --minify
+    python scripts/bench_lightbox.py --latency 0.05 --bandwidth 10
+    # then open http://127.0.0.1:8766/__bench/lightbox/ (or pass --open)
+    python scripts/bench_lightbox.py --dwell 150 --pages 10 --open
+"""
+
+import argparse
+import json
+import mimetypes
+import statistics
+import sys
+import time
+import webbrowser
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from artshop_stub import StubHandler  # noqa: E402
+from profile_build import git_head  # noqa: E402
+from validate_content import ROOT  # noqa: E402
+
+PUBLIC = ROOT / "public"
+HISTORY_PATH = Path(__file__).resolve().parent / ".cache" / "bench-lightbox.jsonl"
+BENCH_PATH = "/__bench/lightbox/"
+CHUNK = 16 * 1024
+MODES = ["click", "hover"]
+
+mimetypes.add_type("image/webp", ".webp")
+
+BENCH_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Lightbox benchmark</title>
+<style>
+  body { font: 14px/1.4 system-ui, sans-serif; margin: 1.5rem; }
+  iframe { width: 1280px; height: 800px; border: 1px solid #ccc; display: block; margin-top: 1rem; }
+  td, th { padding: 0.15rem 0.75rem; text-align: right; }
+  td:first-child, th:first-child { text-align: left; }
+</style>
+</head>
+<body>
+<h1>Lightbox click-to-display</h1>
+<p id="status">Starting…</p>
+<table><thead><tr><th>page</th><th>mode</th><th>ms</th><th>prefetch</th><th>KB</th></tr></thead><tbody id="rows"></tbody></table>
+<iframe id="frame" title="page under test"></iframe>
+<script>
+var config = __CONFIG__;
+var frame = document.getElementById('frame');
+var statusEl = document.getElementById('status');
+var rows = document.getElementById('rows');
+
+function wait(ms) { return new Promise(function (resolve) { setTimeout(resolve, ms); }); }
+
+function load(url) {
+  return new Promise(function (resolve) {
+    frame.onload = function () { resolve(); };
+    frame.src = url;
+  });
+}
+
+async function measure(win, timeout) {
+  var until = performance.now() + timeout;
+  while (performance.now() < until) {
+    var entries = win.performance.getEntriesByName('lightbox', 'measure');
+    if (entries.length) return entries[0];
+    await wait(20);
+  }
+  return null;
+}
+
+async function trial(page, mode, n) {
+  document.cookie = 'bench-run=' + Date.now() + '-' + n + '; path=/';
+  await load(page);
+  var win = frame.contentWindow;
+  var doc = frame.contentDocument;
+  var trigger = doc.querySelector('.painting-image-trigger');
+  if (!trigger) return null;
+  if (mode === 'hover') {
+    trigger.dispatchEvent(new PointerEvent('pointerenter'));
+    await wait(config.dwell);
+  }
+  trigger.click();
+  var entry = await measure(win, 30000);
+  if (!entry) return { page: page, mode: mode, ms: null, prefetch: null, src: null, bytes: null };
+
+  var bytes = null;
+  var manifest = doc.getElementById('lightbox-manifest');
+  JSON.parse(manifest ? manifest.textContent : '[]').forEach(function (item) {
+    item.candidates.forEach(function (c) { if (c.src === entry.detail.src) bytes = c.bytes; });
+  });
+  return { page: page, mode: mode, ms: entry.duration, prefetch: entry.detail.prefetch,
+           src: entry.detail.src, bytes: bytes };
+}
+
+(async function () {
+  var trials = [];
+  for (var i = 0; i < config.pages.length; i++) {
+    for (var m = 0; m < config.modes.length; m++) {
+      statusEl.textContent = 'Page ' + (i + 1) + ' of ' + config.pages.length + ' (' + config.modes[m] + ')';
+      var t = await trial(config.pages[i], config.modes[m], trials.length);
+      if (!t) continue;
+      trials.push(t);
+      var tr = document.createElement('tr');
+      [t.page, t.mode, t.ms === null ? 'timeout' : t.ms.toFixed(0), t.prefetch || '-',
+       t.bytes === null ? '-' : (t.bytes / 1024).toFixed(0)].forEach(function (v) {
+        var td = document.createElement('td');
+        td.textContent = v;
+        tr.appendChild(td);
+      });
+      rows.appendChild(tr);
+    }
+  }
+  frame.src = 'about:blank';
+  await fetch(config.resultsUrl, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ userAgent: navigator.userAgent, devicePixelRatio: window.devicePixelRatio,
+                           trials: trials })
+  });
+  statusEl.textContent = 'Done: ' + trials.length + ' trials, summary printed by bench_lightbox.py';
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class BenchHandler(StubHandler):
+    """StubHandler over public/, with a bandwidth cap and the benchmark page."""
+
+    bandwidth = 0.0  # bytes per second, 0 = unlimited
+    page_config = {}
+    on_results = None
+
+    def end_headers(self):
+        if not self.path.startswith(BENCH_PATH):
+            self.send_header("Cache-Control", "max-age=3600")
+            self.send_header("Vary", "Cookie")
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path.split("?")[0] == BENCH_PATH:
+            body = BENCH_PAGE.replace("__CONFIG__", json.dumps(self.page_config)).encode("utf-8")
+            self._send(200, {"Content-Type": "text/html; charset=utf-8", "Content-Length": str(len(body)),
+                             "Cache-Control": "no-store"}, body)
+            return
+        super().do_GET()
+
+    def do_POST(self):
+        if self.path != BENCH_PATH + "results":
+            self._send(404, {"Content-Length": "0"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        results = json.loads(self.rfile.read(length))
+        self._send(204, {})
+        self.on_results(results)
+
+    def _send(self, status, headers, body=b"", head=False):
+        if not self.bandwidth or head or len(body) <= CHUNK:
+            super()._send(status, headers, body, head)
+            return
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        for start in range(0, len(body), CHUNK):
+            chunk = body[start:start + CHUNK]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / self.bandwidth)
+        if self.stats is not None:
+            self.stats.record(status, len(body))
+
+
+def lightbox_pages(public):
+    """URL paths of the built pages that carry a lightbox manifest."""
+    pages = []
+    for path in sorted(public.rglob("index.html")):
+        if "lightbox-manifest" in path.read_text(encoding="utf-8", errors="replace"):
+            rel = path.parent.relative_to(public).as_posix()
+            pages.append("/" if rel == "." else f"/{rel}/")
+    return pages
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(trials):
+    """{mode: summary} over the trials that finished."""
+    summary = {}
+    for mode in MODES:
+        done = [t for t in trials if t["mode"] == mode and t["ms"] is not None]
+        if not done:
+            continue
+        ms = [t["ms"] for t in done]
+        sizes = [t["bytes"] for t in done if t["bytes"] is not None]
+        summary[mode] = {
+            "trials": len(done),
+            "timeouts": sum(1 for t in trials if t["mode"] == mode and t["ms"] is None),
+            "median_ms": statistics.median(ms),
+            "p95_ms": percentile(ms, 95),
+            "prefetch_hits": sum(1 for t in done if t["prefetch"] == "hit"),
+            "median_bytes": statistics.median(sizes) if sizes else None,
+        }
+    return summary
+
+
+def print_summary(run):
+    bandwidth = f"{run['bandwidth_mbps']:g} Mbit/s" if run["bandwidth_mbps"] else "unlimited bandwidth"
+    print(f"\n{'='*78}")
+    print(f"  Lightbox benchmark — latency {run['latency'] * 1000:.0f} ms, {bandwidth}, dwell {run['dwell_ms']} ms")
+    print(f"{'='*78}")
+    print(f"  {'mode':<8} {'trials':>7} {'median ms':>10} {'p95 ms':>8} {'hits':>6} {'median KB':>10}")
+    print(f"  {'-'*74}")
+    for mode, s in run["summary"].items():
+        kb = f"{s['median_bytes'] / 1024:.0f}" if s["median_bytes"] is not None else "-"
+        print(f"  {mode:<8} {s['trials']:>7} {s['median_ms']:>10.0f} {s['p95_ms']:>8.0f} "
+              f"{s['prefetch_hits']:>6} {kb:>10}")
+        if s["timeouts"]:
+            print(f"  [WARNING] {mode}: {s['timeouts']} trials timed out")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lightbox click-to-display time on the built site")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Built site directory (default: public/)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds of delay per request")
+    parser.add_argument("--bandwidth", type=float, default=10.0, help="Mbit/s per connection (0 = unlimited)")
+    parser.add_argument("--dwell", type=int, default=300, help="Hover time before the click in hover mode (ms)")
+    parser.add_argument("--pages", type=int, default=0, help="Only the first N painting pages (0 = all)")
+    parser.add_argument("--open", action="store_true", help="Open the benchmark page in the default browser")
+    parser.add_argument("--no-save", action="store_true", help="Do not append runs to the history")
+    args = parser.parse_args()
+
+    if not args.public.is_dir():
+        print(f"{args.public} not found — run `hugo --minify` first")
+        sys.exit(2)
+    pages = lightbox_pages(args.public)
+    if args.pages:
+        pages = pages[:args.pages]
+    if not pages:
+        print(f"No pages with a lightbox manifest in {args.public}")
+        sys.exit(2)
+
+    def on_results(results):
+        run = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_head(),
+            "latency": args.latency,
+            "bandwidth_mbps": args.bandwidth,
+            "dwell_ms": args.dwell,
+            "user_agent": results.get("userAgent"),
+            "device_pixel_ratio": results.get("devicePixelRatio"),
+            "summary": summarize(results["trials"]),
+            "trials": results["trials"],
+        }
+        print_summary(run)
+        if not args.no_save:
+            HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(run) + "\n")
+
+    handler = type("ConfiguredBenchHandler", (BenchHandler,), {
+        "root": args.public,
+        "latency": args.latency,
+        "bandwidth": args.bandwidth * 125000,
+        "page_config": {"pages": pages, "modes": MODES, "dwell": args.dwell,
+                        "resultsUrl": BENCH_PATH + "results"},
+        "on_results": staticmethod(on_results),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    server.daemon_threads = True
+    url = f"http://127.0.0.1:{server.server_port}{BENCH_PATH}"
+    print(f"Pages:      {len(pages)} with a lightbox")
+    print(f"Benchmark:  {url}")
+    print("Press Ctrl+C to stop")
+    if args.open:
+        webbrowser.open(url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Scaling benchmark: content validation and Hugo build time across corpus sizes.
+
+For each size, a synthetic corpus (synth_corpus.py) with that many paintings
+is generated, or reused from scripts/.cache/corpus/ when its parameters
+match. Then, each in its own process, it runs:
+  - validate     python <corpus>/scripts/validate_content.py --json
+  - hugo-cold    hugo --renderToMemory --ignoreCache, with an empty image cache
+  - hugo-warm    the same build again with the image cache from the cold run
+Each step reports wall time and peak RSS, which is the child's ru_maxrss
+from os.wait4, so it is unavailable on Windows.
+
+The table is followed by a scaling exponent per step, fitted to
+time ≈ c · n^k over the sizes. k ≈ 1 means linear. A k that grows between
+runs is a scaling regression, even when the smallest size is as fast as
+before. Runs are appended to scripts/.cache/bench-scale.jsonl (gitignored).
+
+Placeholder images default to a 1200px long edge, so the cold builds stay
+tolerable; image processing dominates them.
+
+Usage:
+    python scripts/bench_scale.py                           # 25, 100, 400 paintings
+    python scripts/bench_scale.py --sizes 100,1000,10000 --no-hugo
+    python scripts/bench_scale.py --sizes 50,200 --repeat 3 --json
+    python scripts/bench_scale.py --history
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from profile_build import git_head  # noqa: E402
+from synth_corpus import CORPUS_VERSION, make_corpus, read_params  # noqa: E402
+
+CORPUS_DIR = Path(__file__).resolve().parent / ".cache" / "corpus"
+HISTORY_PATH = Path(__file__).resolve().parent / ".cache" / "bench-scale.jsonl"
+STEPS = ["validate", "hugo-cold", "hugo-warm"]
+
+
+def measure(cmd, cwd):
+    """(seconds, peak RSS in bytes or None, exit code, stdout) of one child process."""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=out, stderr=err)
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in KB on Linux, bytes on macOS
+            rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            proc.wait()
+            rss = None
+        seconds = time.perf_counter() - start
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode("utf-8", errors="replace")
+        if proc.returncode not in (0, 1):  # validate_content exits 1 on content errors
+            print(err.read().decode("utf-8", errors="replace")[-2000:], file=sys.stderr)
+            raise SystemExit(f"{' '.join(map(str, cmd))} failed with exit code {proc.returncode}")
+    return seconds, rss, proc.returncode, stdout
+
+
+def ensure_corpus(paintings, seed, long_edge, regenerate):
+    """(corpus path, generation seconds or None when reused)."""
+    dest = CORPUS_DIR / f"p{paintings}-s{seed}-e{long_edge}"
+    params = read_params(dest)
+    if not regenerate and params and params.get("version") == CORPUS_VERSION:
+        return dest, None
+    return dest, make_corpus(dest, paintings, seed=seed, long_edge=long_edge)["seconds"]
+
+
+def run_size(paintings, args):
+    corpus, generated = ensure_corpus(paintings, args.seed, args.long_edge, args.regenerate)
+    params = read_params(corpus)
+    result = {"paintings": paintings, "exhibitions": params["exhibitions"], "workshops": params["workshops"],
+              "generate_seconds": generated, "steps": {}}
+
+    validate = [sys.executable, str(corpus / "scripts" / "validate_content.py"), "--json"]
+    runs = [measure(validate, corpus) for _ in range(args.repeat)]
+    report = json.loads(runs[-1][3])
+    result["files"] = report["files_checked"]
+    result["validation_errors"] = report["errors"]
+    result["steps"]["validate"] = summarize(runs)
+
+    if not args.no_hugo:
+        hugo = [args.hugo, "--minify", "--renderToMemory", "--quiet"]
+        shutil.rmtree(corpus / "resources", ignore_errors=True)
+        result["steps"]["hugo-cold"] = summarize([measure(hugo + ["--ignoreCache"], corpus)])
+        result["steps"]["hugo-warm"] = summarize([measure(hugo, corpus) for _ in range(args.repeat)])
+    return result
+
+
+def summarize(runs):
+    rss = [r[1] for r in runs if r[1] is not None]
+    return {"seconds": statistics.median(r[0] for r in runs), "peak_rss": max(rss) if rss else None}
+
+
+def scaling_exponent(points):
+    """Least-squares slope of log(seconds) over log(n); None with fewer than two sizes."""
+    points = [(n, s) for n, s in points if n > 0 and s > 0]
+    if len(points) < 2:
+        return None
+    xs, ys = [math.log(n) for n, _ in points], [math.log(s) for _, s in points]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var if var else None
+
+
+def exponents(results):
+    out = {}
+    for step in STEPS:
+        points = [(r["paintings"], r["steps"][step]["seconds"]) for r in results if step in r["steps"]]
+        out[step] = scaling_exponent(points)
+    return out
+
+
+def fmt_s(step):
+    return f"{step['seconds']:.2f}" if step else "-"
+
+
+def fmt_mb(value):
+    return f"{value / 1e6:.0f}" if value is not None else "-"
+
+
+def print_results(run):
+    print(f"\n{'='*78}")
+    print(f"  Scaling benchmark — {run['timestamp']} ({run['commit'] or 'no commit'})")
+    print(f"{'='*78}")
+    print(f"  {'paintings':>9} {'files':>6} {'errors':>6}   {'validate s':>10} {'MB':>5}   "
+          f"{'cold s':>8} {'warm s':>8} {'MB':>5}")
+    print(f"  {'-'*74}")
+    for r in run["results"]:
+        v = r["steps"]["validate"]
+        cold, warm = r["steps"].get("hugo-cold"), r["steps"].get("hugo-warm")
+        hugo_rss = max((s["peak_rss"] or 0 for s in (cold, warm) if s), default=None) or None
+        print(f"  {r['paintings']:>9} {r['files']:>6} {r['validation_errors']:>6}   {v['seconds']:>10.3f} "
+              f"{fmt_mb(v['peak_rss']):>5}   {fmt_s(cold):>8} {fmt_s(warm):>8} {fmt_mb(hugo_rss):>5}")
+    print()
+    for step, k in run["exponents"].items():
+        if k is not None:
+            print(f"  {step:<10} time ~ n^{k:.2f}")
+    print()
+
+
+def load_history():
+    if not HISTORY_PATH.exists():
+        return []
+    return [json.loads(line) for line in HISTORY_PATH.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def print_history(runs):
+    print(f"\n  {'timestamp':<26} {'commit':<9} {'sizes':<18} " + " ".join(f"{s:>10}" for s in STEPS))
+    for run in runs:
+        sizes = ",".join(str(r["paintings"]) for r in run["results"])
+        ks = " ".join(f"{run['exponents'][s]:>10.2f}" if run["exponents"].get(s) is not None else f"{'-':>10}"
+                      for s in STEPS)
+        print(f"  {run['timestamp']:<26} {run['commit'] or '-':<9} {sizes:<18} {ks}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validation and Hugo builds across synthetic corpus sizes")
+    parser.add_argument("--sizes", default="25,100,400", help="Comma-separated painting counts")
+    parser.add_argument("--repeat", type=int, default=1, help="Measured runs of validate and hugo-warm per size")
+    parser.add_argument("--seed", type=int, default=1, help="Corpus seed")
+    parser.add_argument("--long-edge", type=int, default=1200, help="Placeholder image long edge (px)")
+    parser.add_argument("--hugo", default="hugo", help="Hugo binary")
+    parser.add_argument("--no-hugo", action="store_true", help="Only benchmark validation")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate cached corpora")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the history")
+    parser.add_argument("--history", action="store_true", help="Print the recorded runs and exit")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    if args.history:
+        print_history(load_history())
+        return
+    if not args.no_hugo and not shutil.which(args.hugo):
+        print(f"{args.hugo} not found; install Hugo extended or pass --no-hugo")
+        sys.exit(2)
+
+    sizes = sorted({int(s) for s in args.sizes.split(",") if s.strip()})
+    results = []
+    for n in sizes:
+        if not args.json:
+            print(f"Running {n} paintings...", flush=True)
+        results.append(run_size(n, args))
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_head(),
+        "long_edge": args.long_edge,
+        "seed": args.seed,
+        "results": results,
+        "exponents": exponents(results),
+    }
+    if not args.no_save:
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run) + "\n")
+    if args.json:
+        print(json.dumps(run, indent=2))
+    else:
+        print_results(run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Offline scraper benchmark against the local artshop stand-in.
+
+Runs scripts/scrape.py end to end against scripts/artshop_stub.py and reports,
+per mode: wall time, paintings/s, images, requests, bytes transferred and
+peak Python heap (tracemalloc).
+
+Modes:
+    sequential-cold   empty output directory; every image is downloaded, one at a time
+    sequential-warm   images already on disk; only pages are fetched
+    concurrent-cold   as sequential-cold, a painting's variants downloaded in parallel
+    concurrent-warm   as sequential-warm with parallel downloads (should match it)
+
+The concurrent modes only pull ahead with per-request latency (--latency).
+
+Usage:
+    python scripts/bench_scrape.py                         # all modes, 3 repeats
+    python scripts/bench_scrape.py --latency 0.02 --repeat 5
+    python scripts/bench_scrape.py --mode sequential-cold --mode concurrent-cold --latency 0.05
+    python scripts/bench_scrape.py --mode sequential-cold --json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from artshop_stub import FIXTURES_DIR, patched_scraper, stub_artshop, synthesize_fixtures
+
+
+CONCURRENT_WORKERS = 4
+
+
+def _run_sequential(scrape):
+    scrape.IMAGE_WORKERS = 1
+    scrape.main()
+
+
+def _run_concurrent(scrape):
+    scrape.IMAGE_WORKERS = CONCURRENT_WORKERS
+    scrape.main()
+
+
+# name -> (runner(scrape_module), warm)
+MODES = {
+    "sequential-cold": (_run_sequential, False),
+    "sequential-warm": (_run_sequential, True),
+    "concurrent-cold": (_run_concurrent, False),
+    "concurrent-warm": (_run_concurrent, True),
+}
+
+
+def run_once(scrape, stats, runner, workdir, warm):
+    """Run one scrape; returns a metrics dict."""
+    out_dir = Path(workdir) / "images"
+    if not warm and out_dir.exists():
+        shutil.rmtree(out_dir)
+
+    stats.reset()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner(scrape)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    manifest = json.loads(scrape.MANIFEST_PATH.read_text(encoding="utf-8"))
+    snap = stats.snapshot()
+    return {
+        "seconds": elapsed,
+        "paintings": len(manifest),
+        "images": sum(bool(p["local_image"]) + len(p.get("gallery", [])) for p in manifest),
+        "requests": snap["requests"],
+        "bytes": snap["bytes_sent"],
+        "peak_heap": peak,
+    }
+
+
+def bench_mode(name, repeat, latency, root):
+    runner, warm = MODES[name]
+    with tempfile.TemporaryDirectory() as workdir, \
+            stub_artshop(root, latency=latency) as (base_url, stats), \
+            patched_scraper(base_url, Path(workdir) / "images", Path(workdir) / "manifest.json") as scrape:
+        if warm:
+            # Prime the output directory; not measured
+            run_once(scrape, stats, runner, workdir, warm=False)
+        runs = [run_once(scrape, stats, runner, workdir, warm) for _ in range(repeat)]
+
+    median_s = statistics.median(r["seconds"] for r in runs)
+    last = runs[-1]
+    return {
+        "mode": name,
+        "runs": repeat,
+        "latency": latency,
+        "median_seconds": median_s,
+        "best_seconds": min(r["seconds"] for r in runs),
+        "paintings": last["paintings"],
+        "images": last["images"],
+        "paintings_per_second": last["paintings"] / median_s if median_s else 0.0,
+        "requests": last["requests"],
+        "bytes_transferred": last["bytes"],
+        "mb_per_second": last["bytes"] / median_s / 1e6 if median_s else 0.0,
+        "peak_heap_bytes": max(r["peak_heap"] for r in runs),
+    }
+
+
+def print_results(results):
+    print(f"\n{'='*78}")
+    print("  Scraper benchmark — local artshop stand-in")
+    print(f"{'='*78}")
+    print(f"  {'mode':<18} {'median s':>9} {'works/s':>8} {'images':>6} {'reqs':>6} {'MB':>8} {'MB/s':>7} {'peak MB':>8}")
+    print(f"  {'-'*74}")
+    for r in results:
+        print(
+            f"  {r['mode']:<18} {r['median_seconds']:>9.3f} {r['paintings_per_second']:>8.1f} "
+            f"{r['images']:>6} {r['requests']:>6} {r['bytes_transferred'] / 1e6:>8.2f} {r['mb_per_second']:>7.1f} "
+            f"{r['peak_heap_bytes'] / 1e6:>8.2f}"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrape.py against the local artshop stand-in")
+    parser.add_argument("--mode", choices=sorted(MODES), action="append", help="Mode to run (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Measured runs per mode")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of server delay per request")
+    parser.add_argument("--root", type=Path, default=FIXTURES_DIR, help="Fixture directory")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    if not args.root.exists():
+        count = synthesize_fixtures(args.root)
+        if not args.json:
+            print(f"Synthesized {count} detail pages in {args.root}")
+
+    results = [bench_mode(name, args.repeat, args.latency, args.root) for name in (args.mode or MODES)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Build the client-side search index for paintings and exhibitions.
+
+Reads the NL and EN front matter of every painting and exhibition (the
+collections in validate_content.COLLECTIONS) and writes small, per-language
+index shards to static/search/<lang>/:
+
+    docs.json   document list, stopwords and shard versions (loaded first)
+    <c>.json    postings for every key starting with character <c>:
+                  "p": word prefix (2+ chars) -> [[doc id, weight], ...]
+                  "g": trigram -> [doc id, ...]  (infix / typo matching,
+                        e.g. "verdraag" finds "Onverdraagzaamheid")
+
+main.js fetches docs.json when the search box is first used and then only
+the shards for the characters actually typed, so search runs in the browser
+with no server. Parsed front matter is cached by mtime and only shard files
+whose content changed are rewritten.
+
+The output is gitignored: CI runs this script before `hugo`, so CMS edits
+are indexed without anyone running it by hand.
+
+Usage:
+    python scripts/build_search_index.py           # update static/search/
+    python scripts/build_search_index.py --check   # exit 1 if the index is stale
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from validate_content import COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+OUTPUT = ROOT / "static" / "search"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "search-index.json"
+
+LANGS = ("nl", "en")
+# Section URL per collection, relative to the site root (Hugo urlizes file stems)
+SECTIONS = {
+    "paintings": {"nl": "schilderijen/", "en": "en/paintings/"},
+    "exhibitions": {"nl": "exposities/", "en": "en/exhibitions/"},
+}
+KINDS = {"paintings": "painting", "exhibitions": "exhibition"}
+
+# Field weights: a title hit ranks above a medium or location hit
+FIELDS = {
+    "paintings": {"title": 3, "medium": 1, "category": 1, "year": 1},
+    "exhibitions": {"title": 3, "location": 2, "start_date": 1, "description": 1},
+}
+MIN_PREFIX = 2
+MAX_PREFIX = 16
+STOPWORDS = {
+    "nl": ["de", "het", "een", "en", "van", "op", "in", "met", "te", "voor", "aan", "is"],
+    "en": ["the", "a", "an", "and", "of", "on", "in", "with", "to", "for", "at", "is"],
+}
+
+
+def normalize(text):
+    """Lowercase and strip accents: "Malmö" -> "malmo"."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text):
+    return [t for t in re.split(r"[^a-z0-9]+", normalize(text)) if t]
+
+
+def trigrams(token):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def shard_key(term):
+    c = term[0]
+    return c if c.isascii() and c.isalnum() else "_"
+
+
+def subtitle(collection, fm):
+    if collection == "paintings":
+        parts = [fm.get("year"), fm.get("medium")]
+    else:
+        parts = [fm.get("location"), fm.get("start_date")]
+    return " · ".join(str(p) for p in parts if p)
+
+
+def extract_doc(collection, lang, path):
+    """Search document for one content file, or None for drafts/unparseable files."""
+    fm = parse_front_matter(path)
+    if not fm or fm.get("draft") is True or not fm.get("title"):
+        return None
+    return {
+        "t": fm["title"],
+        "u": SECTIONS[collection][lang] + path.stem.lower() + "/",
+        "k": KINDS[collection],
+        "s": subtitle(collection, fm),
+        "f": {name: str(fm[name]) for name in FIELDS[collection] if fm.get(name)},
+        "c": collection,
+    }
+
+
+def load_docs(cache_path=CACHE_PATH):
+    """Documents per language, re-parsing only files whose mtime/size changed."""
+    cache = json.loads(cache_path.read_text(encoding="utf-8")) if cache_path.exists() else {}
+    docs, fresh, parsed = {lang: [] for lang in LANGS}, {}, 0
+    for collection in SECTIONS:
+        for lang in LANGS:
+            for path in sorted(COLLECTIONS[collection][lang]["folder"].glob("*.md")):
+                if path.name == "_index.md":
+                    continue
+                rel = path.relative_to(ROOT).as_posix()
+                st = path.stat()
+                entry = cache.get(rel)
+                if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+                    entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "doc": extract_doc(collection, lang, path)}
+                    parsed += 1
+                fresh[rel] = entry
+                if entry["doc"]:
+                    docs[lang].append(entry["doc"])
+
+    if parsed or set(fresh) != set(cache):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(fresh, indent=1, sort_keys=True), encoding="utf-8")
+    for lang in LANGS:
+        docs[lang].sort(key=lambda d: d["u"])
+    return docs, parsed
+
+
+def build_shards(docs, lang):
+    """Shard postings for one language: {shard char: {"p": {...}, "g": {...}}}."""
+    stop = set(STOPWORDS[lang])
+    prefixes = defaultdict(dict)  # prefix -> {doc id: weight}
+    grams = defaultdict(set)      # trigram -> {doc id}
+    for doc_id, doc in enumerate(docs):
+        weights = FIELDS[doc["c"]]
+        for name, value in doc["f"].items():
+            for token in tokenize(value):
+                if token in stop:
+                    continue
+                for n in range(MIN_PREFIX, min(len(token), MAX_PREFIX) + 1):
+                    postings = prefixes[token[:n]]
+                    postings[doc_id] = max(postings.get(doc_id, 0), weights[name])
+                for gram in trigrams(token):
+                    grams[gram].add(doc_id)
+
+    shards = defaultdict(lambda: {"p": {}, "g": {}})
+    for prefix, postings in prefixes.items():
+        shards[shard_key(prefix)]["p"][prefix] = [[i, w] for i, w in sorted(postings.items())]
+    for gram, ids in grams.items():
+        shards[shard_key(gram)]["g"][gram] = sorted(ids)
+    return dict(shards)
+
+
+def dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def render(docs):
+    """All index files: {Path: text}."""
+    files = {}
+    for lang in LANGS:
+        shards = {key: dump(shard) for key, shard in build_shards(docs[lang], lang).items()}
+        versions = {key: hashlib.sha256(text.encode("utf-8")).hexdigest()[:8] for key, text in shards.items()}
+        manifest = {
+            "docs": [{k: d[k] for k in ("t", "u", "k", "s")} for d in docs[lang]],
+            "shards": versions,
+            "stop": STOPWORDS[lang],
+            "minPrefix": MIN_PREFIX,
+            "maxPrefix": MAX_PREFIX,
+        }
+        files[OUTPUT / lang / "docs.json"] = dump(manifest)
+        for key, text in shards.items():
+            files[OUTPUT / lang / f"{key}.json"] = text
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-language search index shards")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if static/search/ is out of date")
+    args = parser.parse_args()
+
+    docs, parsed = load_docs()
+    files = render(docs)
+    existing = {p for p in OUTPUT.glob("*/*.json")}
+    changed = [p for p, text in files.items() if not p.exists() or p.read_text(encoding="utf-8") != text]
+    stale = sorted(existing - set(files))
+
+    if args.check:
+        if changed or stale:
+            for p in changed + stale:
+                print(f"  out of date: {p.relative_to(ROOT).as_posix()}")
+            print("Search index is out of date — run: python scripts/build_search_index.py")
+            sys.exit(1)
+        print(f"Search index is up to date ({sum(len(d) for d in docs.values())} documents)")
+        return
+
+    for p in changed:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(files[p], encoding="utf-8")
+    for p in stale:
+        p.unlink()
+
+    total = sum(len(d) for d in docs.values())
+    print(f"Documents: {total} ({parsed} content files re-parsed)")
+    for lang in LANGS:
+        lang_files = {p: t for p, t in files.items() if p.parent.name == lang}
+        sizes = [len(t.encode("utf-8")) for p, t in lang_files.items() if p.name != "docs.json"]
+        print(f"  {lang}: {len(docs[lang])} docs, docs.json {len(lang_files[OUTPUT / lang / 'docs.json']) / 1024:.1f} KB, "
+              f"{len(sizes)} shards ({max(sizes, default=0) / 1024:.1f} KB largest)")
+    print(f"Written:   {len(changed)} files changed, {len(stale)} removed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Bulk status / featured update for paintings, NL and EN together.
+
+Selects paintings by translationKey and/or a query on their front matter,
+then sets `status` and/or `featured` in content/schilderijen/<file>.md and
+its content/en/paintings twin in one pass. Only those front matter lines
+are rewritten; every other line and the body stay byte-for-byte the same.
+
+Changes are applied as one transaction. Every new file is written to a
+temporary file next to its target first, and the temporaries are only
+swapped in (os.replace) once all of them have been written. If a swap
+fails, the files already replaced are restored. A painting without an EN
+twin (or vice versa) aborts the whole run before anything is written, so
+the two trees cannot drift apart.
+
+Usage:
+    python scripts/bulk_update.py toro de-groep --status-to sold
+    python scripts/bulk_update.py --category Surrealistisch --year 2023 --featured
+    python scripts/bulk_update.py --status sold --no-featured --dry-run
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from validate_content import COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+PAINTINGS = COLLECTIONS["paintings"]
+LANGS = ("nl", "en")
+STATUS_OPTIONS = PAINTINGS["nl"]["status_options"]
+FRONT_MATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?\r?\n)---", re.DOTALL)
+
+
+def load_paintings():
+    """{translationKey: {lang: (path, front matter)}} for both painting trees."""
+    paintings = {}
+    for lang in LANGS:
+        for path in sorted(PAINTINGS[lang]["folder"].glob("*.md")):
+            if path.name == "_index.md":
+                continue
+            fm = parse_front_matter(path)
+            if not fm or not fm.get("translationKey"):
+                continue
+            paintings.setdefault(fm["translationKey"], {})[lang] = (path, fm)
+    return paintings
+
+
+def matches(entry, category=None, year=None, status=None):
+    """Whether a painting (both languages) matches the query; categories match either language's label."""
+    nl_fm = (entry.get("nl") or entry["en"])[1]
+    if category and category.lower() not in {str(fm.get("category", "")).lower() for _, fm in entry.values()}:
+        return False
+    if year and str(nl_fm.get("year", "")) != str(year):
+        return False
+    if status and nl_fm.get("status") != status:
+        return False
+    return True
+
+
+def set_field(text, name, value):
+    """`text` with front matter field `name` set to the YAML scalar `value`.
+
+    Only that line changes; a missing field is appended to the front matter.
+    Returns the text unchanged when the value is already set.
+    """
+    match = FRONT_MATTER_RE.match(text)
+    if not match:
+        raise ValueError("no front matter")
+    block = match.group(1)
+    newline = "\r\n" if block.endswith("\r\n") else "\n"
+    line_re = re.compile(rf"^{re.escape(name)}[ \t]*:[^\r\n]*", re.MULTILINE)
+    if line_re.search(block):
+        new_block = line_re.sub(f"{name}: {value}", block, count=1)
+    else:
+        new_block = block + f"{name}: {value}{newline}"
+    return text[:match.start(1)] + new_block + text[match.end(1):]
+
+
+def plan(paintings, keys, status_to=None, featured=None):
+    """[(path, old text, new text)] for every file whose content would change."""
+    changes = []
+    for key in keys:
+        for lang in LANGS:
+            path, _ = paintings[key][lang]
+            with open(path, encoding="utf-8", newline="") as f:
+                old = f.read()
+            new = old
+            try:
+                if status_to is not None:
+                    new = set_field(new, "status", f'"{status_to}"')
+                if featured is not None:
+                    new = set_field(new, "featured", "true" if featured else "false")
+            except ValueError as e:
+                raise ValueError(f"{path.relative_to(ROOT).as_posix()}: {e}") from None
+            if new != old:
+                changes.append((path, old, new))
+    return changes
+
+
+def apply(changes):
+    """Write all changes or none of them."""
+    staged = []
+    try:
+        for path, _, new in changes:
+            tmp = path.with_name(f".{path.name}.bulk-tmp")
+            # newline="" keeps the file's own line endings
+            with open(tmp, "w", encoding="utf-8", newline="") as f:
+                f.write(new)
+            staged.append((tmp, path))
+    except OSError:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+    done = []
+    try:
+        for tmp, path in staged:
+            os.replace(tmp, path)
+            done.append(path)
+    except OSError:
+        originals = {path: old for path, old, _ in changes}
+        for path in done:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(originals[path])
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Set status/featured on paintings in both languages at once")
+    parser.add_argument("keys", nargs="*", help="translationKeys to update")
+    query = parser.add_argument_group("query (combined with AND; ANDed with keys if both given)")
+    query.add_argument("--category", help="Category label in either language, e.g. Surrealistisch or Surrealist")
+    query.add_argument("--year", help="Year as in front matter")
+    query.add_argument("--status", choices=STATUS_OPTIONS, help="Current status")
+    update = parser.add_argument_group("update")
+    update.add_argument("--status-to", choices=STATUS_OPTIONS, help="New status")
+    update.add_argument("--featured", dest="featured", action="store_true", default=None, help="Mark as featured")
+    update.add_argument("--no-featured", dest="featured", action="store_false", help="Unmark as featured")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
+    args = parser.parse_args()
+
+    if args.status_to is None and args.featured is None:
+        parser.error("nothing to do: pass --status-to and/or --featured/--no-featured")
+    if not args.keys and not (args.category or args.year or args.status):
+        parser.error("select paintings by translationKey or with --category/--year/--status")
+
+    paintings = load_paintings()
+    unknown = [k for k in args.keys if k not in paintings]
+    if unknown:
+        print(f"Unknown translationKey(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    keys = args.keys or sorted(paintings)
+    selected = [k for k in keys if matches(paintings[k], args.category, args.year, args.status)]
+    if not selected:
+        print("No paintings match.")
+        sys.exit(1)
+
+    unpaired = [k for k in selected if set(paintings[k]) != set(LANGS)]
+    if unpaired:
+        for k in unpaired:
+            print(f"  [ERROR] {k}: only in {', '.join(sorted(paintings[k]))} — fix parity first (validate_content.py)")
+        print("Nothing written.")
+        sys.exit(1)
+
+    try:
+        changes = plan(paintings, selected, args.status_to, args.featured)
+    except ValueError as e:
+        print(f"  [ERROR] {e}")
+        sys.exit(1)
+
+    if not args.dry_run and changes:
+        try:
+            apply(changes)
+        except OSError as e:
+            print(f"  [ERROR] {e}")
+            print("Nothing written.")
+            sys.exit(1)
+    for path, _, _ in changes:
+        print(f"  {'would update' if args.dry_run else 'updated'}: {path.relative_to(ROOT).as_posix()}")
+    unchanged = len(selected) * len(LANGS) - len(changes)
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"{verb} {len(changes)} files for {len(selected)} paintings ({unchanged} already up to date)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Precompute the order of the paintings overview (schilderijen/list.html).
+
+Writes data/catalogue.json with, per language, each category mapped to the
+translationKeys of its paintings in display order:
+
+    {"en": {"Abstract": ["toro", ...], "Surrealistisch": [...]}, "nl": {...}}
+
+Categories are keyed by their NL name, the way the template and its i18n keys
+name them; the EN alias ("Surrealist") is folded in here, by position in
+validate_content.COLLECTIONS. The order is: newest year first, then weight
+(set weights first, lowest first, as Hugo orders them), then title, then
+translationKey, so ties always come out the same. Drafts and paintings
+without a known category are left out, as on the site.
+
+The list template only looks the pages up by translationKey. When the data
+does not cover the section's pages (a painting added without a re-run), it
+falls back to sorting in the template. CI runs this script before `hugo`.
+Front matter is cached by mtime in scripts/.cache/catalogue-order.json, so
+a re-run only parses changed files.
+
+Usage:
+    python scripts/catalogue_order.py           # update data/catalogue.json
+    python scripts/catalogue_order.py --check   # exit 1 if it is stale
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from validate_content import COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+DATA_PATH = ROOT / "data" / "catalogue.json"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "catalogue-order.json"
+# Template category names (NL), in COLLECTIONS order
+CATEGORIES = COLLECTIONS["paintings"]["nl"]["category_options"]
+
+
+def to_int(value):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def extract(lang, path):
+    """Sort fields of one painting, or None for drafts and unparseable files."""
+    fm = parse_front_matter(path)
+    if not fm or fm.get("draft") is True or not fm.get("translationKey"):
+        return None
+    options = COLLECTIONS["paintings"][lang]["category_options"]
+    category = fm.get("category")
+    return {
+        "key": str(fm["translationKey"]),
+        "category": CATEGORIES[options.index(category)] if category in options else None,
+        "year": to_int(fm.get("year")),
+        "weight": to_int(fm.get("weight")) or 0,
+        "title": str(fm.get("title", "")),
+    }
+
+
+def load_paintings(cache_path=CACHE_PATH):
+    """({lang: [painting]}, files parsed), re-parsing only files whose mtime/size changed."""
+    cache = json.loads(cache_path.read_text(encoding="utf-8")) if cache_path.exists() else {}
+    paintings, fresh, parsed = {}, {}, 0
+    for lang, config in COLLECTIONS["paintings"].items():
+        paintings[lang] = []
+        for path in sorted(config["folder"].glob("*.md")):
+            if path.name == "_index.md":
+                continue
+            rel = path.relative_to(ROOT).as_posix()
+            st = path.stat()
+            entry = cache.get(rel)
+            if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+                entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "painting": extract(lang, path)}
+                parsed += 1
+            fresh[rel] = entry
+            if entry["painting"]:
+                paintings[lang].append(entry["painting"])
+
+    if parsed or set(fresh) != set(cache):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(fresh, indent=1, sort_keys=True), encoding="utf-8")
+    return paintings, parsed
+
+
+def sort_key(p):
+    weight = p["weight"]
+    return (p["year"] is None, -(p["year"] or 0), weight <= 0, weight, p["title"].casefold(), p["key"])
+
+
+def order(paintings):
+    """{lang: {category: [translationKey]}}"""
+    result = {}
+    for lang, items in paintings.items():
+        result[lang] = {
+            category: [p["key"] for p in sorted((p for p in items if p["category"] == category), key=sort_key)]
+            for category in CATEGORIES
+        }
+    return result
+
+
+def render(data):
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the paintings overview order to data/catalogue.json")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if data/catalogue.json is out of date")
+    args = parser.parse_args()
+
+    paintings, parsed = load_paintings()
+    data = order(paintings)
+    text = render(data)
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+    rel = DATA_PATH.relative_to(ROOT).as_posix()
+
+    if args.check:
+        if text != current:
+            print(f"{rel} is out of date — run: python scripts/catalogue_order.py")
+            sys.exit(1)
+        print(f"{rel} is up to date")
+        return
+
+    for lang, items in sorted(paintings.items()):
+        for p in items:
+            if p["category"] is None:
+                print(f"  [WARNING] {lang}: '{p['key']}' has no known category and is not listed")
+        counts = ", ".join(f"{category} {len(keys)}" for category, keys in data[lang].items())
+        print(f"  {lang}: {counts}")
+    if text != current:
+        DATA_PATH.write_text(text, encoding="utf-8")
+    print(f"Parsed:     {parsed} content files")
+    print(f"Written:    {rel}" if text != current else f"Unchanged:  {rel}")
+
+
+if __name__ == "__main__":
+    main()
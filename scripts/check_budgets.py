@@ -0,0 +1,436 @@
+"""
+Performance budget check for the built site (Hugo public/ output).
+
+Walks every HTML page in public/, adds up the bytes a first visit transfers
+(HTML, CSS, JS, fonts, eager images) and compares each page against the budget
+for its page type. Lazy images only load as the visitor scrolls, so they are
+counted separately, against their own `lazy_kb` budget. Also enforces the RUNBOOK performance principles:
+
+- no third-party hosts for scripts, stylesheets, fonts or images (no CDN)
+- images below the fold carry loading="lazy"
+- no single WebP/JPEG derivative above the per-type size limit
+
+Image weight is what a reference screen downloads (REFERENCE_VIEWPORT CSS px
+wide at REFERENCE_DPR): for <picture>/srcset, the candidate of the first
+<source> (WebP when present) that the `sizes` attribute selects there, i.e.
+the narrowest at least slot width x DPR wide; the widest candidate when there
+is no `sizes`. Otherwise the <img> itself.
+
+Usage:
+    hugo --minify
+    python scripts/check_budgets.py                       # human-readable report
+    python scripts/check_budgets.py --json                # JSON output for tooling
+    python scripts/check_budgets.py --budgets my.json     # override budgets (same shape as BUDGETS)
+    python scripts/check_budgets.py --save-baseline       # record totals for later --baseline runs
+    python scripts/check_budgets.py --baseline            # also fail on >5% growth vs. the baseline
+"""
+
+import argparse
+import json
+import re
+import sys
+import urllib.parse
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PUBLIC = ROOT / "public"
+BASELINE_PATH = Path(__file__).resolve().parent / ".cache" / "budget-baseline.json"
+
+# Budgets per page type, in KB. `total_kb` is the initial load, `lazy_kb` all
+# lazy images on the page. `eager_images` is how many images at the top of the
+# page may load eagerly (header logo + hero); everything after must be lazy.
+BUDGETS = {
+    "home": {"total_kb": 1500, "lazy_kb": 1500, "image_kb": 350, "eager_images": 2},
+    "painting": {"total_kb": 1200, "lazy_kb": 500, "image_kb": 600, "eager_images": 2},
+    "painting-list": {"total_kb": 1000, "lazy_kb": 6000, "image_kb": 200, "eager_images": 1},
+    "exhibition": {"total_kb": 2500, "lazy_kb": 2500, "image_kb": 350, "eager_images": 2},
+    "other": {"total_kb": 1000, "lazy_kb": 1500, "image_kb": 350, "eager_images": 2},
+}
+
+# Not part of the public site: the CMS shell loads Sveltia from unpkg by design
+# (pinned with SRI, see static/admin/index.html).
+EXCLUDE = ("admin/",)
+
+# (page type, regex on the path relative to public/, posix)
+PAGE_TYPES = [
+    ("home", r"^(en/)?index\.html$"),
+    ("painting-list", r"^(en/paintings|schilderijen)/(page/\d+/)?index\.html$"),
+    ("painting", r"^(en/paintings|schilderijen)/[^/]+/index\.html$"),
+    ("exhibition", r"^(en/exhibitions|exposities)/[^/]+/index\.html$"),
+]
+
+RASTER_DERIVATIVE_EXTS = {".jpg", ".jpeg", ".webp"}
+
+# Screen that srcset/sizes are resolved for: a common laptop, high-density
+REFERENCE_VIEWPORT = 1280  # CSS px
+REFERENCE_DPR = 2
+
+
+@dataclass
+class Issue:
+    severity: str  # ERROR, WARNING
+    page: str
+    check: str
+    message: str
+
+
+@dataclass
+class PageReport:
+    page: str
+    page_type: str
+    weights: dict = field(default_factory=dict)  # kind -> bytes; "lazy-images" is not initial
+
+    @property
+    def total(self):
+        """Initial load: everything but lazy images."""
+        return sum(v for k, v in self.weights.items() if k != "lazy-images")
+
+    @property
+    def lazy(self):
+        return self.weights.get("lazy-images", 0)
+
+
+@dataclass
+class AuditResult:
+    pages: list = field(default_factory=list)
+    issues: list = field(default_factory=list)
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.severity == "ERROR"]
+
+    @property
+    def warnings(self):
+        return [i for i in self.issues if i.severity == "WARNING"]
+
+
+class PageAssetParser(HTMLParser):
+    """Collect the assets a page pulls in, in document order."""
+
+    def __init__(self):
+        super().__init__()
+        self.stylesheets = []
+        self.scripts = []
+        self.fonts = []
+        self.images = []  # dicts: url, lazy
+        self.external = []
+        self._picture = None  # {"source": url or None}
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == "link":
+            rel = (a.get("rel") or "").lower().split()
+            href = a.get("href")
+            if not href:
+                return
+            if "stylesheet" in rel or ("preload" in rel and a.get("as") == "style"):
+                self.stylesheets.append(href)
+                self.external.append(href)
+            elif "preload" in rel and a.get("as") == "font":
+                self.fonts.append(href)
+                self.external.append(href)
+        elif tag == "script" and a.get("src"):
+            self.scripts.append(a["src"])
+            self.external.append(a["src"])
+        elif tag == "picture":
+            self._picture = {"source": None}
+        elif tag == "source" and self._picture is not None:
+            if self._picture["source"] is None and a.get("srcset"):
+                self._picture["source"] = select_candidate(a["srcset"], a.get("sizes"))
+        elif tag == "img":
+            url = select_candidate(a["srcset"], a.get("sizes")) if a.get("srcset") else a.get("src")
+            if self._picture is not None and self._picture["source"]:
+                url = self._picture["source"]
+            if url:
+                self.images.append({"url": url, "lazy": a.get("loading") == "lazy"})
+                self.external.append(url)
+
+    def handle_endtag(self, tag):
+        if tag == "picture":
+            self._picture = None
+
+
+def parse_srcset(srcset):
+    """[(url, width or density)] from a srcset attribute, 0.0 when undescribed."""
+    candidates = []
+    for candidate in srcset.split(","):
+        parts = candidate.strip().split()
+        if not parts:
+            continue
+        width = 0.0
+        if len(parts) > 1:
+            m = re.match(r"^([\d.]+)[wx]$", parts[1])
+            if m:
+                width = float(m.group(1))
+        candidates.append((parts[0], width))
+    return candidates
+
+
+def largest_candidate(srcset):
+    """Return the URL of the widest candidate in a srcset attribute."""
+    candidates = parse_srcset(srcset)
+    return max(candidates, key=lambda c: c[1])[0] if candidates else None
+
+
+def css_px(length, viewport=REFERENCE_VIEWPORT):
+    """A sizes length (px, vw, em/rem) in CSS px, or None if unsupported."""
+    m = re.match(r"^([\d.]+)(px|vw|r?em)$", length.strip())
+    if not m:
+        return None
+    value, unit = float(m.group(1)), m.group(2)
+    return value * viewport / 100 if unit == "vw" else value * 16 if unit.endswith("em") else value
+
+
+def slot_width(sizes, viewport=REFERENCE_VIEWPORT):
+    """The slot width `sizes` picks at `viewport` (min/max-width conditions only)."""
+    for entry in sizes.split(","):
+        entry = entry.strip()
+        m = re.match(r"^\((min|max)-width:\s*([\d.]+(?:px|r?em))\)\s+(.+)$", entry)
+        if m:
+            bound = css_px(m.group(2), viewport)
+            if (m.group(1) == "max" and viewport <= bound) or (m.group(1) == "min" and viewport >= bound):
+                return css_px(m.group(3), viewport)
+        elif not entry.startswith("("):
+            return css_px(entry, viewport)
+    return None
+
+
+def select_candidate(srcset, sizes=None):
+    """URL the browser would pick on the reference screen; the widest without `sizes`."""
+    candidates = sorted(c for c in parse_srcset(srcset) if c[1])
+    slot = slot_width(sizes) if sizes else None
+    if not candidates or slot is None:
+        return largest_candidate(srcset)
+    needed = slot * REFERENCE_DPR
+    return next((url for url, width in candidates if width >= needed), candidates[-1][0])
+
+
+def classify(rel_page):
+    for page_type, pattern in PAGE_TYPES:
+        if re.match(pattern, rel_page):
+            return page_type
+    return "other"
+
+
+def site_host():
+    """Host of baseURL in hugo.toml, so absolute self-links count as local."""
+    toml = (ROOT / "hugo.toml").read_text(encoding="utf-8")
+    m = re.search(r'^baseURL\s*=\s*"([^"]+)"', toml, re.MULTILINE)
+    return urllib.parse.urlsplit(m.group(1)).netloc if m else ""
+
+
+class Resolver:
+    """Map URLs found in pages to files in public/, with size caching."""
+
+    def __init__(self, public, host):
+        self.public = public
+        self.host = host
+        self._sizes = {}
+        self._css_fonts = {}
+
+    def is_external(self, url):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme in ("data", "mailto", "tel"):
+            return False
+        return bool(parts.netloc) and parts.netloc != self.host
+
+    def to_file(self, url, page_file):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("", "http", "https") or (parts.netloc and parts.netloc != self.host):
+            return None
+        path = urllib.parse.unquote(parts.path)
+        if path.startswith("/"):
+            target = self.public / path.lstrip("/")
+        else:
+            target = page_file.parent / path
+        if target.is_dir():
+            target = target / "index.html"
+        return target.resolve()
+
+    def size(self, target):
+        if target is None:
+            return 0
+        if target not in self._sizes:
+            self._sizes[target] = target.stat().st_size if target.is_file() else 0
+        return self._sizes[target]
+
+    def fonts_in_css(self, css_file):
+        """Font files referenced by url(...) in a stylesheet."""
+        if css_file not in self._css_fonts:
+            fonts = []
+            if css_file.is_file():
+                text = css_file.read_text(encoding="utf-8", errors="replace")
+                for url in re.findall(r"url\(\s*['\"]?([^'\")]+\.woff2?)['\"]?\s*\)", text):
+                    fonts.append((css_file.parent / url).resolve())
+            self._css_fonts[css_file] = fonts
+        return self._css_fonts[css_file]
+
+
+def audit_page(page_file, public, resolver, budgets, result):
+    rel = page_file.relative_to(public).as_posix()
+    page_type = classify(rel)
+    budget = budgets.get(page_type, budgets["other"])
+    parser = PageAssetParser()
+    parser.feed(page_file.read_text(encoding="utf-8", errors="replace"))
+
+    report = PageReport(rel, page_type, {"html": page_file.stat().st_size})
+    seen = set()
+
+    def add(kind, target):
+        if target is None or target in seen:
+            return
+        seen.add(target)
+        report.weights[kind] = report.weights.get(kind, 0) + resolver.size(target)
+
+    for url in parser.external:
+        if resolver.is_external(url):
+            result.issues.append(Issue("ERROR", rel, "third-party", f"Asset served from another host: {url}"))
+
+    for href in parser.stylesheets:
+        css = resolver.to_file(href, page_file)
+        add("css", css)
+        if css is not None:
+            for font in resolver.fonts_in_css(css):
+                add("fonts", font)
+    for href in parser.fonts:
+        add("fonts", resolver.to_file(href, page_file))
+    for src in parser.scripts:
+        add("js", resolver.to_file(src, page_file))
+
+    for index, img in enumerate(parser.images):
+        target = resolver.to_file(img["url"], page_file)
+        add("lazy-images" if img["lazy"] else "images", target)
+        size = resolver.size(target)
+        if target is not None and target.suffix.lower() in RASTER_DERIVATIVE_EXTS and size > budget["image_kb"] * 1024:
+            result.issues.append(Issue(
+                "WARNING", rel, "oversized-image",
+                f"{img['url']} is {size / 1024:.0f} KB (limit {budget['image_kb']} KB for {page_type})"
+            ))
+        if index >= budget["eager_images"] and not img["lazy"]:
+            result.issues.append(Issue(
+                "WARNING", rel, "lazy-loading",
+                f"Image #{index + 1} below the fold lacks loading=\"lazy\": {img['url']}"
+            ))
+
+    if report.total > budget["total_kb"] * 1024:
+        result.issues.append(Issue(
+            "ERROR", rel, "budget",
+            f"Page weight {report.total / 1024:.0f} KB exceeds {page_type} budget of {budget['total_kb']} KB"
+        ))
+    if report.lazy > budget["lazy_kb"] * 1024:
+        result.issues.append(Issue(
+            "ERROR", rel, "budget",
+            f"Lazy images {report.lazy / 1024:.0f} KB exceed {page_type} budget of {budget['lazy_kb']} KB"
+        ))
+    result.pages.append(report)
+
+
+def compare_baseline(result, baseline, tolerance):
+    for report in result.pages:
+        before = baseline.get(report.page)
+        now = report.total + report.lazy
+        if before and now > before * (1 + tolerance):
+            result.issues.append(Issue(
+                "ERROR", report.page, "regression",
+                f"Page weight grew {now / 1024:.0f} KB vs. baseline {before / 1024:.0f} KB "
+                f"(+{(now / before - 1) * 100:.1f}%)"
+            ))
+
+
+def run_audit(public=PUBLIC, budgets=None):
+    budgets = budgets or BUDGETS
+    result = AuditResult()
+    resolver = Resolver(public, site_host())
+    for page_file in sorted(public.rglob("*.html")):
+        if page_file.relative_to(public).as_posix().startswith(EXCLUDE):
+            continue
+        audit_page(page_file, public, resolver, budgets, result)
+    return result
+
+
+def print_results(result, as_json=False):
+    if as_json:
+        output = {
+            "pages": [
+                {"page": p.page, "type": p.page_type, "total": p.total, "lazy": p.lazy, "weights": p.weights}
+                for p in result.pages
+            ],
+            "errors": len(result.errors),
+            "warnings": len(result.warnings),
+            "issues": [
+                {"severity": i.severity, "page": i.page, "check": i.check, "message": i.message}
+                for i in result.issues
+            ],
+        }
+        print(json.dumps(output, indent=2))
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  Performance Budgets — sanderveen.art")
+    print(f"{'='*60}")
+    print(f"  Pages checked:  {len(result.pages)}")
+    print(f"  Errors:         {len(result.errors)}")
+    print(f"  Warnings:       {len(result.warnings)}")
+    print(f"{'='*60}\n")
+
+    by_type = {}
+    for p in result.pages:
+        by_type.setdefault(p.page_type, []).append(p)
+    print(f"  {'type':<14} {'pages':>5} {'avg KB':>8} {'max KB':>8} {'lazy KB':>8}  heaviest")
+    for page_type, pages in sorted(by_type.items()):
+        heaviest = max(pages, key=lambda p: p.total)
+        avg = sum(p.total for p in pages) / len(pages)
+        lazy = max(p.lazy for p in pages)
+        print(f"  {page_type:<14} {len(pages):>5} {avg / 1024:>8.0f} {heaviest.total / 1024:>8.0f} "
+              f"{lazy / 1024:>8.0f}  {heaviest.page}")
+    print()
+
+    for severity in ["ERROR", "WARNING"]:
+        issues = [i for i in result.issues if i.severity == severity]
+        if not issues:
+            continue
+        label = "ERRORS" if severity == "ERROR" else "WARNINGS"
+        print(f"  {label}:")
+        print(f"  {'-'*40}")
+        for issue in issues:
+            print(f"  [{issue.severity}] {issue.page}")
+            print(f"    {issue.check}: {issue.message}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check built-site performance budgets")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Hugo output directory")
+    parser.add_argument("--budgets", type=Path, help="JSON file overriding BUDGETS per page type")
+    parser.add_argument("--baseline", action="store_true", help="Fail on page-weight growth vs. the saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Allowed growth vs. baseline (fraction)")
+    parser.add_argument("--save-baseline", action="store_true", help="Record current page weights as the baseline")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    if not args.public.exists():
+        print(f"Build output not found at {args.public}")
+        print("Run: hugo --minify")
+        sys.exit(2)
+
+    budgets = {k: dict(v) for k, v in BUDGETS.items()}
+    if args.budgets:
+        for page_type, overrides in json.loads(args.budgets.read_text(encoding="utf-8")).items():
+            budgets.setdefault(page_type, dict(BUDGETS["other"])).update(overrides)
+
+    result = run_audit(args.public, budgets)
+
+    if args.baseline and BASELINE_PATH.exists():
+        compare_baseline(result, json.loads(BASELINE_PATH.read_text(encoding="utf-8")), args.tolerance)
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps({p.page: p.total + p.lazy for p in result.pages}, indent=2), encoding="utf-8")
+
+    print_results(result, as_json=args.json)
+    sys.exit(1 if result.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
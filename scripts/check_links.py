@@ -0,0 +1,298 @@
+"""
+Internal link and asset reference check for the built site (Hugo public/ output).
+
+validate_content.py checks the source tree; this checks what Hugo actually
+emitted. Every page in public/ is parsed (html.parser, streaming) for href,
+src, srcset and poster references, and each local one is resolved against
+the output tree: a missing file is an ERROR, a missing #fragment on the same
+page a WARNING. Painting cards rendered without an image are reported too,
+since painting-card.html silently skips an image resources.Get can't find.
+
+Translations are checked both ways:
+  - every <link rel="alternate" hreflang> target exists, is in that language
+    (<html lang>), and links back to the page (x-default must be Dutch)
+  - the language switcher (a.lang-switch) points at an existing page in its
+    language, and at the same page as the hreflang alternate when there is one
+
+Pages are parsed in a process pool. Parse results are cached by page hash in
+scripts/.cache/check-links.json, so after a rebuild only pages whose HTML
+changed are parsed again; resolving against the tree is always redone.
+
+Usage:
+    hugo --minify && python scripts/check_links.py
+    python scripts/check_links.py --strict     # warnings fail too
+    python scripts/check_links.py --no-cache   # reparse every page
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from check_budgets import EXCLUDE, PUBLIC, site_host  # noqa: E402
+
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "check-links.json"
+CACHE_VERSION = 1
+DEFAULT_LANG = "nl"  # defaultContentLanguage in hugo.toml, the x-default target
+
+# (tag, attribute) pairs that reference another file
+URL_ATTRS = {
+    ("a", "href"), ("link", "href"), ("area", "href"),
+    ("img", "src"), ("script", "src"), ("source", "src"), ("iframe", "src"),
+    ("video", "src"), ("audio", "src"), ("track", "src"), ("embed", "src"),
+    ("video", "poster"),
+}
+SRCSET_TAGS = {"img", "source"}
+SKIP_SCHEMES = {"mailto", "tel", "data", "javascript", "blob"}
+
+
+class PageRefParser(HTMLParser):
+    """References, ids, hreflang alternates and language-switcher links of one page."""
+
+    def __init__(self):
+        super().__init__()
+        self.lang = None
+        self.refs = []  # [tag.attr, url]
+        self.ids = set()
+        self.alternates = {}  # hreflang -> href
+        self.switcher = {}  # hreflang -> href
+        self.cards_without_image = []
+        self._card = None  # [title, has image]
+
+    def handle_starttag(self, tag, attrs):
+        a = {k: v for k, v in attrs if v is not None}
+        if tag == "html":
+            self.lang = a.get("lang")
+        if "id" in a:
+            self.ids.add(a["id"])
+        if tag == "a" and "name" in a:
+            self.ids.add(a["name"])
+        for name, value in a.items():
+            if (tag, name) in URL_ATTRS and value.strip():
+                self.refs.append((f"{tag}.{name}", value.strip()))
+            elif name == "srcset" and tag in SRCSET_TAGS:
+                for candidate in value.split(","):
+                    url = candidate.strip().split(" ")[0]
+                    if url:
+                        self.refs.append((f"{tag}.srcset", url))
+
+        rel = (a.get("rel") or "").lower().split()
+        if tag == "link" and "alternate" in rel and a.get("hreflang") and a.get("href"):
+            self.alternates[a["hreflang"]] = a["href"]
+        if tag == "a" and "lang-switch" in (a.get("class") or "").split() and a.get("hreflang"):
+            self.switcher[a["hreflang"]] = a.get("href", "")
+
+        if tag == "article" and "painting-card" in (a.get("class") or "").split():
+            self._card = ["", False]
+        elif self._card is not None:
+            if tag == "img":
+                self._card[1] = True
+            elif tag == "a" and not self._card[0]:
+                self._card[0] = a.get("href", "")
+
+    def handle_endtag(self, tag):
+        if tag == "article" and self._card is not None:
+            if not self._card[1]:
+                self.cards_without_image.append(self._card[0])
+            self._card = None
+
+
+def parse_page(path):
+    """Worker: parse one page into a JSON-able dict."""
+    parser = PageRefParser()
+    parser.feed(Path(path).read_text(encoding="utf-8", errors="replace"))
+    parser.close()
+    return {
+        "lang": parser.lang,
+        "refs": parser.refs,
+        "ids": sorted(parser.ids),
+        "alternates": parser.alternates,
+        "switcher": parser.switcher,
+        "cards_without_image": parser.cards_without_image,
+    }
+
+
+def page_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:20]
+
+
+def load_pages(public, workers, use_cache=True):
+    """({rel: parsed page}, number of pages parsed this run)."""
+    files = [p for p in sorted(public.rglob("*.html"))
+             if not p.relative_to(public).as_posix().startswith(EXCLUDE)]
+    cache = {}
+    if use_cache and CACHE_PATH.exists():
+        stored = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        if stored.get("version") == CACHE_VERSION:
+            cache = stored["pages"]
+
+    pages, hashes, todo = {}, {}, []
+    for path in files:
+        rel = path.relative_to(public).as_posix()
+        digest = page_hash(path)
+        hashes[rel] = digest
+        entry = cache.get(rel)
+        if entry and entry["hash"] == digest:
+            pages[rel] = entry["data"]
+        else:
+            todo.append((rel, path))
+
+    if todo:
+        if len(todo) > 20 and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(parse_page, [str(p) for _, p in todo], chunksize=8))
+        else:
+            parsed = [parse_page(p) for _, p in todo]
+        for (rel, _), data in zip(todo, parsed):
+            pages[rel] = data
+
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps({
+        "version": CACHE_VERSION,
+        "pages": {rel: {"hash": hashes[rel], "data": pages[rel]} for rel in sorted(pages)},
+    }), encoding="utf-8")
+    return pages, len(todo)
+
+
+class Tree:
+    """Resolve page URLs against the files in public/ (listed once)."""
+
+    def __init__(self, public, host):
+        self.host = host
+        self.files = {p.relative_to(public).as_posix() for p in public.rglob("*") if p.is_file()}
+        self.dirs = {str(Path(f).parent.as_posix()) for f in self.files}
+
+    def local_path(self, url, page_rel):
+        """(path relative to public/, fragment) for a local URL, or None for external ones."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme in SKIP_SCHEMES:
+            return None
+        if parts.scheme not in ("", "http", "https") or (parts.netloc and parts.netloc != self.host):
+            return None
+        path = urllib.parse.unquote(parts.path)
+        if not path:
+            return page_rel, parts.fragment  # "#id" or "?q" on the same page
+        if path.startswith("/"):
+            rel = path.lstrip("/")
+        else:
+            rel = os.path.normpath(os.path.join(os.path.dirname(page_rel), path)).replace(os.sep, "/")
+            if rel == ".":
+                rel = ""
+        return rel, parts.fragment
+
+    def resolve(self, rel):
+        """The file a path is served from, or None."""
+        rel = rel.rstrip("/")
+        if rel in self.files:
+            return rel
+        index = f"{rel}/index.html" if rel else "index.html"
+        if index in self.files:
+            return index
+        return None
+
+
+def check(pages, tree):
+    """[(severity, page, message)]"""
+    issues = []
+    for rel, page in sorted(pages.items()):
+        seen = set()
+        for attr, url in page["refs"]:
+            if (attr, url) in seen:
+                continue
+            seen.add((attr, url))
+            local = tree.local_path(url, rel)
+            if local is None:
+                continue
+            path, fragment = local
+            target = tree.resolve(path)
+            if target is None:
+                kind = "broken link" if attr == "a.href" else "missing asset"
+                issues.append(("ERROR", rel, f"{kind} ({attr}): {url}"))
+            elif fragment and target == rel and fragment not in page["ids"]:
+                issues.append(("WARNING", rel, f"no element with id '{fragment}' ({attr}): {url}"))
+
+        for href in page["cards_without_image"]:
+            issues.append(("WARNING", rel, f"painting card without image (image not found by resources.Get?): {href}"))
+
+        issues.extend(check_translations(rel, page, pages, tree))
+    return issues
+
+
+def check_translations(rel, page, pages, tree):
+    issues = []
+    for hreflang, href in sorted(page["alternates"].items()):
+        local = tree.local_path(href, rel)
+        target = tree.resolve(local[0]) if local else None
+        if target is None:
+            issues.append(("ERROR", rel, f"hreflang={hreflang} target does not exist: {href}"))
+            continue
+        expected = DEFAULT_LANG if hreflang == "x-default" else hreflang
+        other = pages.get(target)
+        if other is None:
+            continue
+        if other["lang"] != expected:
+            issues.append(("ERROR", rel, f"hreflang={hreflang} points at a page in '{other['lang']}': {href}"))
+        if hreflang == "x-default" or target == rel:
+            continue
+        back = [tree.resolve((tree.local_path(h, target) or ("",))[0]) for h in other["alternates"].values()]
+        if rel not in back:
+            issues.append(("WARNING", rel, f"hreflang={hreflang} target doesn't link back: {href}"))
+    if page["alternates"] and page["lang"] not in page["alternates"]:
+        issues.append(("WARNING", rel, f"hreflang alternates don't include the page itself ({page['lang']})"))
+
+    for hreflang, href in sorted(page["switcher"].items()):
+        local = tree.local_path(href, rel)
+        target = tree.resolve(local[0]) if local else None
+        if target is None:
+            issues.append(("ERROR", rel, f"language switcher ({hreflang}) target does not exist: {href}"))
+            continue
+        other = pages.get(target)
+        if other is not None and other["lang"] != hreflang:
+            issues.append(("ERROR", rel, f"language switcher ({hreflang}) points at a page in '{other['lang']}': {href}"))
+        alternate = page["alternates"].get(hreflang)
+        if alternate:
+            alt_local = tree.local_path(alternate, rel)
+            if alt_local and tree.resolve(alt_local[0]) != target:
+                issues.append(("WARNING", rel, f"language switcher ({hreflang}) goes to {href}, hreflang to {alternate}"))
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check internal links, asset references and translations in public/")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Hugo output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Parser processes")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every page, ignoring the cache")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 on warnings too")
+    args = parser.parse_args()
+
+    if not args.public.exists():
+        print(f"Build output not found at {args.public}")
+        print("Run: hugo --minify")
+        sys.exit(2)
+
+    pages, parsed = load_pages(args.public, args.workers, use_cache=not args.no_cache)
+    tree = Tree(args.public, site_host())
+    issues = check(pages, tree)
+    errors = [i for i in issues if i[0] == "ERROR"]
+    warnings = [i for i in issues if i[0] == "WARNING"]
+
+    for severity, rel, message in issues:
+        print(f"  [{severity}] {rel}: {message}")
+    refs = sum(len(p["refs"]) for p in pages.values())
+    print(f"Pages:      {len(pages)} ({parsed} parsed, {len(pages) - parsed} cached)")
+    print(f"References: {refs}")
+    print(f"Errors:     {len(errors)}")
+    print(f"Warnings:   {len(warnings)}")
+
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,13 @@ Clean up painting content files:
 - Set status to "available" for all (no price display)
 """
 
-import json
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from manifest_schema import load_manifest  # noqa: E402
+
 PROJECT_DIR = Path(__file__).parent.parent
 NL_DIR = PROJECT_DIR / "content" / "schilderijen"
 EN_DIR = PROJECT_DIR / "content" / "en" / "paintings"
@@ -169,19 +172,22 @@ def generate_md(title, slug, medium, dimensions, image, featured, category, body
 
 
 def main():
-    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
-        paintings = json.load(f)
+    try:
+        paintings = load_manifest(MANIFEST_PATH)
+    except ValueError as e:
+        print(f"Invalid manifest: {e}")
+        sys.exit(1)
 
     print(f"Processing {len(paintings)} paintings...\n")
 
     for p in paintings:
-        slug = p["slug"]
-        medium_raw = p.get("medium", "")
-        dimensions_raw = p.get("dimensions", "")
-        image = p.get("local_image", "")
-        category = p.get("category", "")
-        title_nl = p.get("title_nl", "")
-        title_en = p.get("title_en", "")
+        slug = p.slug
+        medium_raw = p.medium
+        dimensions_raw = p.dimensions
+        image = p.local_image
+        category = p.category
+        title_nl = p.title_nl
+        title_en = p.title_en
 
         # Fix Dutch title casing
         title_nl = fix_dutch_title(title_nl)
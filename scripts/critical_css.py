@@ -0,0 +1,523 @@
+"""
+Critical CSS per template, extracted from the built site, plus a dead-selector report.
+
+head.html concatenates the stylesheets in assets/css into one main.css that
+blocks first paint on every page. This tool reads every page in public/,
+works out which rules style the top of each template (the header and the
+first --fold elements of <main>), and writes data/criticalcss.json. head.html
+inlines that CSS in a <style> and loads the full bundle asynchronously. It
+falls back to the plain blocking <link> whenever the data is missing or was
+made from different stylesheets (a hash of the concatenated sources is
+stored and compared at build time).
+
+"Above the fold" is a document-order approximation (no browser layout):
+everything before <main>, plus the first --fold elements inside it, plus
+the <html>/<body> ancestors. State (:hover, :focus...) and pseudo-elements
+match their base element. Classes that main.js or the inline theme script
+toggle (dark, is-open, is-scrolled...) count as present on the elements
+that carry the rest of the selector.
+
+Templates are keyed as <type>-<kind> (e.g. schilderijen-page, page-home).
+head.html prints the key on the stylesheet link as data-tpl, so a page's
+template is read from public/ instead of guessed from its URL.
+
+Usage:
+    hugo --minify && python scripts/critical_css.py      # update data/criticalcss.json
+    python scripts/critical_css.py --dead                 # also list selectors no page uses
+    python scripts/critical_css.py --check                # exit 1 if stale vs. assets/css
+    # then rebuild: hugo --minify
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PUBLIC = ROOT / "public"
+CSS_DIR = ROOT / "assets" / "css"
+JS_DIR = ROOT / "assets" / "js"
+DATA_PATH = ROOT / "data" / "criticalcss.json"
+
+# Same order as the resources.Concat in layouts/partials/head.html
+STYLESHEETS = ["_reset.css", "_typography.css", "_layout.css", "_components.css",
+               "_gallery.css", "_navigation.css", "_footer.css", "_utilities.css"]
+DEFAULT_FOLD = 80  # elements inside <main> treated as above the fold
+EXCLUDE = ("admin/",)
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+# Pseudo-classes that depend on user state, not on the document: match the base element
+STATE_PSEUDOS = {"hover", "focus", "focus-visible", "focus-within", "active", "visited",
+                 "link", "checked", "disabled", "enabled", "target", "placeholder-shown",
+                 "before", "after", "first-line", "first-letter", "placeholder", "selection",
+                 "marker", "any-link"}
+
+
+# --- HTML ---
+
+class Element:
+    __slots__ = ("tag", "attrs", "classes", "parent", "children", "order")
+
+    def __init__(self, tag, attrs, parent, order):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = set((attrs.get("class") or "").split())
+        self.parent = parent
+        self.children = []
+        self.order = order
+
+
+class DomBuilder(HTMLParser):
+    """Minimal element tree (no text nodes) from the minified Hugo output."""
+
+    def __init__(self):
+        super().__init__()
+        self.root = Element("#document", {}, None, -1)
+        self.elements = []
+        self.scripts = []
+        self._stack = [self.root]
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        el = Element(tag, {k: (v if v is not None else "") for k, v in attrs}, self._stack[-1], len(self.elements))
+        self._stack[-1].children.append(el)
+        self.elements.append(el)
+        if tag not in VOID_TAGS:
+            self._stack.append(el)
+        self._in_script = tag == "script"
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self._stack[-1].tag == tag:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        self._in_script = False
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                break
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts.append(data)
+
+
+def element_index(dom):
+    index = {"all": dom.elements, "id": {}, "class": {}, "tag": {}}
+    for el in dom.elements:
+        index["tag"].setdefault(el.tag, []).append(el)
+        if "id" in el.attrs:
+            index["id"].setdefault(el.attrs["id"], []).append(el)
+        for cls in el.classes:
+            index["class"].setdefault(cls, []).append(el)
+    return index
+
+
+def fold_elements(dom, fold):
+    """Elements treated as above the fold."""
+    main = next((el for el in dom.elements if el.tag == "main"), None)
+    if main is None:
+        return set(dom.elements)
+    inside = [el for el in dom.elements if el.order > main.order and _has_ancestor(el, main)]
+    visible = {el for el in dom.elements if el.order <= main.order}
+    visible.update(inside[:fold])
+    return {el for el in visible if not _has_ancestor_tag(el, "head") or el.tag == "html"}
+
+
+def _has_ancestor(el, ancestor):
+    while el is not None:
+        if el is ancestor:
+            return True
+        el = el.parent
+    return False
+
+
+def _has_ancestor_tag(el, tag):
+    el = el.parent
+    while el is not None:
+        if el.tag == tag:
+            return True
+        el = el.parent
+    return False
+
+
+# --- CSS ---
+
+def strip_comments(css):
+    return re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+
+
+def parse_css(css, source=""):
+    """Rules as dicts: {"at": "@media ..." or None, "selectors": [...], "body": "...", "source": file}.
+
+    At-rules without selectors (@font-face, @keyframes) come back with
+    selectors=None and the whole block as body.
+    """
+    css = strip_comments(css)
+    rules, pos = [], 0
+
+    def block_end(start):
+        depth = 0
+        for i in range(start, len(css)):
+            if css[i] == "{":
+                depth += 1
+            elif css[i] == "}":
+                depth -= 1
+                if depth == 0:
+                    return i
+        return len(css) - 1
+
+    while True:
+        brace = css.find("{", pos)
+        if brace == -1:
+            break
+        prelude = css[pos:brace].strip()
+        end = block_end(brace)
+        inner = css[brace + 1:end]
+        if prelude.startswith(("@media", "@supports")):
+            for rule in parse_css(inner, source):
+                rule["at"] = re.sub(r"\s+", " ", prelude)
+                rules.append(rule)
+        elif prelude.startswith("@"):
+            rules.append({"at": None, "selectors": None, "prelude": re.sub(r"\s+", " ", prelude),
+                          "body": inner, "source": source})
+        else:
+            selectors = [re.sub(r"\s+", " ", s).strip() for s in split_top_level(prelude, ",")]
+            rules.append({"at": None, "selectors": [s for s in selectors if s], "body": inner, "source": source})
+        pos = end + 1
+    return rules
+
+
+def split_top_level(text, sep):
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(text):
+        if c in "([":
+            depth += 1
+        elif c in ")]":
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def minify_body(body):
+    decls = [d.strip() for d in body.split(";")]
+    out = ";".join(re.sub(r"\s*:\s*", ":", re.sub(r"\s+", " ", d), count=1) for d in decls if d)
+    return re.sub(r"\s*,\s*", ",", out)
+
+
+def render_rules(rules):
+    """Minified CSS text for rules, regrouping consecutive rules under the same at-rule."""
+    out, current_at = [], None
+    for rule in rules:
+        if rule["selectors"] is None:
+            text = f"{rule['prelude']}{{{minify_body(rule['body'])}}}"
+        else:
+            text = f"{','.join(rule['selectors'])}{{{minify_body(rule['body'])}}}"
+        if rule["at"] != current_at:
+            if current_at:
+                out.append("}")
+            if rule["at"]:
+                out.append(rule["at"] + "{")
+            current_at = rule["at"]
+        out.append(text)
+    if current_at:
+        out.append("}")
+    return "".join(out)
+
+
+# --- Selector matching ---
+
+COMPOUND_RE = re.compile(
+    r"(\*|[a-zA-Z][\w-]*)"                           # tag
+    r"|#([\w-]+)"                                     # id
+    r"|\.([\w-]+)"                                    # class
+    r"|\[\s*([\w-]+)\s*(?:([~|^$*]?=)\s*(\"[^\"]*\"|'[^']*'|[^\]\s]+)\s*)?\]"  # attribute
+    r"|::?([\w-]+)(\((?:[^()]|\([^()]*\))*\))?"       # pseudo
+)
+
+
+def parse_selector(selector):
+    """[(combinator, compound)] left to right; compound is a list of (kind, ...) tests."""
+    tokens = re.split(r"\s*([>+~])\s*|\s+", selector.strip())
+    steps, combinator = [], " "
+    for tok in tokens:
+        if tok is None or tok == "":
+            continue
+        if tok in (">", "+", "~"):
+            combinator = tok
+            continue
+        tests, pos = [], 0
+        while pos < len(tok):
+            m = COMPOUND_RE.match(tok, pos)
+            if not m:
+                raise ValueError(f"unsupported selector syntax: {selector!r}")
+            tag, id_, cls, attr, op, value, pseudo, args = m.groups()
+            if tag:
+                if tag != "*":
+                    tests.append(("tag", tag.lower()))
+            elif id_:
+                tests.append(("id", id_))
+            elif cls:
+                tests.append(("class", cls))
+            elif attr:
+                tests.append(("attr", attr.lower(), op, value.strip("\"'") if value else None))
+            else:
+                tests.append(("pseudo", pseudo.lower(), args[1:-1] if args else None))
+            pos = m.end()
+        steps.append((combinator, tests))
+        combinator = " "
+    return steps
+
+
+class Matcher:
+    def __init__(self, js_words):
+        self.js_words = js_words
+        self._parsed = {}
+
+    def steps(self, selector):
+        if selector not in self._parsed:
+            self._parsed[selector] = parse_selector(selector)
+        return self._parsed[selector]
+
+    def candidates(self, selector, index):
+        """Elements that can match the selector's last compound, from the page's element index."""
+        for test in self.steps(selector)[-1][1]:
+            if test[0] == "id":
+                return index["id"].get(test[1], ())
+            if test[0] == "class" and test[1] not in self.js_words:
+                return index["class"].get(test[1], ())
+            if test[0] == "tag":
+                return index["tag"].get(test[1], ())
+        return index["all"]
+
+    def compound(self, el, tests):
+        matched_real = False
+        deferred = False
+        for test in tests:
+            kind = test[0]
+            if kind == "tag":
+                if el.tag != test[1]:
+                    return False
+                matched_real = True
+            elif kind == "id":
+                if el.attrs.get("id") != test[1]:
+                    return False
+                matched_real = True
+            elif kind == "class":
+                if test[1] in el.classes:
+                    matched_real = True
+                elif test[1] in self.js_words:
+                    deferred = True  # may be added by script; needs another test to anchor it
+                else:
+                    return False
+            elif kind == "attr":
+                _, name, op, value = test
+                if name not in el.attrs:
+                    if name == "hidden" or name.startswith("aria-"):
+                        deferred = True  # toggled by main.js
+                        continue
+                    return False
+                actual = el.attrs[name]
+                if op and not _attr_op(op, actual, value) and not (name.startswith("aria-") and value in self.js_words):
+                    return False
+                matched_real = True
+            else:
+                if not self.pseudo(el, test[1], test[2]):
+                    return False
+        return matched_real or not deferred
+
+    def pseudo(self, el, name, args):
+        if name in STATE_PSEUDOS:
+            return True
+        if name == "root":
+            return el.tag == "html"
+        if name == "not":
+            return not any(self.matches(el, s.strip()) for s in split_top_level(args or "", ","))
+        if name in ("is", "where"):
+            return any(self.matches(el, s.strip()) for s in split_top_level(args or "", ","))
+        siblings = el.parent.children if el.parent else [el]
+        if name == "first-child":
+            return siblings[0] is el
+        if name == "last-child":
+            return siblings[-1] is el
+        if name == "only-child":
+            return len(siblings) == 1
+        if name == "empty":
+            return not el.children  # text is not tracked; err on the side of matching
+        return True  # nth-child and anything unknown: keep the rule
+
+    def matches(self, el, selector):
+        steps = self.steps(selector)
+        return self._match_from(el, steps, len(steps) - 1)
+
+    def _match_from(self, el, steps, i):
+        combinator, tests = steps[i]
+        if not self.compound(el, tests):
+            return False
+        if i == 0:
+            return True
+        if combinator == ">":
+            return el.parent is not None and self._match_from(el.parent, steps, i - 1)
+        if combinator == " ":
+            parent = el.parent
+            while parent is not None and parent.tag != "#document":
+                if self._match_from(parent, steps, i - 1):
+                    return True
+                parent = parent.parent
+            return False
+        siblings = el.parent.children if el.parent else []
+        idx = siblings.index(el)
+        if combinator == "+":
+            return idx > 0 and self._match_from(siblings[idx - 1], steps, i - 1)
+        return any(self._match_from(s, steps, i - 1) for s in siblings[:idx])
+
+
+def _attr_op(op, actual, value):
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    return value in actual  # *=
+
+
+def js_words(inline_scripts=()):
+    """Quoted identifiers in main.js and inline scripts: class names and attribute values set at runtime."""
+    words = set()
+    sources = [p.read_text(encoding="utf-8") for p in sorted(JS_DIR.glob("*.js"))] + list(inline_scripts)
+    for text in sources:
+        words.update(re.findall(r"""['"]([A-Za-z][\w-]*)['"]""", text))
+    return words
+
+
+# --- Driver ---
+
+def stylesheet_source():
+    return "".join((CSS_DIR / name).read_text(encoding="utf-8") for name in STYLESHEETS)
+
+
+def load_rules():
+    rules = []
+    for name in STYLESHEETS:
+        rules.extend(parse_css((CSS_DIR / name).read_text(encoding="utf-8"), name))
+    return rules
+
+
+def page_template(dom):
+    for el in dom.elements:
+        if el.tag == "link" and "data-tpl" in el.attrs:
+            return el.attrs["data-tpl"]
+    return None
+
+
+def analyse(public=PUBLIC, fold=DEFAULT_FOLD):
+    """({template: set of (rule index, selector)}, set of used (rule index, selector), pages, rules, missing key count)."""
+    rules = load_rules()
+    pages = [p for p in sorted(public.rglob("*.html"))
+             if not p.relative_to(public).as_posix().startswith(EXCLUDE)]
+    critical, used, untagged = {}, set(), 0
+    matcher = None
+    for page in pages:
+        dom = DomBuilder()
+        dom.feed(page.read_text(encoding="utf-8"))
+        if matcher is None:
+            matcher = Matcher(js_words(dom.scripts))
+        key = page_template(dom)
+        if key is None:
+            untagged += 1
+        visible = fold_elements(dom, fold)
+        index = element_index(dom)
+        bucket = critical.setdefault(key, set()) if key else None
+        for i, rule in enumerate(rules):
+            if rule["selectors"] is None:
+                continue
+            for selector in rule["selectors"]:
+                if (i, selector) in used and (bucket is None or (i, selector) in bucket):
+                    continue
+                hits = [el for el in matcher.candidates(selector, index) if matcher.matches(el, selector)]
+                if hits:
+                    used.add((i, selector))
+                    if bucket is not None and any(el in visible for el in hits):
+                        bucket.add((i, selector))
+    return critical, used, pages, rules, untagged
+
+
+def critical_css(rules, picked):
+    """CSS text for the picked selectors, in source order; @font-face is always kept."""
+    out = []
+    for i, rule in enumerate(rules):
+        if rule["selectors"] is None:
+            if rule["prelude"].startswith("@font-face"):
+                out.append(rule)
+            continue
+        selectors = [s for s in rule["selectors"] if (i, s) in picked]
+        if selectors:
+            out.append({**rule, "selectors": selectors})
+    return render_rules(out)
+
+
+def render(data):
+    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract per-template critical CSS from public/")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Built site directory (default: public/)")
+    parser.add_argument("--fold", type=int, default=DEFAULT_FOLD, help="Elements inside <main> counted as above the fold")
+    parser.add_argument("--dead", action="store_true", help="List selectors that match nothing on any page")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the data file was made from other stylesheets")
+    args = parser.parse_args()
+
+    source_hash = hashlib.sha256(stylesheet_source().encode("utf-8")).hexdigest()
+    if args.check:
+        current = json.loads(DATA_PATH.read_text(encoding="utf-8")) if DATA_PATH.exists() else {}
+        if current.get("source") != source_hash:
+            print("data/criticalcss.json is out of date — run: hugo --minify && python scripts/critical_css.py")
+            sys.exit(1)
+        print(f"data/criticalcss.json is up to date ({len(current.get('templates', {}))} templates)")
+        return
+
+    if not args.public.is_dir():
+        print(f"{args.public} not found — run `hugo --minify` first")
+        sys.exit(2)
+
+    critical, used, pages, rules, untagged = analyse(args.public, args.fold)
+    if untagged:
+        print(f"  [WARNING] {untagged} pages have no data-tpl on their stylesheet link (built with an older head.html?)")
+    templates = {key: critical_css(rules, picked) for key, picked in sorted(critical.items())}
+    text = render({"source": source_hash, "templates": templates})
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+    if current != text:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    total = len(stylesheet_source().encode("utf-8"))
+    print(f"Pages:      {len(pages)} across {len(templates)} templates (fold: {args.fold} elements of <main>)")
+    for key, css in templates.items():
+        print(f"  {key:<24} {len(css.encode('utf-8')) / 1024:5.1f} KB critical")
+    print(f"Stylesheets: {total / 1024:.1f} KB unminified source")
+
+    all_selectors = [(i, s, r["source"]) for i, r in enumerate(rules) if r["selectors"] for s in r["selectors"]]
+    dead = [(src, s) for i, s, src in all_selectors if (i, s) not in used]
+    print(f"Selectors:  {len(all_selectors)} total, {len(dead)} unused on every page")
+    if args.dead:
+        for src, selector in dead:
+            print(f"  [DEAD] {src}: {selector}")
+    print(f"Written:    {DATA_PATH.relative_to(ROOT)}" if current != text else "Unchanged:  data/criticalcss.json")
+
+
+if __name__ == "__main__":
+    main()
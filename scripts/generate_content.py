@@ -8,10 +8,13 @@ Reads: scripts/manifest.json
 Output: content/schilderijen/*.md and content/en/paintings/*.md
 """
 
-import json
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from manifest_schema import load_manifest  # noqa: E402
+
 SCRIPTS_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPTS_DIR.parent
 MANIFEST_PATH = SCRIPTS_DIR / "manifest.json"
@@ -34,31 +37,26 @@ def slugify(text):
     return text.strip('-')
 
 
-def format_price(price):
-    """Format price for front matter."""
-    if not price:
+def gallery_yaml(painting):
+    """Front matter lines for the painting's further images, or "" when it has none."""
+    if not painting.gallery:
         return ""
-    if isinstance(price, (int, float)):
-        if price == int(price):
-            return str(int(price))
-        return f"{price:.2f}"
-    return str(price)
+    return "gallery:\n" + "".join(f'  - "{path}"\n' for path in painting.gallery)
 
 
 def generate_nl_md(painting, weight):
     """Generate Dutch .md content file."""
-    slug = painting["slug"]
-    title_nl = painting["title_nl"]
-    image = painting.get("local_image", "")
-    price = format_price(painting.get("price", ""))
-    dimensions = painting.get("dimensions", "")
-    medium = painting.get("medium", "")
-    description = painting.get("description", "")
-    category = painting.get("category", "")
+    slug = painting.slug
+    title_nl = painting.title_nl
+    image = painting.local_image
+    gallery = gallery_yaml(painting)
+    price = painting.price_label
+    dimensions = painting.dimensions
+    medium = painting.medium
+    description = painting.description
 
     # Determine if featured (higher-priced works)
-    price_val = painting.get("price", 0) or 0
-    featured = "true" if price_val >= 900 else "false"
+    featured = "true" if painting.featured else "false"
 
     content = f"""---
 title: "{title_nl}"
@@ -74,7 +72,7 @@ status: "available"
 featured: {featured}
 weight: {weight}
 image: "{image}"
----
+{gallery}---
 
 {description}
 """
@@ -83,16 +81,16 @@ image: "{image}"
 
 def generate_en_md(painting, weight):
     """Generate English .md content file."""
-    slug = painting["slug"]
-    title_en = painting["title_en"]
-    image = painting.get("local_image", "")
-    price = format_price(painting.get("price", ""))
-    dimensions = painting.get("dimensions", "")
-    medium = painting.get("medium", "")
-    description = painting.get("description", "")
+    slug = painting.slug
+    title_en = painting.title_en
+    image = painting.local_image
+    gallery = gallery_yaml(painting)
+    price = painting.price_label
+    dimensions = painting.dimensions
+    medium = painting.medium
+    description = painting.description
 
-    price_val = painting.get("price", 0) or 0
-    featured = "true" if price_val >= 900 else "false"
+    featured = "true" if painting.featured else "false"
 
     content = f"""---
 title: "{title_en}"
@@ -108,7 +106,7 @@ status: "available"
 featured: {featured}
 weight: {weight}
 image: "{image}"
----
+{gallery}---
 
 {description}
 """
@@ -121,8 +119,11 @@ def main():
         print("Run scrape.py first: python scripts/scrape.py")
         return
 
-    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
-        paintings = json.load(f)
+    try:
+        paintings = load_manifest(MANIFEST_PATH)
+    except ValueError as e:
+        print(f"Invalid manifest: {e}")
+        sys.exit(1)
 
     print(f"Loaded {len(paintings)} paintings from manifest")
 
@@ -131,7 +132,7 @@ def main():
     EN_PAINTINGS_DIR.mkdir(parents=True, exist_ok=True)
 
     for i, painting in enumerate(paintings):
-        slug = painting["slug"]
+        slug = painting.slug
         weight = (i + 1) * 10
 
         # Dutch version
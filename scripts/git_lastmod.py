@@ -0,0 +1,132 @@
+"""
+Last-modified date and commit per content file, from one `git log` pass.
+
+Replaces Hugo's enableGitInfo, which walks the git history on every build
+(the repository carries tens of megabytes of images and the walk grows with
+every commit). This runs
+
+    git log --name-only --format=... <last processed commit>..HEAD -- content
+
+newest first and keeps the first commit seen per file. The result goes to
+data/lastmod.json, keyed by the path below content/ (what Hugo's .File.Path
+gives):
+
+    "commit": "<newest commit that touched content/>",
+    "files": {"schilderijen/toro.md": {"lastmod": "2025-06-27T08:02:00+02:00",
+                                       "commit": "8c36c23"}, ...}
+
+The next run only reads the commits after "commit". A full walk is done when
+that commit is unknown (rebased away, or a fresh data file). Files that no
+longer exist are dropped. layouts/sitemap.xml uses the data for <lastmod>.
+
+CI runs it before `hugo`. The checkout has full history without blobs
+(filter: blob:none), so the walk there is cheap too.
+
+Usage:
+    python scripts/git_lastmod.py            # update data/lastmod.json
+    python scripts/git_lastmod.py --full     # ignore the stored commit, walk all history
+    python scripts/git_lastmod.py --check    # exit 1 if commits touched content since the last run
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CONTENT = ROOT / "content"
+DATA_PATH = ROOT / "data" / "lastmod.json"
+
+RECORD = "\x1e"  # starts each commit in the log output
+
+
+def git(*args, check=True):
+    proc = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    if check and proc.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {proc.stderr.strip()}")
+    return proc
+
+
+def is_ancestor(commit):
+    """True when `commit` exists and HEAD descends from it."""
+    return git("merge-base", "--is-ancestor", commit, "HEAD", check=False).returncode == 0
+
+
+def walk(since=None):
+    """({path below content/: {"lastmod", "commit"}}, newest commit seen or None).
+
+    Each file gets the newest commit that touched it.
+    """
+    revs = f"{since}..HEAD" if since else "HEAD"
+    out = git("log", "--name-only", "--no-renames", f"--format={RECORD}%H %aI", revs, "--", "content").stdout
+    files, newest = {}, None
+    for record in out.split(RECORD)[1:]:
+        header, *names = record.strip("\n").split("\n")
+        commit, date = header.split(" ", 1)
+        newest = newest or commit
+        for name in names:
+            if not name.startswith("content/"):
+                continue
+            rel = name[len("content/"):]
+            if rel not in files:  # newest first: the first commit seen wins
+                files[rel] = {"lastmod": date, "commit": commit[:7]}
+    return files, newest
+
+
+def render(data):
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write per-file lastmod dates from git history to data/lastmod.json")
+    parser.add_argument("--full", action="store_true", help="Walk the whole history instead of continuing from the stored commit")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if content commits are missing from the data file")
+    args = parser.parse_args()
+
+    try:
+        head = git("rev-parse", "HEAD").stdout.strip()
+    except (OSError, RuntimeError) as e:
+        print(f"Not a usable git checkout: {e}")
+        sys.exit(2)
+
+    current = json.loads(DATA_PATH.read_text(encoding="utf-8")) if DATA_PATH.exists() else {}
+    since = current.get("commit")
+    incremental = bool(since) and not args.full and is_ancestor(since)
+    if since and not args.full and not incremental:
+        print(f"  [WARNING] stored commit {since[:7]} is not in this history — walking all commits")
+
+    if args.check:
+        if not incremental or walk(since)[0]:
+            print(f"{DATA_PATH.relative_to(ROOT)} is out of date — run: python scripts/git_lastmod.py")
+            sys.exit(1)
+        print(f"{DATA_PATH.relative_to(ROOT)} is up to date ({len(current.get('files', {}))} files)")
+        return
+
+    files = dict(current.get("files", {})) if incremental else {}
+    changed, newest = walk(since if incremental else None)
+    files.update(changed)
+    files = {rel: entry for rel, entry in files.items() if (CONTENT / rel).is_file()}
+
+    untracked = sorted(p.relative_to(CONTENT).as_posix() for p in CONTENT.rglob("*.md")
+                       if p.relative_to(CONTENT).as_posix() not in files)
+    for rel in untracked:
+        print(f"  [WARNING] content/{rel} has no commits yet (no lastmod until it is committed)")
+
+    # Stored commit is the newest one touching content, so runs without content
+    # changes leave the file alone
+    commit = newest or (since if incremental else head)
+    text = render({"commit": commit, "files": dict(sorted(files.items()))})
+    previous = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+    if text != previous:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    mode = f"since {since[:7]}" if incremental else "full history"
+    print(f"Commits:    {mode} → {commit[:7]}")
+    print(f"Files:      {len(files)} ({len(changed)} updated)")
+    print(f"Written:    {DATA_PATH.relative_to(ROOT)}" if text != previous else "Unchanged:  data/lastmod.json")
+
+
+if __name__ == "__main__":
+    main()
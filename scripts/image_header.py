@@ -0,0 +1,215 @@
+"""
+Header-only image metadata: pixel size, real format and EXIF orientation.
+
+Reads just the bytes that describe the image, never the pixel data:
+  - JPEG: the markers up to the first SOFn frame header, plus the APP1 Exif
+    segment for the orientation
+  - PNG: the IHDR chunk (and an eXIf chunk, if any, before the image data)
+  - WebP: the VP8 / VP8L / VP8X header and the EXIF chunk of extended files
+A multi-megabyte phone photo costs a few KB of reads instead of a full decode,
+so no Pillow is needed. read_headers() reads many files in a thread pool.
+
+Formats are named like Pillow does ("JPEG", "PNG", "WEBP") so results can
+replace Image.open() lookups one for one. Width and height are as stored;
+apply the orientation (5-8 swap them) where the displayed size matters.
+
+Used by plan_srcset.py (and through it index_dimensions.py) and by the image
+checks in validate_content.py.
+
+Usage:
+    python scripts/image_header.py assets/images/paintings/toro.jpg
+    python scripts/image_header.py assets/images   # every image below a folder
+"""
+
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+# Extension -> format it should contain
+EXTENSION_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+ORIENTATION_TAG = 0x0112
+# SOFn markers carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass(frozen=True, slots=True)
+class ImageHeader:
+    width: int
+    height: int
+    format: str
+    orientation: int = 1
+
+    @property
+    def rotated(self):
+        """True when EXIF says to turn the image 90°, so the displayed size is height x width."""
+        return self.orientation in (5, 6, 7, 8)
+
+
+def read_header(path):
+    """ImageHeader for one file. Raises ValueError for unknown or truncated files."""
+    with open(path, "rb") as f:
+        head = f.read(32)
+        if head[:3] == b"\xff\xd8\xff":
+            return _read_jpeg(f)
+        if head[:8] == b"\x89PNG\r\n\x1a\n":
+            return _read_png(f, head)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _read_webp(f)
+    raise ValueError("not a JPEG, PNG or WebP file")
+
+
+def _read_jpeg(f):
+    f.seek(2)
+    orientation = 1
+    while True:
+        byte = f.read(1)
+        while byte == b"\xff":  # fill bytes before a marker
+            byte = f.read(1)
+        if not byte:
+            raise ValueError("JPEG ended before the frame header")
+        marker = byte[0]
+        if marker in (0x01, *range(0xD0, 0xD8)):
+            continue  # standalone markers, no length
+        if marker in (0xD9, 0xDA):
+            raise ValueError("JPEG has no frame header before the scan")
+        length = struct.unpack(">H", _read_exact(f, 2))[0]
+        if length < 2:
+            raise ValueError("corrupt JPEG segment length")
+        if marker in SOF_MARKERS:
+            _, height, width = struct.unpack(">BHH", _read_exact(f, 5))
+            return ImageHeader(width, height, "JPEG", orientation)
+        if marker == 0xE1 and orientation == 1:
+            segment = _read_exact(f, length - 2)
+            if segment[:6] == b"Exif\0\0":
+                orientation = _exif_orientation(segment[6:])
+            continue
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_png(f, head):
+    if head[12:16] != b"IHDR":
+        raise ValueError("PNG without IHDR")
+    width, height = struct.unpack(">II", head[16:24])
+    orientation = 1
+    # eXIf must come before IDAT; stop at the first image data
+    f.seek(8 + 8 + 13 + 4)
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        length, kind = struct.unpack(">I4s", chunk)
+        if kind == b"eXIf":
+            orientation = _exif_orientation(_read_exact(f, length))
+            break
+        if kind in (b"IDAT", b"IEND"):
+            break
+        f.seek(length + 4, os.SEEK_CUR)
+    return ImageHeader(width, height, "PNG", orientation)
+
+
+def _read_webp(f):
+    f.seek(12)
+    size, orientation = None, 1
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        kind, length = struct.unpack("<4sI", chunk)
+        data_start = f.tell()
+        if kind == b"VP8X":
+            data = _read_exact(f, 10)
+            width = 1 + int.from_bytes(data[4:7], "little")
+            height = 1 + int.from_bytes(data[7:10], "little")
+            size = (width, height)
+            if not data[0] & 0x08:  # no EXIF flag: done
+                break
+        elif kind == b"VP8 " and size is None:
+            data = _read_exact(f, 10)
+            if data[3:6] != b"\x9d\x01\x2a":
+                raise ValueError("corrupt VP8 frame header")
+            width, height = struct.unpack("<HH", data[6:10])
+            return ImageHeader(width & 0x3FFF, height & 0x3FFF, "WEBP", 1)
+        elif kind == b"VP8L" and size is None:
+            data = _read_exact(f, 5)
+            if data[0] != 0x2F:
+                raise ValueError("corrupt VP8L header")
+            bits = int.from_bytes(data[1:5], "little")
+            return ImageHeader((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "WEBP", 1)
+        elif kind == b"EXIF":
+            exif = _read_exact(f, length)
+            orientation = _exif_orientation(exif[6:] if exif[:6] == b"Exif\0\0" else exif)
+            break
+        f.seek(data_start + length + (length & 1))
+    if size is None:
+        raise ValueError("WebP without a VP8/VP8L/VP8X header")
+    return ImageHeader(size[0], size[1], "WEBP", orientation)
+
+
+def _exif_orientation(tiff):
+    """Orientation tag from a TIFF-structured EXIF block (IFD0 only); 1 when absent."""
+    if len(tiff) < 8 or tiff[:2] not in (b"II", b"MM"):
+        return 1
+    endian = "<" if tiff[:2] == b"II" else ">"
+    offset = struct.unpack(endian + "I", tiff[4:8])[0]
+    if offset + 2 > len(tiff):
+        return 1
+    count = struct.unpack(endian + "H", tiff[offset:offset + 2])[0]
+    for i in range(count):
+        entry = offset + 2 + i * 12
+        if entry + 12 > len(tiff):
+            break
+        tag, _, _ = struct.unpack(endian + "HHI", tiff[entry:entry + 8])
+        if tag == ORIENTATION_TAG:
+            return struct.unpack(endian + "H", tiff[entry + 8:entry + 10])[0]
+    return 1
+
+
+def _read_exact(f, n):
+    data = f.read(n)
+    if len(data) < n:
+        raise ValueError("file is truncated")
+    return data
+
+
+def _read_or_error(path):
+    try:
+        return read_header(path)
+    except (OSError, ValueError, struct.error) as e:
+        return e
+
+
+def read_headers(paths, workers=8):
+    """{path: ImageHeader or the exception it raised}, read in parallel."""
+    paths = list(paths)
+    if len(paths) < 4:
+        return {p: _read_or_error(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(_read_or_error, paths)))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip().split("Usage:")[1])
+        sys.exit(2)
+    paths = []
+    for arg in sys.argv[1:]:
+        p = Path(arg)
+        if p.is_dir():
+            paths += sorted(q for q in p.rglob("*") if q.suffix.lower() in IMAGE_EXTS)
+        else:
+            paths.append(p)
+    for path, info in read_headers(paths).items():
+        if isinstance(info, Exception):
+            print(f"  [ERROR] {path}: {info}")
+        else:
+            turn = f", orientation {info.orientation}" if info.orientation != 1 else ""
+            print(f"  {path}: {info.format} {info.width}x{info.height}{turn}")
+
+
+if __name__ == "__main__":
+    main()
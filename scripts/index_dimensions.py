@@ -0,0 +1,119 @@
+"""
+Physical size and aspect-ratio index for every painting.
+
+Parses each painting's `dimensions` ("77,5 x 44,5 cm", height x width) into
+numbers and compares the physical aspect ratio with the pixel aspect ratio of
+its image (from the plan_srcset.py header index, so only new or changed
+images are read). Writes data/paintingsizes.json, keyed like the other
+image data files:
+
+    "images/paintings/toro.jpg": {"height_cm": 60, "width_cm": 42.5,
+                                  "pixel_ratio": 0.7083, "mismatch": false}
+
+The painting JSON-LD in head.html uses it for schema.org height/width.
+
+Paintings whose photo differs from the stated size by more than --tolerance
+(default 8%) are flagged with a hint: when the swapped dimensions fit, the
+front matter is probably written width x height (recorded as "swapped": true,
+which query_content.py follows); otherwise the photo is cropped or includes
+the frame/wall. Unparseable dimensions are reported too.
+
+Usage:
+    python scripts/index_dimensions.py           # update data/paintingsizes.json
+    python scripts/index_dimensions.py --check   # exit 1 if the data file is stale
+    python scripts/index_dimensions.py --strict  # exit 1 on any mismatch
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from plan_srcset import load_index  # noqa: E402
+from validate_content import COLLECTIONS, ROOT, parse_dimensions, parse_front_matter  # noqa: E402
+
+DATA_PATH = ROOT / "data" / "paintingsizes.json"
+DEFAULT_TOLERANCE = 0.08
+
+
+def ratio_error(a, b):
+    """Relative difference between two aspect ratios (symmetric, 0 = equal)."""
+    return math.exp(abs(math.log(a / b))) - 1
+
+
+def build_index(pixels, tolerance=DEFAULT_TOLERANCE):
+    """(data, problems): size data per image key, and [(file, message)] to report."""
+    data, problems = {}, []
+    for path in sorted(COLLECTIONS["paintings"]["nl"]["folder"].glob("*.md")):
+        if path.name == "_index.md":
+            continue
+        fm = parse_front_matter(path)
+        if not fm or not fm.get("image") or not fm.get("dimensions"):
+            continue
+        rel = path.relative_to(ROOT).as_posix()
+        size = parse_dimensions(fm["dimensions"])
+        if size is None:
+            problems.append((rel, f"can't parse dimensions '{fm['dimensions']}' (expected 'N x N cm')"))
+            continue
+        height, width = size
+        key = str(fm["image"]).lstrip("/")
+        entry = {"height_cm": height, "width_cm": width}
+        info = pixels.get(key)
+        if info:
+            pixel_ratio = info["width"] / info["height"]
+            error = ratio_error(pixel_ratio, width / height)
+            entry["pixel_ratio"] = round(pixel_ratio, 4)
+            entry["mismatch"] = error > tolerance
+            if entry["mismatch"]:
+                if ratio_error(pixel_ratio, height / width) <= tolerance:
+                    entry["swapped"] = True
+                    hint = "dimensions look like width x height, expected height x width"
+                else:
+                    hint = "photo cropped, or includes frame/wall?"
+                problems.append((rel, f"image {info['width']}x{info['height']} px is {error:.0%} off "
+                                      f"'{fm['dimensions']}' — {hint}"))
+        data[key] = entry
+    return dict(sorted(data.items())), problems
+
+
+def render(data):
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index painting dimensions against image aspect ratios")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if data/paintingsizes.json is out of date")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 if any painting is flagged")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed aspect-ratio difference (default: 0.08)")
+    args = parser.parse_args()
+
+    pixels, _ = load_index()
+    data, problems = build_index(pixels, args.tolerance)
+    text = render(data)
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+
+    for rel, message in problems:
+        print(f"  [WARNING] {rel}: {message}")
+
+    if args.check:
+        if current != text:
+            print(f"{DATA_PATH.relative_to(ROOT)} is out of date — run: python scripts/index_dimensions.py")
+            sys.exit(1)
+        print(f"{DATA_PATH.relative_to(ROOT)} is up to date ({len(data)} paintings)")
+    else:
+        if current != text:
+            DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+            DATA_PATH.write_text(text, encoding="utf-8")
+        compared = sum(1 for e in data.values() if "pixel_ratio" in e)
+        print(f"Paintings:  {len(data)} with dimensions ({compared} compared with their image)")
+        print(f"Flagged:    {len(problems)}")
+        print(f"Written:    {DATA_PATH.relative_to(ROOT)}" if current != text else "Unchanged:  data/paintingsizes.json")
+
+    if args.strict and problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Ingest a folder of exhibition photos: resized images plus NL/EN content stubs.
+
+Takes the photos as they come off a phone and, in a process pool:
+  - applies the EXIF orientation to the pixels
+  - downsizes to at most --max-size px on the long edge (never upscales)
+  - re-encodes as progressive JPEG
+  - strips all EXIF except the capture time. GPS never reaches the repo,
+    matching `disableLatLong` in hugo.toml.
+
+The photos are ordered by capture time (then file name) and written as
+assets/images/exhibitions/<slug>-1.jpg, <slug>-2.jpg, ... (the naming
+download_exhibitions.py used). The first photo is the hero `image`, the rest
+the `gallery`. Bilingual stubs are written to content/exposities/<slug>.md and
+content/en/exhibitions/<slug>.md as drafts, for the texts to be filled in via
+the CMS.
+
+Results are cached by source hash and settings in scripts/.cache/ingest.json,
+so re-ingesting the same folder rewrites nothing. An existing image this tool
+did not write (no matching cache entry, e.g. an older exhibition's image with
+the same name) is never overwritten: the run stops before encoding
+anything. Existing content files are never overwritten without --force.
+
+Usage:
+    python scripts/ingest_exhibition.py ~/Photos/praag hotel-praag-2026 --location "Praag"
+    python scripts/ingest_exhibition.py ~/Photos/praag hotel-praag-2026 --title-nl "Expo Praag" --title-en "Expo Prague"
+    python scripts/ingest_exhibition.py ~/Photos/praag hotel-praag-2026 --dry-run
+
+Requires Pillow (pip install pillow).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from validate_content import ASSETS, COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+OUTPUT_DIR = ASSETS / "exhibitions"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "ingest.json"
+
+PHOTO_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+DEFAULT_MAX_SIZE = 2560
+DEFAULT_QUALITY = 85
+SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+EXIF_DATETIME = 0x0132           # IFD0 DateTime
+EXIF_DATETIME_ORIGINAL = 0x9003  # Exif IFD DateTimeOriginal
+EXIF_IFD = 0x8769
+
+MONTHS = {
+    "nl": ["januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus",
+           "september", "oktober", "november", "december"],
+    "en": ["January", "February", "March", "April", "May", "June", "July", "August",
+           "September", "October", "November", "December"],
+}
+STUB_TEXT = {
+    "nl": {"title": "Expositie {}", "description": "Expositie in {}, {}", "body": "Expositie in {} in {}."},
+    "en": {"title": "Exhibition {}", "description": "Exhibition in {}, {}", "body": "Exhibition in {} in {}."},
+}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def capture_time(path):
+    """EXIF capture time as "YYYY:MM:DD HH:MM:SS", or "" when the photo has none."""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as im:
+            exif = im.getexif()
+            return str(exif.get_ifd(EXIF_IFD).get(EXIF_DATETIME_ORIGINAL) or exif.get(EXIF_DATETIME) or "").strip("\0 ")
+    except OSError:
+        return ""
+
+
+def process_photo(job):
+    """Worker: orient, downsize and re-encode one photo. Returns (dest, width, height, bytes)."""
+    from PIL import Image, ImageOps
+
+    source, dest, max_size, quality, taken = job
+    with Image.open(source) as im:
+        im.draft("RGB", (max_size, max_size))  # JPEG: decode at reduced scale when much larger
+        im = ImageOps.exif_transpose(im)
+        if im.mode != "RGB":
+            if im.mode in ("RGBA", "LA", "P"):
+                im = im.convert("RGBA")
+                flat = Image.new("RGB", im.size, (255, 255, 255))
+                flat.paste(im, mask=im.getchannel("A"))
+                im = flat
+            else:
+                im = im.convert("RGB")
+        im.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        exif = Image.Exif()
+        if taken:
+            exif[EXIF_DATETIME] = taken
+        tmp = Path(dest).with_suffix(".tmp")
+        im.save(tmp, "JPEG", quality=quality, optimize=True, progressive=True, exif=exif.tobytes())
+        os.replace(tmp, dest)
+        return dest, im.width, im.height, Path(dest).stat().st_size
+
+
+def params_key(max_size, quality):
+    return f"max={max_size};q={quality};progressive;exif=datetime"
+
+
+def collect_photos(folder):
+    """Photos in `folder` in capture order: [(path, capture time)]."""
+    photos = [p for p in sorted(Path(folder).iterdir()) if p.is_file() and p.suffix.lower() in PHOTO_EXTS]
+    dated = [(p, capture_time(p)) for p in photos]
+    # Undated photos sort after dated ones, by name
+    dated.sort(key=lambda pt: (not pt[1], pt[1], pt[0].name.lower()))
+    return dated
+
+
+def format_date(day, lang):
+    return f"{day.day} {MONTHS[lang][day.month - 1]} {day.year}"
+
+
+def next_weight():
+    weights = []
+    for lang in ("nl", "en"):
+        for path in COLLECTIONS["exhibitions"][lang]["folder"].glob("*.md"):
+            fm = parse_front_matter(path) or {}
+            try:
+                weights.append(int(fm.get("weight")))
+            except (TypeError, ValueError):
+                pass
+    return max(weights, default=0) + 10
+
+
+def render_stub(lang, slug, title, location, day, images, weight):
+    text = STUB_TEXT[lang]
+    title = title or text["title"].format(location or slug)
+    place = location or "..."
+    key = slug if slug.startswith("expo-") else f"expo-{slug}"
+    lines = [
+        "---",
+        f"title: {json.dumps(title, ensure_ascii=False)}",
+        f"description: {json.dumps(text['description'].format(place, day.year), ensure_ascii=False)}",
+        f'translationKey: "{key}"',
+        'type: "exposities"',
+        "draft: true",
+        f"date: {day.isoformat()}",
+        f'start_date: "{format_date(day, lang)}"',
+        f"location: {json.dumps(place, ensure_ascii=False)}",
+        f'image: "{images[0]}"',
+    ]
+    if len(images) > 1:
+        lines.append("gallery:")
+        lines.extend(f'  - "{img}"' for img in images[1:])
+    lines += [f"weight: {weight}", "---", "", text["body"].format(place, day.year), ""]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import exhibition photos and write NL/EN exhibition stubs")
+    parser.add_argument("folder", type=Path, help="Folder with the photos")
+    parser.add_argument("slug", help="Exhibition slug, e.g. hotel-praag-2026 (file and image names)")
+    parser.add_argument("--title-nl", help="Dutch title (default: 'Expositie <location>')")
+    parser.add_argument("--title-en", help="English title (default: 'Exhibition <location>')")
+    parser.add_argument("--location", help="Location for front matter")
+    parser.add_argument("--date", type=date.fromisoformat, help="Exhibition date YYYY-MM-DD (default: first photo's capture date)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE, help="Long edge in px (default: 2560)")
+    parser.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help="JPEG quality (default: 85)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Encoder processes")
+    parser.add_argument("--force", action="store_true", help="Overwrite existing content files")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be written")
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow not installed (pip install pillow)")
+        sys.exit(2)
+    if not SLUG_RE.match(args.slug):
+        parser.error("slug must be lowercase letters/digits joined by hyphens")
+    if not args.folder.is_dir():
+        parser.error(f"not a folder: {args.folder}")
+
+    photos = collect_photos(args.folder)
+    if not photos:
+        print(f"No photos ({', '.join(PHOTO_EXTS)}) in {args.folder}")
+        sys.exit(1)
+
+    cache = json.loads(CACHE_PATH.read_text(encoding="utf-8")) if CACHE_PATH.exists() else {}
+    params = params_key(args.max_size, args.quality)
+    images, jobs, foreign = [], [], []
+    for i, (source, taken) in enumerate(photos, start=1):
+        dest = OUTPUT_DIR / f"{args.slug}-{i}.jpg"
+        rel = dest.relative_to(ASSETS.parent).as_posix()
+        images.append(rel)
+        digest = file_hash(source)
+        entry = cache.get(rel)
+        produced = dest.exists() and entry is not None and file_hash(dest) == entry["output"]
+        if dest.exists() and not produced:
+            # Not written by this tool (or edited since): another exhibition's image
+            foreign.append(dest)
+            continue
+        if produced and entry["source"] == digest and entry["params"] == params:
+            continue
+        jobs.append((rel, digest, (str(source), str(dest), args.max_size, args.quality, taken)))
+
+    if foreign:
+        for p in foreign:
+            print(f"  [ERROR] {p.relative_to(ROOT).as_posix()} exists and was not written by this tool")
+        print(f"Nothing written: choose another slug than {args.slug!r}, or move those files away first.")
+        sys.exit(1)
+
+    stale = sorted(p for p in OUTPUT_DIR.glob(f"{args.slug}-*.jpg")
+                   if re.fullmatch(rf"{re.escape(args.slug)}-\d+\.jpg", p.name)
+                   and p.relative_to(ASSETS.parent).as_posix() not in images)
+    for p in stale:
+        print(f"  [WARNING] {p.relative_to(ROOT).as_posix()} is not part of this ingest (fewer photos than before?)")
+
+    first_taken = next((t for _, t in photos if t), "")
+    day = args.date or (datetime.strptime(first_taken[:10], "%Y:%m:%d").date() if first_taken else date.today())
+    weight = next_weight()
+    stubs = {
+        COLLECTIONS["exhibitions"]["nl"]["folder"] / f"{args.slug}.md":
+            render_stub("nl", args.slug, args.title_nl, args.location, day, images, weight),
+        COLLECTIONS["exhibitions"]["en"]["folder"] / f"{args.slug}.md":
+            render_stub("en", args.slug, args.title_en, args.location, day, images, weight),
+    }
+    write_stubs = {p: t for p, t in stubs.items() if args.force or not p.exists()}
+
+    if args.dry_run:
+        for rel, _, job in jobs:
+            print(f"  would write: assets/{rel}  (from {Path(job[0]).name})")
+        for p in write_stubs:
+            print(f"  would write: {p.relative_to(ROOT).as_posix()}")
+        print(f"Photos: {len(photos)} ({len(jobs)} to process, {len(photos) - len(jobs)} cached)")
+        return
+
+    if jobs:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for (rel, digest, job), (dest, width, height, size) in zip(jobs, pool.map(process_photo, [j for _, _, j in jobs])):
+                cache[rel] = {"source": digest, "params": params, "output": file_hash(dest)}
+                print(f"  {Path(job[0]).name} -> assets/{rel} ({width}x{height}, {size / 1024:.0f} KB)")
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+    for path, text in write_stubs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        print(f"  wrote {path.relative_to(ROOT).as_posix()}")
+    for path in stubs:
+        if path not in write_stubs:
+            print(f"  kept {path.relative_to(ROOT).as_posix()} (exists; --force to overwrite)")
+
+    print(f"Photos: {len(photos)} ({len(jobs)} processed, {len(photos) - len(jobs)} unchanged)")
+    if write_stubs:
+        print("Stubs are drafts: fill in title, dates and text in the CMS, then set draft: false.")
+
+
+if __name__ == "__main__":
+    main()
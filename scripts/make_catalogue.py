@@ -0,0 +1,264 @@
+"""
+Printable catalogue PDF: one painting per page, for galleries and buyers.
+
+Reads the painting front matter in either language, lays out a cover page and
+one work per page (image, title, medium, dimensions, year, availability; never
+prices), and writes an A4 PDF with the same fonts and page furniture as the
+CMS handleiding (md_to_pdf.HandleidingPDF).
+
+Images are downsampled to the print resolution of their box on the page
+(--dpi, default 200) and cached as JPEGs in scripts/.cache/catalogue/, keyed by
+source hash and size. fpdf2 embeds those JPEGs without re-encoding. Sources are
+decoded one at a time at reduced scale (JPEG draft mode), so only one full
+image is ever in memory. fpdf2 does keep every embedded JPEG until the PDF is
+written, though, so peak memory grows with the number of works: about twice
+the PDF size (28 MB for all 44 NL works, a 12.6 MB PDF, at 200 dpi). Use
+--status/--category or a lower --dpi for smaller runs. As with md_to_pdf.py, a
+hash of the inputs is stored in the PDF and rendering is skipped when nothing
+changed.
+
+Usage:
+    python scripts/make_catalogue.py                                   # NL, all paintings
+    python scripts/make_catalogue.py --lang en -o catalogue-en.pdf
+    python scripts/make_catalogue.py --status available --category Abstract
+    python scripts/make_catalogue.py --dpi 300 --force
+
+Requires fpdf2 and Pillow (pip install fpdf2 pillow).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from md_to_pdf import (  # noqa: E402
+    DARK, FONT, GOLD, MARKER, MUTED, HandleidingPDF, Style,
+    discover_fonts, document_charset, embedded_hash, register_fonts,
+)
+from validate_content import COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+ASSETS = ROOT / "assets"
+THUMB_CACHE = Path(__file__).resolve().parent / ".cache" / "catalogue"
+
+PAGE_W, PAGE_H = 210, 297  # A4, mm
+MARGIN = 20
+IMAGE_BOX = (PAGE_W - 2 * MARGIN, 185)  # mm available for the painting
+IMAGE_TOP = 22
+DEFAULT_DPI = 200
+JPEG_QUALITY = 85
+
+TEXT = {
+    "nl": {
+        "title": "Sander Veen",
+        "subtitle": "Schilderijen — catalogus",
+        "header": "Sander Veen — catalogus",
+        "footer": "Pagina {}",
+        "contact": "sanderveen.art · info@sanderveen.art",
+        "works": "{} werken",
+        "status": {"available": "Beschikbaar", "sold": "Verkocht", "not-for-sale": "Niet te koop"},
+        "output": "sanderveen-catalogus.pdf",
+    },
+    "en": {
+        "title": "Sander Veen",
+        "subtitle": "Paintings — catalogue",
+        "header": "Sander Veen — catalogue",
+        "footer": "Page {}",
+        "contact": "sanderveen.art · info@sanderveen.art",
+        "works": "{} works",
+        "status": {"available": "Available", "sold": "Sold", "not-for-sale": "Not for sale"},
+        "output": "sanderveen-catalogue.pdf",
+    },
+}
+
+STYLES = {
+    "cover_title": Style(FONT, "B", 32, DARK),
+    "cover_sub": Style(FONT, "", 16, GOLD),
+    "cover_meta": Style(FONT, "", 11, MUTED),
+    "title": Style(FONT, "B", 18, DARK),
+    "meta": Style(FONT, "", 11, DARK),
+    "status": Style(FONT, "I", 10, MUTED),
+}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_paintings(lang, status=None, category=None):
+    """Published paintings for `lang`, newest first, as dicts with an image path."""
+    works = []
+    for path in sorted(COLLECTIONS["paintings"][lang]["folder"].glob("*.md")):
+        if path.name == "_index.md":
+            continue
+        fm = parse_front_matter(path)
+        if not fm or fm.get("draft") is True or not fm.get("image"):
+            continue
+        if status and fm.get("status") != status:
+            continue
+        if category and fm.get("category") != category:
+            continue
+        image = ASSETS / str(fm["image"]).lstrip("/")
+        if not image.is_file():
+            print(f"  [WARNING] {path.relative_to(ROOT).as_posix()}: image not found, skipped")
+            continue
+        works.append({
+            "title": fm.get("title", path.stem),
+            "medium": fm.get("medium", ""),
+            "dimensions": fm.get("dimensions", ""),
+            "year": str(fm.get("year", "")),
+            "status": fm.get("status", ""),
+            "image": image,
+        })
+    # Newest year first, A→Z within a year, undated works last
+    works.sort(key=lambda w: (not w["year"].isdigit(), -int(w["year"]) if w["year"].isdigit() else 0,
+                              w["title"].lower()))
+    return works
+
+
+def fit_box(width, height, box_w, box_h):
+    """Size in mm of a width×height image scaled to fit the box."""
+    scale = min(box_w / width, box_h / height)
+    return width * scale, height * scale
+
+
+def print_image(source, digest, box_mm, dpi):
+    """Cached JPEG of `source` at `dpi` for its fitted size in `box_mm`.
+
+    Returns (path, width_mm, height_mm). Never upsamples.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as im:
+        w, h = im.size
+        if im.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            w, h = h, w
+        w_mm, h_mm = fit_box(w, h, *box_mm)
+        target_w = min(w, round(w_mm / 25.4 * dpi))
+        target_h = max(round(h * target_w / w), 1)
+        out = THUMB_CACHE / f"{digest[:16]}-{target_w}x{target_h}-q{JPEG_QUALITY}.jpg"
+        if not out.exists():
+            im.draft("RGB", (target_w, target_h))  # JPEG: decode at reduced scale
+            im = ImageOps.exif_transpose(im)
+            if im.mode in ("RGBA", "LA", "P"):
+                im = im.convert("RGBA")
+                flat = Image.new("RGB", im.size, (255, 255, 255))
+                flat.paste(im, mask=im.getchannel("A"))
+                im = flat
+            im = im.convert("RGB").resize((target_w, target_h), Image.LANCZOS)
+            THUMB_CACHE.mkdir(parents=True, exist_ok=True)
+            tmp = out.with_suffix(".tmp")
+            im.save(tmp, "JPEG", quality=JPEG_QUALITY, optimize=True)
+            os.replace(tmp, out)
+    return out, w_mm, h_mm
+
+
+def inputs_hash(works, digests, lang, dpi):
+    h = hashlib.sha256()
+    meta = [{k: str(v) for k, v in w.items() if k != "image"} for w in works]
+    h.update(json.dumps({"lang": lang, "dpi": dpi, "works": meta, "images": digests}, sort_keys=True).encode("utf-8"))
+    for script in (Path(__file__).resolve(), Path(__file__).resolve().parent / "md_to_pdf.py"):
+        h.update(script.read_bytes().replace(b"\r\n", b"\n"))
+    return h.hexdigest()
+
+
+def centered(pdf, style, height, text):
+    pdf.use(style)
+    pdf.set_x(MARGIN)
+    pdf.cell(PAGE_W - 2 * MARGIN, height, text, align="C")
+    pdf.ln(height)
+
+
+def build_catalogue(works, output, lang, dpi=DEFAULT_DPI, font_dir=None, force=False):
+    """Render the catalogue. Returns False when skipped as up to date."""
+    text = TEXT[lang]
+    digests = [file_hash(w["image"]) for w in works]
+    digest = inputs_hash(works, digests, lang, dpi)
+    if not force and embedded_hash(output) == digest:
+        print(f"Up to date: {output} (inputs unchanged)")
+        return False
+
+    pdf = HandleidingPDF(format="A4")
+    pdf.header_text = text["header"]
+    pdf.footer_text = text["footer"]
+    pdf.set_auto_page_break(auto=False)
+    pdf.set_margins(MARGIN, MARGIN, MARGIN)
+    strings = [text["title"], text["subtitle"], text["header"], text["footer"], text["contact"], text["works"]]
+    strings += list(text["status"].values())
+    strings += [f"{w['title']}{w['medium']}{w['dimensions']}{w['year']}" for w in works]
+    register_fonts(pdf, discover_fonts(font_dir), document_charset(*strings))
+    pdf.set_title(f"{text['title']} — {text['subtitle']}")
+    pdf.set_author(text["title"])
+    pdf.set_keywords(MARKER + digest)
+
+    # Cover
+    pdf.add_page()
+    pdf.set_y(110)
+    centered(pdf, STYLES["cover_title"], 16, text["title"])
+    centered(pdf, STYLES["cover_sub"], 12, text["subtitle"])
+    pdf.ln(6)
+    pdf.set_draw_color(*GOLD)
+    pdf.set_line_width(0.8)
+    pdf.line(PAGE_W / 2 - 30, pdf.get_y(), PAGE_W / 2 + 30, pdf.get_y())
+    pdf.ln(8)
+    centered(pdf, STYLES["cover_meta"], 7, text["works"].format(len(works)))
+    centered(pdf, STYLES["cover_meta"], 7, text["contact"])
+
+    # One work per page; each source is decoded, downsampled and released before the next
+    # (the downsampled JPEGs themselves stay in memory until output)
+    for work, image_digest in zip(works, digests):
+        path, w_mm, h_mm = print_image(work["image"], image_digest, IMAGE_BOX, dpi)
+        pdf.add_page()
+        pdf.image(str(path), x=(PAGE_W - w_mm) / 2, y=IMAGE_TOP + (IMAGE_BOX[1] - h_mm) / 2, w=w_mm, h=h_mm)
+
+        pdf.set_y(IMAGE_TOP + IMAGE_BOX[1] + 10)
+        centered(pdf, STYLES["title"], 10, work["title"])
+        pdf.ln(2)
+        for line in (work["medium"], work["dimensions"], work["year"]):
+            if line:
+                centered(pdf, STYLES["meta"], 6, line)
+        label = text["status"].get(work["status"])
+        if label:
+            pdf.ln(2)
+            centered(pdf, STYLES["status"], 6, label)
+
+    tmp = Path(output).with_suffix(".tmp")
+    pdf.output(str(tmp))
+    os.replace(tmp, output)
+    print(f"PDF saved to: {output} ({len(works)} works, {Path(output).stat().st_size / 1e6:.1f} MB)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a printable one-work-per-page catalogue PDF")
+    parser.add_argument("--lang", choices=sorted(TEXT), default="nl", help="Front matter language (default: nl)")
+    parser.add_argument("-o", "--output", type=Path, help="PDF to write (default: sanderveen-catalogus.pdf / sanderveen-catalogue.pdf)")
+    parser.add_argument("--status", choices=["available", "sold", "not-for-sale"], help="Only paintings with this status")
+    parser.add_argument("--category", help="Only paintings in this category (as in front matter)")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Print resolution for embedded images")
+    parser.add_argument("--font-dir", help="Extra directory to search for TrueType fonts")
+    parser.add_argument("--force", action="store_true", help="Render even if the PDF matches its inputs")
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow not installed (pip install pillow)")
+        sys.exit(2)
+
+    works = load_paintings(args.lang, args.status, args.category)
+    if not works:
+        print("No paintings match.")
+        sys.exit(1)
+    build_catalogue(works, args.output or Path(TEXT[args.lang]["output"]), args.lang,
+                    dpi=args.dpi, font_dir=args.font_dir, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
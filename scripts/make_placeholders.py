@@ -0,0 +1,140 @@
+"""
+Generate inline image placeholders (LQIP + dominant colour) for lazy images.
+
+For every image under assets/images this computes a tiny blurred micro-JPEG
+(at most 16px on the long side, as a base64 data URI) and the dominant
+colour, caches both by content hash, and writes data/placeholders.json.
+picture.html inlines them as the <img> background when called with
+"placeholder" true, so the painting-card grid and exhibition galleries show
+the rough image immediately instead of blank boxes while the real bytes load.
+
+Images with transparency are skipped: the placeholder would show through.
+
+Usage:
+    python scripts/make_placeholders.py           # update data/placeholders.json
+    python scripts/make_placeholders.py --check   # exit 1 if the data file is stale
+
+Requires Pillow (pip install pillow).
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ASSETS = ROOT / "assets"
+IMAGES = ASSETS / "images"
+DATA_PATH = ROOT / "data" / "placeholders.json"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "placeholders.json"
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+LQIP_SIZE = 16      # long side, px
+LQIP_QUALITY = 40
+PALETTE_COLORS = 5  # quantize to this many colours, pick the most frequent
+PARAMS = f"size={LQIP_SIZE};q={LQIP_QUALITY};k={PALETTE_COLORS}"
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def has_alpha(im):
+    if im.mode in ("RGBA", "LA"):
+        return im.getchannel("A").getextrema()[0] < 255
+    return im.mode == "P" and "transparency" in im.info
+
+
+def make_placeholder(path):
+    """Return {"color": "#rrggbb", "lqip": "data:image/jpeg;base64,..."} or None."""
+    from PIL import Image, ImageFilter, ImageOps
+
+    with Image.open(path) as im:
+        if has_alpha(im):
+            return None
+        im.draft("RGB", (LQIP_SIZE * 8, LQIP_SIZE * 8))  # JPEG: decode at reduced scale
+        im = ImageOps.exif_transpose(im).convert("RGB")
+
+        swatch = im.resize((64, 64), Image.BOX).quantize(colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT)
+        palette = swatch.getpalette()
+        _, index = max(swatch.getcolors())
+        color = "#{:02x}{:02x}{:02x}".format(*palette[index * 3:index * 3 + 3])
+
+        scale = LQIP_SIZE / max(im.size)
+        tiny = im.resize((max(round(im.width * scale), 1), max(round(im.height * scale), 1)), Image.LANCZOS)
+        tiny = tiny.filter(ImageFilter.GaussianBlur(0.6))
+        buf = io.BytesIO()
+        tiny.save(buf, "JPEG", quality=LQIP_QUALITY, optimize=True)
+    return {"color": color, "lqip": "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")}
+
+
+def build(cache_path=CACHE_PATH):
+    """Placeholders for all images, reusing cached results by content hash."""
+    cache = json.loads(cache_path.read_text(encoding="utf-8")) if cache_path.exists() else {}
+    placeholders, fresh, made, total = {}, {}, 0, 0
+    for path in sorted(IMAGES.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in IMAGE_EXTS:
+            continue
+        rel = path.relative_to(ASSETS).as_posix()
+        total += 1
+        digest = file_hash(path)
+        entry = cache.get(digest)
+        if not entry or entry.get("params") != PARAMS:
+            entry = {"params": PARAMS, "placeholder": make_placeholder(path)}
+            made += 1
+        fresh[digest] = entry
+        if entry["placeholder"]:
+            placeholders[rel] = entry["placeholder"]
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(fresh, indent=1, sort_keys=True), encoding="utf-8")
+    return placeholders, made, total
+
+
+def render(placeholders):
+    return json.dumps(placeholders, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate LQIP and dominant-colour placeholders")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if data/placeholders.json is out of date")
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow not installed (pip install pillow)")
+        sys.exit(2)
+
+    placeholders, made, total = build()
+    text = render(placeholders)
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+
+    if args.check:
+        if current != text:
+            print(f"{DATA_PATH.relative_to(ROOT)} is out of date — run: python scripts/make_placeholders.py")
+            sys.exit(1)
+        print(f"{DATA_PATH.relative_to(ROOT)} is up to date ({len(placeholders)} images)")
+        return
+
+    if current != text:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    sizes = [len(p["lqip"]) for p in placeholders.values()]
+    print(f"Images:       {total} ({made} processed, {total - made} from cache)")
+    print(f"Placeholders: {len(placeholders)} ({total - len(placeholders)} skipped for transparency)")
+    if sizes:
+        print(f"Data URI:     {sum(sizes) / len(sizes):.0f} bytes average, {max(sizes)} max")
+    print(f"Written:      {DATA_PATH.relative_to(ROOT)}" if current != text else "Unchanged:    data/placeholders.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Typed records for scripts/manifest.json, shared by the migration scripts.
+
+scrape.py writes the manifest, generate_content.py and cleanup_content.py read
+it. All three go through `Painting`, so the field names, types and defaults
+live in one place and a malformed manifest fails on load with the offending
+entry named, instead of as a KeyError halfway through writing content files.
+
+Validation runs once per manifest version: the validated records are pickled
+to scripts/.cache/manifest-<sha256>.pickle, and a later load of the same
+manifest bytes reads that instead of re-parsing and re-checking the JSON.
+
+Usage (from another script):
+    from manifest_schema import load_manifest, save_manifest, Painting
+
+    paintings = load_manifest()                  # list[Painting]
+    save_manifest(paintings)
+
+    python scripts/manifest_schema.py            # validate scripts/manifest.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = SCRIPTS_DIR / "manifest.json"
+CACHE_DIR = SCRIPTS_DIR / ".cache"
+SCHEMA_VERSION = 2  # bump when Painting's fields change, so old caches are ignored
+
+SLUG_RE = re.compile(r"^[^\W_]+(?:-[^\W_]+)*$")  # what scrape.slugify produces
+FEATURED_PRICE = 900  # generate_content.py marks works at or above this price featured
+
+
+@dataclass(slots=True)
+class Painting:
+    """One scraped artshop painting."""
+    id: int
+    slug: str
+    title_nl: str
+    title_en: str
+    category: str = ""
+    url: str = ""
+    price: Optional[float] = None
+    images: list = field(default_factory=list)
+    local_image: str = ""
+    gallery: list = field(default_factory=list)  # further local images (detail shots, framed views), in page order
+    description: str = ""
+    dimensions: str = ""
+    medium: str = ""
+
+    @classmethod
+    def from_dict(cls, data, where="entry"):
+        """Build a record from a manifest dict, raising ValueError if it is malformed."""
+        if not isinstance(data, dict):
+            raise ValueError(f"{where}: expected an object, got {type(data).__name__}")
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValueError(f"{where}: unknown field(s) {', '.join(unknown)}")
+        missing = [name for name in ("id", "slug", "title_nl", "title_en") if name not in data]
+        if missing:
+            raise ValueError(f"{where}: missing field(s) {', '.join(missing)}")
+
+        where = f"{where} ({data['slug']!r})"
+        if not isinstance(data["id"], int) or isinstance(data["id"], bool) or data["id"] < 0:
+            raise ValueError(f"{where}: id must be a non-negative integer, got {data['id']!r}")
+        if not isinstance(data["slug"], str) or not SLUG_RE.match(data["slug"]):
+            raise ValueError(f"{where}: slug must be words joined by single hyphens")
+        for name in ("title_nl", "title_en", "category", "url", "local_image",
+                     "description", "dimensions", "medium"):
+            if name in data and not isinstance(data[name], str):
+                raise ValueError(f"{where}: {name} must be a string, got {type(data[name]).__name__}")
+        price = data.get("price")
+        if price is not None:
+            if not isinstance(price, (int, float)) or isinstance(price, bool) or price < 0:
+                raise ValueError(f"{where}: price must be a non-negative number, got {price!r}")
+            price = float(price)
+        images = data.get("images", [])
+        if not isinstance(images, list) or not all(isinstance(i, str) for i in images):
+            raise ValueError(f"{where}: images must be a list of URLs")
+        gallery = data.get("gallery", [])
+        if not isinstance(gallery, list) or not all(isinstance(i, str) for i in gallery):
+            raise ValueError(f"{where}: gallery must be a list of image paths")
+
+        record = cls(**{k: v for k, v in data.items() if k not in ("price", "images", "gallery")})
+        record.price = price
+        record.images = list(images)
+        record.gallery = list(gallery)
+        return record
+
+    def to_dict(self):
+        """Manifest dict in scrape.py's key order; no price key when unknown."""
+        data = {
+            "title_nl": self.title_nl,
+            "title_en": self.title_en,
+            "id": self.id,
+        }
+        if self.price is not None:
+            data["price"] = self.price
+        data.update({
+            "images": self.images,
+            "description": self.description,
+            "dimensions": self.dimensions,
+            "medium": self.medium,
+            "category": self.category,
+            "url": self.url,
+            "slug": self.slug,
+            "local_image": self.local_image,
+            "gallery": self.gallery,
+        })
+        return data
+
+    @property
+    def price_label(self):
+        """Price as written to front matter: "950", "87.50", or "" when unknown."""
+        if not self.price:
+            return ""
+        if self.price == int(self.price):
+            return str(int(self.price))
+        return f"{self.price:.2f}"
+
+    @property
+    def featured(self):
+        return (self.price or 0) >= FEATURED_PRICE
+
+
+FIELD_NAMES = tuple(f.name for f in fields(Painting))
+
+
+def _cache_path(digest):
+    return CACHE_DIR / f"manifest-{digest[:16]}.pickle"
+
+
+def parse_manifest(raw, source="manifest"):
+    """Validated records from manifest JSON bytes."""
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{source}: invalid JSON ({e})") from None
+    if not isinstance(data, list):
+        raise ValueError(f"{source}: expected a list of paintings")
+    paintings = [Painting.from_dict(entry, f"{source}[{i}]") for i, entry in enumerate(data)]
+    seen = {}
+    for p in paintings:
+        if p.slug in seen:
+            raise ValueError(f"{source}: duplicate slug {p.slug!r} (ids {seen[p.slug]} and {p.id})")
+        seen[p.slug] = p.id
+    return paintings
+
+
+def load_manifest(path=MANIFEST_PATH, use_cache=True):
+    """Painting records from `path`, validated once per manifest version.
+
+    Raises FileNotFoundError if the manifest is missing and ValueError if it
+    is malformed.
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw + f"\0schema{SCHEMA_VERSION}".encode()).hexdigest()
+    cache = _cache_path(digest)
+
+    if use_cache and cache.exists():
+        try:
+            with open(cache, "rb") as f:
+                rows = pickle.load(f)
+            # Rows were validated before they were cached: rebuild without re-checking
+            return [Painting(*row) for row in rows]
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError, AttributeError):
+            pass  # unreadable or stale cache: fall through and rebuild it
+
+    try:
+        source = path.relative_to(SCRIPTS_DIR.parent).as_posix()
+    except ValueError:
+        source = path.name
+    paintings = parse_manifest(raw, source)
+
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for old in CACHE_DIR.glob("manifest-*.pickle"):
+            old.unlink()
+        rows = [tuple(getattr(p, name) for name in FIELD_NAMES) for p in paintings]
+        tmp = cache.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    return paintings
+
+
+def save_manifest(paintings, path=MANIFEST_PATH):
+    """Write records as manifest JSON (same layout scrape.py always produced)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump([p.to_dict() for p in paintings], f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the scraped painting manifest")
+    parser.add_argument("manifest", nargs="?", type=Path, default=MANIFEST_PATH, help="Manifest JSON (default: scripts/manifest.json)")
+    args = parser.parse_args()
+
+    try:
+        paintings = load_manifest(args.manifest, use_cache=False)
+    except FileNotFoundError:
+        print(f"Manifest not found at {args.manifest}")
+        print("Run scrape.py first: python scripts/scrape.py")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"  [ERROR] {e}")
+        sys.exit(1)
+    with_image = sum(1 for p in paintings if p.local_image)
+    views = sum(len(p.gallery) for p in paintings)
+    print(f"Manifest OK: {len(paintings)} paintings ({with_image} with a local image, {views} gallery images)")
+
+
+if __name__ == "__main__":
+    main()
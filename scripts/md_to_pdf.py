@@ -1,55 +1,296 @@
-"""Convert the CMS handleiding markdown to a styled PDF."""
-from fpdf import FPDF
+"""
+Convert the CMS handleiding markdown to a styled PDF.
+
+Fonts are discovered on the machine (Arial/Consolas on Windows, DejaVu or
+Liberation on Linux, Arial on macOS), subset to the characters the document
+uses and cached in scripts/.cache/fonts/, so registering them is nearly free
+on later runs. The SHA-256 of the markdown (plus RENDER_VERSION) is stored in
+the PDF's keywords; when it matches, rendering is skipped. The creation date
+comes from SOURCE_DATE_EPOCH or the source's last commit, so the same input
+gives a byte-identical PDF for the same fonts and SOURCE_DATE_EPOCH. Machines
+that pick up different font files (Arial vs. DejaVu, or another version)
+produce different bytes.
+
+Usage:
+    python scripts/md_to_pdf.py                          # docs/CMS-HANDLEIDING.md -> docs/CMS-Handleiding-SanderVeen.pdf
+    python scripts/md_to_pdf.py notes.md -o notes.pdf
+    python scripts/md_to_pdf.py --force                  # render even if the source is unchanged
+    python scripts/md_to_pdf.py --check                  # exit 1 if the PDF is out of date
+    python scripts/md_to_pdf.py --font-dir ~/fonts       # extra font directory (or MD_TO_PDF_FONT_DIR)
+
+Requires fpdf2 (pip install fpdf2). On Linux without Arial: apt install fonts-dejavu-core
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
 import re
+import subprocess
+import sys
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+FONT_CACHE = CACHE_DIR / "fonts"
+FONT_INDEX = CACHE_DIR / "fonts.json"
+DEFAULT_INPUT = ROOT / "docs" / "CMS-HANDLEIDING.md"
+DEFAULT_OUTPUT = ROOT / "docs" / "CMS-Handleiding-SanderVeen.pdf"
 
 FONT = "DejaVu"
 MONO = "Mono"
 
-class HandleidingPDF(FPDF):
+# Preferred font families, first match wins. Bold/italic fall back to regular.
+FAMILIES = [
+    {"regular": "arial.ttf", "bold": "arialbd.ttf", "italic": "ariali.ttf"},
+    {"regular": "DejaVuSans.ttf", "bold": "DejaVuSans-Bold.ttf", "italic": "DejaVuSans-Oblique.ttf"},
+    {"regular": "LiberationSans-Regular.ttf", "bold": "LiberationSans-Bold.ttf", "italic": "LiberationSans-Italic.ttf"},
+    {"regular": "Arial.ttf", "bold": "Arial Bold.ttf", "italic": "Arial Italic.ttf"},
+]
+MONO_CANDIDATES = ["consola.ttf", "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf", "Courier New.ttf"]
+
+HEADER_TEXT = "CMS Handleiding \u2014 sanderveen.art"
+FOOTER_TEXT = "Pagina {}"
+MARKER = "source-sha256:"
+RENDER_VERSION = 1  # bump when a renderer change alters the PDF output
+
+Style = namedtuple("Style", "family emphasis size color")
+
+GOLD = (184, 134, 11)
+DARK = (40, 40, 40)
+MUTED = (100, 100, 100)
+STYLES = {
+    "h1": Style(FONT, "B", 22, DARK),
+    "h2": Style(FONT, "B", 14, GOLD),
+    "body": Style(FONT, "", 11, DARK),
+    "sub": Style(FONT, "", 10, MUTED),
+}
+
+
+# ---------------------------------------------------------------------------
+# Fonts
+# ---------------------------------------------------------------------------
+
+def font_dirs(extra=None):
+    dirs = [Path(d).expanduser() for d in (extra, os.environ.get("MD_TO_PDF_FONT_DIR")) if d]
+    if os.name == "nt":
+        dirs.append(Path(os.environ.get("WINDIR", "C:/Windows")) / "Fonts")
+        dirs.append(Path(os.environ.get("LOCALAPPDATA", "")) / "Microsoft" / "Windows" / "Fonts")
+    dirs += [
+        Path.home() / ".local" / "share" / "fonts", Path.home() / ".fonts",
+        Path("/usr/share/fonts"), Path("/usr/local/share/fonts"),
+        Path.home() / "Library" / "Fonts", Path("/Library/Fonts"), Path("/System/Library/Fonts/Supplemental"),
+    ]
+    return [d for d in dirs if d.is_dir()]
+
+
+def discover_fonts(extra_dir=None):
+    """Return {"regular", "bold", "italic", "mono"} -> font file path.
+
+    The result is cached in scripts/.cache/fonts.json and reused while all of
+    its files still exist.
+    """
+    if FONT_INDEX.exists():
+        cached = json.loads(FONT_INDEX.read_text(encoding="utf-8"))
+        if cached.get("extra_dir") == extra_dir and all(Path(p).is_file() for p in cached["fonts"].values()):
+            return cached["fonts"]
+
+    available = {}
+    for directory in font_dirs(extra_dir):
+        for path in directory.rglob("*"):
+            if path.suffix.lower() == ".ttf":
+                available.setdefault(path.name.lower(), str(path))
+
+    fonts = None
+    for family in FAMILIES:
+        regular = available.get(family["regular"].lower())
+        if regular:
+            fonts = {role: available.get(name.lower(), regular) for role, name in family.items()}
+            break
+    if not fonts:
+        print("No usable TrueType font found. Install fonts-dejavu-core (Linux) or pass --font-dir.")
+        sys.exit(2)
+    fonts["mono"] = next((available[n.lower()] for n in MONO_CANDIDATES if n.lower() in available), fonts["regular"])
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    FONT_INDEX.write_text(json.dumps({"extra_dir": extra_dir, "fonts": fonts}, indent=1), encoding="utf-8")
+    return fonts
+
+
+def subset_font(path, charset):
+    """Return a cached copy of `path` reduced to `charset` (fontTools ships with fpdf2)."""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font_hash = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:12]
+    chars_hash = hashlib.sha256("".join(sorted(charset)).encode("utf-8")).hexdigest()[:12]
+    target = FONT_CACHE / f"{Path(path).stem}-{font_hash}-{chars_hash}.ttf"
+    if target.exists():
+        return target
+
+    options = subset.Options()
+    options.notdef_outline = True
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    options.glyph_names = True
+    options.layout_features = []
+    logging.getLogger("fontTools.subset").setLevel(logging.ERROR)  # "FFTM NOT subset" noise
+    font = TTFont(path)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes={ord(c) for c in charset})
+    subsetter.subset(font)
+    FONT_CACHE.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    font.save(tmp)
+    os.replace(tmp, target)
+    return target
+
+
+def document_charset(*texts):
+    chars = {chr(c) for c in range(32, 127)} | {"\u2022", "\u2014"}
+    for text in texts:
+        chars |= set(text)
+    return {c for c in chars if c.isprintable()}
+
+
+def register_fonts(pdf, fonts, charset):
+    """Register the FONT (regular/bold/italic) and MONO families from subset copies."""
+    styles = {"": fonts["regular"], "B": fonts["bold"], "I": fonts["italic"]}
+    for emphasis, path in styles.items():
+        pdf.add_font(FONT, emphasis, str(subset_font(path, charset)))
+    pdf.add_font(MONO, "", str(subset_font(fonts["mono"], charset)))
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+def source_hash(md_path):
+    """Hash of the markdown (line endings normalised) and RENDER_VERSION.
+
+    Only the version constant stands in for the renderer, so comment and
+    docstring edits to this script don't make the committed PDF stale.
+    """
+    h = hashlib.sha256(f"render-v{RENDER_VERSION}\n".encode())
+    h.update(Path(md_path).read_bytes().replace(b"\r\n", b"\n"))
+    return h.hexdigest()
+
+
+def embedded_hash(pdf_path):
+    """Source hash stored in an existing PDF's keywords, or None."""
+    try:
+        data = Path(pdf_path).read_bytes()
+    except OSError:
+        return None
+    m = re.search(re.escape(MARKER).encode() + rb"([0-9a-f]{64})", data)
+    return m.group(1).decode() if m else None
+
+
+def source_date(md_path):
+    """Reproducible creation date: SOURCE_DATE_EPOCH, else last commit of the source, else mtime."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        try:
+            epoch = subprocess.run(
+                ["git", "log", "-1", "--format=%ct", "--", str(md_path)],
+                cwd=ROOT, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            epoch = ""
+    if not epoch:
+        epoch = Path(md_path).stat().st_mtime
+    return datetime.fromtimestamp(int(float(epoch)), tz=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _base_class():
+    try:
+        from fpdf import FPDF
+    except ImportError:
+        print("fpdf2 not installed (pip install fpdf2)")
+        sys.exit(2)
+    return FPDF
+
+
+class HandleidingPDF(_base_class()):
+    header_text = HEADER_TEXT
+    footer_text = FOOTER_TEXT
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._style = None
+
+    def use(self, style):
+        """Switch font and text colour, emitting only what actually changed."""
+        current = self._style
+        if current is None or current[:3] != style[:3]:
+            self.set_font(style.family, style.emphasis, style.size)
+        if current is None or current.color != style.color:
+            self.set_text_color(*style.color)
+        self._style = style
+
+    # header/footer set fonts directly: fpdf2 restores the body font and colour
+    # around them, so the style tracked by use() stays valid across page breaks.
     def header(self):
         if self.page_no() > 1:
             self.set_font(FONT, "I", 8)
             self.set_text_color(150, 150, 150)
-            self.cell(0, 10, "CMS Handleiding \u2014 sanderveen.art", align="R")
+            self.cell(0, 10, self.header_text, align="R")
             self.ln(5)
 
     def footer(self):
         self.set_y(-15)
         self.set_font(FONT, "I", 8)
         self.set_text_color(150, 150, 150)
-        self.cell(0, 10, f"Pagina {self.page_no()}", align="C")
+        self.cell(0, 10, self.footer_text.format(self.page_no()), align="C")
 
 
-def build_pdf(md_path, output_path):
-    pdf = HandleidingPDF()
-    pdf.set_auto_page_break(auto=True, margin=20)
-
-    font_dir = "C:/Windows/Fonts/"
-    pdf.add_font(FONT, "", font_dir + "arial.ttf", uni=True)
-    pdf.add_font(FONT, "B", font_dir + "arialbd.ttf", uni=True)
-    pdf.add_font(FONT, "I", font_dir + "ariali.ttf", uni=True)
-    pdf.add_font(MONO, "", font_dir + "consola.ttf", uni=True)
+def inline_runs(text, base):
+    """Split **bold** and `code` markup into (style, text) runs, merging equal neighbours."""
+    bold = Style(FONT, "B", base.size, DARK)
+    code = Style(MONO, "", base.size - 1, MUTED)
+    runs = []
+    for part in re.split(r"(\*\*.*?\*\*|`[^`]+`)", text):
+        if not part:
+            continue
+        if part.startswith("**") and part.endswith("**") and len(part) > 4:
+            style, part = bold, part[2:-2]
+        elif part.startswith("`") and part.endswith("`") and len(part) > 2:
+            style, part = code, part[1:-1]
+        else:
+            style = base
+        if runs and runs[-1][0] == style:
+            runs[-1] = (style, runs[-1][1] + part)
+        else:
+            runs.append((style, part))
+    return runs
 
-    pdf.add_page()
 
-    with open(md_path, encoding="utf-8") as f:
-        lines = f.readlines()
+def write_rich_line(pdf, text, x_offset=10, base=STYLES["body"]):
+    """Write a line with **bold** and `code` formatting."""
+    pdf.set_x(x_offset)
+    for style, part in inline_runs(text, base):
+        pdf.use(style)
+        pdf.write(6, part)
 
-    gold = (184, 134, 11)
-    dark = (40, 40, 40)
-    muted = (100, 100, 100)
 
+def render(pdf, lines):
     for line in lines:
         line = line.rstrip("\n")
 
         # H1
         if line.startswith("# ") and not line.startswith("##"):
-            pdf.set_font(FONT, "B", 22)
-            pdf.set_text_color(*dark)
+            pdf.use(STYLES["h1"])
             pdf.ln(5)
             pdf.cell(0, 12, line[2:])
             pdf.ln(10)
-            pdf.set_draw_color(*gold)
+            pdf.set_draw_color(*GOLD)
             pdf.set_line_width(0.8)
             pdf.line(10, pdf.get_y(), 200, pdf.get_y())
             pdf.ln(8)
@@ -57,32 +298,24 @@ def build_pdf(md_path, output_path):
         # H2
         elif line.startswith("## "):
             pdf.ln(6)
-            pdf.set_font(FONT, "B", 14)
-            pdf.set_text_color(*gold)
+            pdf.use(STYLES["h2"])
             pdf.cell(0, 10, line[3:])
             pdf.ln(8)
 
         # Numbered list
         elif re.match(r"^\d+\.\s", line):
-            pdf.set_font(FONT, "", 11)
-            pdf.set_text_color(*dark)
-            write_rich_line(pdf, line.strip(), x_offset=12, dark=dark)
+            write_rich_line(pdf, line.strip(), x_offset=12)
             pdf.ln(6)
 
         # Sub-item (indented with -)
         elif re.match(r"^\s+-\s", line):
-            pdf.set_font(FONT, "", 10)
-            pdf.set_text_color(*muted)
             text = line.strip().lstrip("- ")
-            write_rich_line(pdf, f"  \u2022  {text}", x_offset=18, dark=dark, base_color=muted)
+            write_rich_line(pdf, f"  \u2022  {text}", x_offset=18, base=STYLES["sub"])
             pdf.ln(5)
 
         # Bullet list
         elif line.startswith("- "):
-            pdf.set_font(FONT, "", 11)
-            pdf.set_text_color(*dark)
-            text = line[2:].strip()
-            write_rich_line(pdf, f"\u2022  {text}", x_offset=12, dark=dark)
+            write_rich_line(pdf, f"\u2022  {line[2:].strip()}", x_offset=12)
             pdf.ln(6)
 
         # Empty line
@@ -91,40 +324,52 @@ def build_pdf(md_path, output_path):
 
         # Normal paragraph
         else:
-            pdf.set_font(FONT, "", 11)
-            pdf.set_text_color(*dark)
-            write_rich_line(pdf, line.strip(), x_offset=10, dark=dark)
+            write_rich_line(pdf, line.strip(), x_offset=10)
             pdf.ln(6)
 
-    pdf.output(output_path)
+
+def build_pdf(md_path, output_path, font_dir=None, force=False):
+    """Render `md_path` to `output_path`. Returns False when skipped as up to date."""
+    digest = source_hash(md_path)
+    if not force and embedded_hash(output_path) == digest:
+        print(f"Up to date: {output_path} (source unchanged)")
+        return False
+
+    text = Path(md_path).read_text(encoding="utf-8")
+    pdf = HandleidingPDF()
+    pdf.set_auto_page_break(auto=True, margin=20)
+    register_fonts(pdf, discover_fonts(font_dir), document_charset(text, HEADER_TEXT, FOOTER_TEXT))
+    pdf.set_creation_date(source_date(md_path))
+    pdf.set_keywords(MARKER + digest)
+
+    pdf.add_page()
+    render(pdf, text.splitlines())
+
+    tmp = Path(output_path).with_suffix(".tmp")
+    pdf.output(str(tmp))
+    os.replace(tmp, output_path)
     print(f"PDF saved to: {output_path}")
+    return True
 
 
-def write_rich_line(pdf, text, x_offset=10, dark=(40, 40, 40), base_color=None):
-    """Write a line with **bold** and `code` formatting."""
-    if base_color is None:
-        base_color = dark
-    pdf.set_x(x_offset)
-    parts = re.split(r'(\*\*.*?\*\*|`[^`]+`)', text)
-    for part in parts:
-        if part.startswith("**") and part.endswith("**"):
-            pdf.set_font(FONT, "B", pdf.font_size_pt)
-            pdf.set_text_color(*dark)
-            pdf.write(6, part[2:-2])
-            pdf.set_font(FONT, "", pdf.font_size_pt)
-            pdf.set_text_color(*base_color)
-        elif part.startswith("`") and part.endswith("`"):
-            pdf.set_font(MONO, "", pdf.font_size_pt - 1)
-            pdf.set_text_color(100, 100, 100)
-            pdf.write(6, part[1:-1])
-            pdf.set_font(FONT, "", pdf.font_size_pt)
-            pdf.set_text_color(*base_color)
-        else:
-            pdf.write(6, part)
+def main():
+    parser = argparse.ArgumentParser(description="Render the CMS handleiding (or any simple markdown) to PDF")
+    parser.add_argument("input", nargs="?", type=Path, default=DEFAULT_INPUT, help="Markdown source")
+    parser.add_argument("-o", "--output", type=Path, help="PDF to write (default: docs/CMS-Handleiding-SanderVeen.pdf for the default input, else <input>.pdf)")
+    parser.add_argument("--font-dir", help="Extra directory to search for TrueType fonts")
+    parser.add_argument("--force", action="store_true", help="Render even if the PDF matches the source")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the PDF does not match the source")
+    args = parser.parse_args()
+
+    output = args.output or (DEFAULT_OUTPUT if args.input == DEFAULT_INPUT else args.input.with_suffix(".pdf"))
+    if args.check:
+        if embedded_hash(output) != source_hash(args.input):
+            print(f"{output} is out of date — run: python scripts/md_to_pdf.py")
+            sys.exit(1)
+        print(f"{output} is up to date")
+        return
+    build_pdf(args.input, output, font_dir=args.font_dir, force=args.force)
 
 
 if __name__ == "__main__":
-    build_pdf(
-        r"C:\local_dev\sanderveen.art\docs\CMS-HANDLEIDING.md",
-        r"C:\local_dev\sanderveen.art\docs\CMS-Handleiding-SanderVeen.pdf",
-    )
+    main()
@@ -0,0 +1,327 @@
+"""
+Offline ffmpeg pipeline for static/videos: faststart, mobile rendition, poster.
+
+For every source clip in static/videos/*.mp4 this:
+  - remuxes it in place with the moov atom in front (`-movflags +faststart`)
+    when it isn't already, so playback starts before the download finishes
+  - encodes a `<slug>-mobile.mp4` at half the source bitrate (short side
+    ≤ 360px), kept only when it is meaningfully smaller than the source
+  - extracts `<slug>.jpg` as poster when none exists (hand-picked posters are
+    never overwritten)
+  - records duration, dimensions and sizes in data/videos.json, which
+    video-embed.html reads for the poster, the mobile <source> and the
+    width/height attributes
+
+Durations and dimensions come from the MP4 boxes themselves (no ffprobe).
+data/videos.json also stores each clip's SHA-256 and the encoding parameters,
+and is committed with the renditions, so a clip is only processed when it is
+new, replaced, re-parametrised or its mobile file is missing. A fresh clone
+does not re-encode anything (x264 output is not bit-identical across
+machines, so that would churn the committed -mobile.mp4 files).
+
+Usage:
+    python scripts/optimize_videos.py              # process new clips, update data/videos.json
+    python scripts/optimize_videos.py --dry-run    # report what would be done
+    python scripts/optimize_videos.py --check      # exit 1 if any clip is unprocessed (CI)
+    python scripts/optimize_videos.py --ffmpeg /path/to/ffmpeg
+
+Requires ffmpeg on PATH (or --ffmpeg).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+VIDEOS = ROOT / "static" / "videos"
+DATA_PATH = ROOT / "data" / "videos.json"
+
+MOBILE_SUFFIX = "-mobile"
+MOBILE_SHORT_SIDE = 360
+MOBILE_CRF = 28
+MOBILE_BITRATE_FACTOR = 0.5  # video maxrate as a fraction of the source's overall bitrate
+MOBILE_MIN_KBPS = 250
+MOBILE_AUDIO_KBPS = 64
+MOBILE_MIN_SAVING = 0.25     # drop the rendition unless it is at least 25% smaller
+POSTER_AT = 1.0              # seconds (clamped to the middle of very short clips)
+PARAMS = (f"short={MOBILE_SHORT_SIDE};crf={MOBILE_CRF};factor={MOBILE_BITRATE_FACTOR};"
+          f"min={MOBILE_MIN_KBPS};a={MOBILE_AUDIO_KBPS}")
+
+CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl", b"edts"}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# MP4 box reading
+# ---------------------------------------------------------------------------
+
+def iter_boxes(f, start, end):
+    """Yield (type, payload_offset, box_end) for the boxes in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, pos + size
+        pos += size
+
+
+def probe_mp4(path):
+    """Read layout, duration and display size straight from the MP4 boxes.
+
+    Returns {"faststart", "duration", "width", "height"}; duration is None when
+    there is no movie header, width/height are None without a video track.
+    """
+    info = {"faststart": False, "duration": None, "width": None, "height": None}
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        top = [(kind, payload, box_end) for kind, payload, box_end in iter_boxes(f, 0, end)]
+        order = [kind for kind, _, _ in top]
+        if b"moov" in order and b"mdat" in order:
+            info["faststart"] = order.index(b"moov") < order.index(b"mdat")
+
+        def walk(start, stop):
+            for kind, payload, box_end in iter_boxes(f, start, stop):
+                if kind in CONTAINER_BOXES:
+                    walk(payload, box_end)
+                elif kind == b"mvhd":
+                    f.seek(payload)
+                    version = f.read(1)[0]
+                    if version == 1:
+                        f.seek(payload + 20)
+                        timescale, duration = struct.unpack(">IQ", f.read(12))
+                    else:
+                        f.seek(payload + 12)
+                        timescale, duration = struct.unpack(">II", f.read(8))
+                    if timescale:
+                        info["duration"] = round(duration / timescale, 2)
+                elif kind == b"tkhd":
+                    # Width/height are the last 8 bytes (16.16 fixed point)
+                    f.seek(box_end - 8)
+                    w, h = struct.unpack(">II", f.read(8))
+                    if w and h and info["width"] is None:
+                        # 90°/270° rotation matrix: a == 0 (matrix starts 40 bytes before the end)
+                        f.seek(box_end - 44)
+                        a = struct.unpack(">i", f.read(4))[0]
+                        w, h = w >> 16, h >> 16
+                        info["width"], info["height"] = (h, w) if a == 0 else (w, h)
+
+        for kind, payload, box_end in top:
+            if kind == b"moov":
+                walk(payload, box_end)
+    return info
+
+
+# ---------------------------------------------------------------------------
+# ffmpeg steps
+# ---------------------------------------------------------------------------
+
+def run_ffmpeg(ffmpeg, args):
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", *args]
+    proc = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed ({' '.join(cmd)}):\n{proc.stderr.strip()}")
+
+
+def faststart(ffmpeg, path):
+    """Remux `path` in place with the moov atom first. Stream data is copied."""
+    tmp = path.with_name(path.stem + ".faststart.tmp.mp4")
+    try:
+        run_ffmpeg(ffmpeg, ["-i", str(path), "-map", "0", "-c", "copy", "-movflags", "+faststart", str(tmp)])
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def mobile_maxrate(size, duration):
+    """Video maxrate in kbit/s for the mobile rendition."""
+    if not duration:
+        return MOBILE_MIN_KBPS
+    source_kbps = size * 8 / duration / 1000
+    return max(MOBILE_MIN_KBPS, round(source_kbps * MOBILE_BITRATE_FACTOR) - MOBILE_AUDIO_KBPS)
+
+
+def encode_mobile(ffmpeg, src, dst, maxrate):
+    # Scale the short side down to MOBILE_SHORT_SIDE (never up); -2 keeps the
+    # other side even for yuv420p.
+    s = MOBILE_SHORT_SIDE
+    scale = f"scale='if(gt(iw,ih),-2,min({s},iw))':'if(gt(iw,ih),min({s},ih),-2)'"
+    tmp = dst.with_name(dst.stem + ".tmp.mp4")
+    try:
+        run_ffmpeg(ffmpeg, [
+            "-i", str(src), "-vf", scale,
+            "-c:v", "libx264", "-preset", "slow", "-crf", str(MOBILE_CRF),
+            "-maxrate", f"{maxrate}k", "-bufsize", f"{maxrate * 2}k", "-pix_fmt", "yuv420p",
+            "-c:a", "aac", "-b:a", f"{MOBILE_AUDIO_KBPS}k",
+            "-movflags", "+faststart", str(tmp),
+        ])
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def extract_poster(ffmpeg, src, dst, duration):
+    at = POSTER_AT if not duration or duration > POSTER_AT * 2 else duration / 2
+    run_ffmpeg(ffmpeg, ["-ss", f"{at:.2f}", "-i", str(src), "-frames:v", "1", "-q:v", "3", str(dst)])
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def source_videos():
+    return sorted(p for p in VIDEOS.glob("*.mp4") if not p.stem.endswith(MOBILE_SUFFIX) and ".tmp" not in p.name)
+
+
+def rel(path):
+    return path.relative_to(ROOT / "static").as_posix()
+
+
+def process(path, ffmpeg, dry_run):
+    """Run the pipeline for one clip. Returns (data entry, actions taken)."""
+    actions = []
+    info = probe_mp4(path)
+    if not info["faststart"]:
+        actions.append("faststart")
+        if not dry_run:
+            faststart(ffmpeg, path)
+            info = probe_mp4(path)
+
+    entry = {
+        "bytes": path.stat().st_size,
+        "duration": info["duration"],
+        "width": info["width"],
+        "height": info["height"],
+        "mobile": None,
+        "poster": None,
+    }
+
+    mobile = path.with_name(path.stem + MOBILE_SUFFIX + ".mp4")
+    actions.append("mobile")
+    if not dry_run:
+        encode_mobile(ffmpeg, path, mobile, mobile_maxrate(entry["bytes"], entry["duration"]))
+        size = mobile.stat().st_size
+        if size <= entry["bytes"] * (1 - MOBILE_MIN_SAVING):
+            m = probe_mp4(mobile)
+            entry["mobile"] = {"src": rel(mobile), "bytes": size, "width": m["width"], "height": m["height"]}
+        else:
+            mobile.unlink()
+            actions[-1] = "mobile (dropped: not smaller)"
+
+    poster = path.with_suffix(".jpg")
+    if not poster.exists():
+        actions.append("poster")
+        if not dry_run:
+            extract_poster(ffmpeg, path, poster, info["duration"])
+    if poster.exists():
+        entry["poster"] = rel(poster)
+    return entry, actions
+
+
+def is_current(entry, digest):
+    """True when data/videos.json already describes this exact clip and its rendition."""
+    if not entry or entry.get("params") != PARAMS or entry.get("sha256") != digest:
+        return False
+    return not entry["mobile"] or (ROOT / "static" / entry["mobile"]["src"]).exists()
+
+
+def render(data):
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Faststart, mobile rendition and poster for static/videos")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg binary")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be done without writing")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a clip is missing from data/videos.json or changed")
+    parser.add_argument("--force", action="store_true", help="Reprocess every clip, even if data/videos.json matches")
+    args = parser.parse_args()
+
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8")) if DATA_PATH.exists() else {}
+    sources = source_videos()
+
+    if args.check:
+        stale = [rel(p) for p in sources if not is_current(data.get(rel(p)), file_hash(p))]
+        gone = sorted(set(data) - {rel(p) for p in sources})
+        for name in stale:
+            print(f"  unprocessed: {name}")
+        for name in gone:
+            print(f"  no longer exists: {name}")
+        if stale or gone:
+            print("data/videos.json is out of date — run: python scripts/optimize_videos.py")
+            sys.exit(1)
+        print(f"data/videos.json is up to date ({len(sources)} videos)")
+        return
+
+    pending = {p for p in sources if args.force or not is_current(data.get(rel(p)), file_hash(p))}
+    if pending and not args.dry_run and not shutil.which(args.ffmpeg):
+        print(f"ffmpeg not found: {args.ffmpeg} (install ffmpeg or pass --ffmpeg)")
+        sys.exit(2)
+
+    fresh, processed, failed = {}, 0, 0
+    for path in sources:
+        name = rel(path)
+        known = data.get(name)
+        if path not in pending:
+            fresh[name] = known
+            continue
+        try:
+            entry, actions = process(path, args.ffmpeg, args.dry_run)
+        except RuntimeError as e:
+            print(f"  [ERROR] {name}: {e}")
+            failed += 1
+            if known:
+                fresh[name] = known
+            continue
+        processed += 1
+        print(f"  {name}: {', '.join(actions)}")
+        if not args.dry_run:
+            # Hash after the faststart remux: that is the file that gets committed
+            fresh[name] = {**entry, "params": PARAMS, "sha256": file_hash(path)}
+
+    orphans = sorted(p.name for p in VIDEOS.glob("*.jpg") if not p.with_suffix(".mp4").exists())
+    for name in orphans:
+        print(f"  [WARNING] poster without video: videos/{name}")
+
+    if args.dry_run:
+        print(f"\nDry run: {processed} of {len(sources)} videos would be processed")
+        return
+
+    data = dict(sorted(fresh.items()))
+    text = render(data)
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+    if current != text:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    full = sum(e["bytes"] for e in data.values())
+    mobile = sum((e["mobile"] or e)["bytes"] for e in data.values())
+    print(f"\nVideos:   {len(sources)} ({processed} processed, {len(sources) - processed - failed} unchanged, {failed} failed)")
+    if full:
+        print(f"Bytes:    {full / 1e6:.1f} MB full, {mobile / 1e6:.1f} MB on mobile ({(1 - mobile / full) * 100:.0f}% less)")
+    print(f"Written:  {DATA_PATH.relative_to(ROOT)}" if current != text else "Unchanged: data/videos.json")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Plan responsive srcset widths from the actual pixel size of every source image.
+
+Reads the dimensions of every image under assets/images into a cached index
+(only changed files are re-read), computes a width ladder per image that never
+exceeds the source width, and writes data/imagesizes.json. The picture.html
+partial and schilderijen/single.html iterate over these widths to build real
+srcset attributes, so small masters are never upscaled and large ones ship
+several widths.
+
+Usage:
+    python scripts/plan_srcset.py           # update data/imagesizes.json
+    python scripts/plan_srcset.py --check   # exit 1 if the data file is stale (CI)
+
+Only image headers are read (image_header.py), no Pillow needed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_header import IMAGE_EXTS, read_headers  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+ASSETS = ROOT / "assets"
+IMAGES = ASSETS / "images"
+DATA_PATH = ROOT / "data" / "imagesizes.json"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "image-dimensions.json"
+CACHE_VERSION = 2  # bump when the stored entry changes
+
+# Candidate widths. Each image gets the steps below its own width, plus its own
+# width as the top step when that adds enough over the last step.
+LADDER = [400, 600, 800, 1200, 1600, 2000]
+MAX_WIDTH = LADDER[-1]
+MIN_STEP_GAIN = 1.15  # top step must be >=15% wider than the previous one
+
+
+def load_index(cache_path=CACHE_PATH):
+    """Dimension index for every image under assets/images, reusing the cache.
+
+    Returns {"images/...": {"width", "height", "format", "orientation"}} with
+    width/height as stored, ignoring EXIF orientation: Hugo's Resize works on
+    the stored pixels too, so that is the size the ladder must not exceed.
+    Changed files are read in parallel, headers only.
+    """
+    cache = {}
+    if cache_path.exists():
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cache.pop("_version", None) != CACHE_VERSION:
+            cache = {}
+
+    files, changed = {}, []
+    for path in sorted(IMAGES.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in IMAGE_EXTS:
+            continue
+        rel = path.relative_to(ASSETS).as_posix()
+        st = path.stat()
+        files[rel] = st
+        entry = cache.get(rel)
+        if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+            changed.append(path)
+
+    headers = read_headers(changed)
+    index, fresh = {}, {}
+    for rel, st in files.items():
+        path = ASSETS / rel
+        if path in headers:
+            info = headers[path]
+            if isinstance(info, Exception):
+                print(f"  [WARNING] {rel}: can't read image header ({info})")
+                continue
+            entry = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "width": info.width,
+                "height": info.height,
+                "format": info.format,
+                "orientation": info.orientation,
+            }
+        else:
+            entry = cache[rel]
+        fresh[rel] = entry
+        index[rel] = {k: entry[k] for k in ("width", "height", "format", "orientation")}
+
+    if changed or set(fresh) != set(cache):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"_version": CACHE_VERSION, **fresh}, indent=1, sort_keys=True),
+                              encoding="utf-8")
+    return index, len(changed)
+
+
+def plan_widths(source_width, ladder=LADDER):
+    """Width ladder for one image: never wider than the source or MAX_WIDTH."""
+    cap = min(source_width, ladder[-1])
+    widths = [w for w in ladder if w < cap]
+    if not widths or cap >= widths[-1] * MIN_STEP_GAIN:
+        widths.append(cap)
+    else:
+        # Source is just above a step: serve the source width instead of that step
+        widths[-1] = cap
+    return widths
+
+
+def build_plan(index):
+    return {
+        rel: {"width": info["width"], "height": info["height"], "widths": plan_widths(info["width"])}
+        for rel, info in sorted(index.items())
+    }
+
+
+def render(plan):
+    return json.dumps(plan, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan srcset widths from source image dimensions")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if data/imagesizes.json is out of date")
+    args = parser.parse_args()
+
+    index, reread = load_index()
+    plan = build_plan(index)
+    text = render(plan)
+
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+    if args.check:
+        if current != text:
+            print(f"{DATA_PATH.relative_to(ROOT)} is out of date — run: python scripts/plan_srcset.py")
+            sys.exit(1)
+        print(f"{DATA_PATH.relative_to(ROOT)} is up to date ({len(plan)} images)")
+        return
+
+    if current != text:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    derivatives = sum(len(p["widths"]) for p in plan.values())
+    capped = sum(1 for p in plan.values() if p["width"] < MAX_WIDTH)
+    print(f"Images:        {len(plan)} ({reread} re-read, {len(plan) - reread} from cache)")
+    print(f"Widths:        {derivatives} total, {derivatives / max(len(plan), 1):.1f} per image")
+    print(f"Below {MAX_WIDTH}px:  {capped} (ladder capped at source width)")
+    print(f"Written:       {DATA_PATH.relative_to(ROOT)}" if current != text else "Unchanged:     data/imagesizes.json")
+
+
+if __name__ == "__main__":
+    main()
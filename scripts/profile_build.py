@@ -0,0 +1,226 @@
+"""
+Profile a Hugo build with template metrics and keep a history of runs.
+
+Runs `hugo --templateMetrics --templateMetricsHints`, parses the per-template
+cumulative/average/maximum durations, appends the run to a local JSON-lines
+history file and flags templates whose cumulative time grew beyond a threshold
+compared with the previous run.
+
+Usage:
+    python scripts/profile_build.py                     # warm build, compare with last run
+    python scripts/profile_build.py --cold              # --ignoreCache: include image processing
+    python scripts/profile_build.py --threshold 0.5     # flag templates >50% slower
+    python scripts/profile_build.py --from-file out.txt # parse saved hugo output instead of building
+    python scripts/profile_build.py --history           # show the recorded runs
+
+History: scripts/.cache/build-profile.jsonl (gitignored)
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY_PATH = Path(__file__).resolve().parent / ".cache" / "build-profile.jsonl"
+
+# Go time.Duration strings as printed by Hugo, e.g. "1m2.5s", "12.345ms", "56.7µs"
+DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 1e-3, "us": 1e-6, "µs": 1e-6, "μs": 1e-6, "ns": 1e-9}
+DURATION_RE = re.compile(r"([\d.]+)(h|ms|m|s|us|µs|μs|ns)")
+DURATION_TOKEN = r"(?:[\d.]+(?:h|ms|m|s|us|µs|μs|ns))+"
+METRIC_LINE_RE = re.compile(
+    rf"^\s*({DURATION_TOKEN})\s+({DURATION_TOKEN})\s+({DURATION_TOKEN})\s+((?:\d+\s+)*?)(\S+)\s*$"
+)
+TOTAL_RE = re.compile(r"Total in (\d+) ms")
+
+
+def parse_duration(text):
+    """Convert a Go duration string to seconds."""
+    return sum(float(num) * DURATION_UNITS[unit] for num, unit in DURATION_RE.findall(text))
+
+
+def parse_metrics(output):
+    """Parse Hugo's template-metrics table.
+
+    Returns {template: {"cumulative", "average", "maximum", "count", ...}} with
+    durations in seconds. With --templateMetricsHints the cache columns
+    (potential %, percent cached, cached count) are included as well.
+    """
+    templates = {}
+    for line in output.splitlines():
+        m = METRIC_LINE_RE.match(line)
+        if not m:
+            continue
+        ints = [int(n) for n in m.group(4).split()]
+        entry = {
+            "cumulative": parse_duration(m.group(1)),
+            "average": parse_duration(m.group(2)),
+            "maximum": parse_duration(m.group(3)),
+            "count": ints[-1] if ints else 0,
+        }
+        if len(ints) == 4:
+            entry["cache_potential"] = ints[0]
+            entry["percent_cached"] = ints[1]
+            entry["cached_count"] = ints[2]
+        templates[m.group(5)] = entry
+    return templates
+
+
+def run_hugo(hugo, cold, extra_args):
+    cmd = [hugo, "--templateMetrics", "--templateMetricsHints", "--renderToMemory"]
+    if cold:
+        cmd.append("--ignoreCache")
+    cmd.extend(extra_args)
+    print(f"Running: {' '.join(cmd)}")
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(proc.stdout)
+        print(proc.stderr, file=sys.stderr)
+        sys.exit(proc.returncode)
+    return proc.stdout + proc.stderr, wall
+
+
+def git_head():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_history():
+    if not HISTORY_PATH.exists():
+        return []
+    runs = []
+    for line in HISTORY_PATH.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            runs.append(json.loads(line))
+    return runs
+
+
+def append_history(run):
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def find_regressions(current, previous, threshold, min_seconds):
+    """Templates whose cumulative time grew by more than `threshold` (fraction).
+
+    Templates under `min_seconds` in the current run are ignored as noise.
+    """
+    regressions = []
+    for name, now in current.items():
+        before = previous.get(name)
+        if not before or now["cumulative"] < min_seconds or before["cumulative"] <= 0:
+            continue
+        growth = now["cumulative"] / before["cumulative"] - 1
+        if growth > threshold:
+            regressions.append((name, before["cumulative"], now["cumulative"], growth))
+    return sorted(regressions, key=lambda r: -r[3])
+
+
+def fmt_s(seconds):
+    return f"{seconds * 1000:.1f} ms" if seconds < 1 else f"{seconds:.2f} s"
+
+
+def print_run(run, top):
+    templates = run["templates"]
+    print(f"\n{'='*78}")
+    print(f"  Hugo build profile — {run['timestamp']} ({run['commit'] or 'no commit'}, {'cold' if run['cold'] else 'warm'})")
+    print(f"{'='*78}")
+    if run.get("total_ms") is not None:
+        print(f"  Hugo total:     {run['total_ms']} ms")
+    if run.get("wall_seconds") is not None:
+        print(f"  Wall time:      {fmt_s(run['wall_seconds'])}")
+    print(f"  Templates:      {len(templates)}")
+    print(f"{'='*78}\n")
+    print(f"  {'cumulative':>11} {'average':>11} {'count':>6} {'cached%':>7}  template")
+    ranked = sorted(templates.items(), key=lambda kv: -kv[1]["cumulative"])
+    for name, t in ranked[:top]:
+        cached = f"{t['percent_cached']}" if "percent_cached" in t else "-"
+        print(f"  {fmt_s(t['cumulative']):>11} {fmt_s(t['average']):>11} {t['count']:>6} {cached:>7}  {name}")
+    print()
+
+
+def print_history(runs):
+    print(f"\n  {'timestamp':<26} {'commit':<9} {'mode':<5} {'total ms':>9}  slowest template")
+    for run in runs:
+        slowest = max(run["templates"].items(), key=lambda kv: kv[1]["cumulative"], default=("-", {"cumulative": 0}))
+        total = run.get("total_ms")
+        print(
+            f"  {run['timestamp']:<26} {run['commit'] or '-':<9} {'cold' if run['cold'] else 'warm':<5} "
+            f"{total if total is not None else '-':>9}  {slowest[0]} ({fmt_s(slowest[1]['cumulative'])})"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile Hugo template rendering and track it over time")
+    parser.add_argument("--hugo", default="hugo", help="Hugo binary")
+    parser.add_argument("--cold", action="store_true", help="Pass --ignoreCache (includes image processing)")
+    parser.add_argument("--from-file", type=Path, help="Parse saved Hugo output instead of running a build")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Flag templates whose cumulative time grew by this fraction")
+    parser.add_argument("--min-ms", type=float, default=20.0, help="Ignore templates faster than this in the current run")
+    parser.add_argument("--top", type=int, default=15, help="Templates to list")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the history")
+    parser.add_argument("--history", action="store_true", help="Print the recorded runs and exit")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when a template regressed")
+    parser.add_argument("hugo_args", nargs="*", help="Extra arguments for hugo (after --)")
+    args = parser.parse_args()
+
+    history = load_history()
+    if args.history:
+        print_history(history)
+        return
+
+    if args.from_file:
+        output, wall = args.from_file.read_text(encoding="utf-8"), None
+    else:
+        output, wall = run_hugo(args.hugo, args.cold, args.hugo_args)
+
+    templates = parse_metrics(output)
+    if not templates:
+        print("No template metrics found in Hugo output.")
+        sys.exit(2)
+
+    total = TOTAL_RE.search(output)
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_head(),
+        "cold": args.cold,
+        "total_ms": int(total.group(1)) if total else None,
+        "wall_seconds": wall,
+        "templates": templates,
+    }
+    print_run(run, args.top)
+
+    # Compare against the last run of the same kind: cold and warm builds differ by ~10×
+    previous = next((r for r in reversed(history) if r.get("cold") == args.cold), None)
+    regressions = []
+    if previous:
+        regressions = find_regressions(templates, previous["templates"], args.threshold, args.min_ms / 1000)
+        if regressions:
+            print(f"  REGRESSIONS vs. {previous['timestamp']} ({previous['commit'] or '-'}):")
+            print(f"  {'-'*40}")
+            for name, before, now, growth in regressions:
+                print(f"  {name}: {fmt_s(before)} -> {fmt_s(now)} (+{growth * 100:.0f}%)")
+            print()
+        else:
+            print(f"  No template grew more than {args.threshold * 100:.0f}% vs. {previous['timestamp']}.\n")
+
+    if not args.no_save:
+        append_history(run)
+
+    sys.exit(1 if regressions and args.fail_on_regression else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Query the content front matter: filter, sort and group paintings, workshops
+and exhibitions without grepping through content/.
+
+Every collection in validate_content.COLLECTIONS is loaded into a columnar
+in-memory table (one list per field, shared across rows), with a few derived
+columns:
+
+    all          lang, file, slug (file stem), <list field>_count (gallery_count, videos_count)
+    paintings    height_cm, width_cm (dimensions are "height x width", corrected by
+                 data/paintingsizes.json where the photo shows them swapped), year as a number
+    dates        date, start_date, end_date parsed to dates; free text such as
+                 "8 november 2024", "Februari 2026" or "2025" resolves to its first day
+
+Parsed front matter is cached by mtime in scripts/.cache/query-content.json,
+so repeat queries only re-read files that changed.
+
+Conditions (--where, repeatable, ANDed):
+    field=value  field!=value  field>n  field>=n  field<n  field<=n
+    field~text   (case-insensitive substring; for lists: any item)
+    field        (non-empty)     !field   (empty / missing)
+
+Usage:
+    python scripts/query_content.py paintings --where status=available --where category=Surrealistisch --where "width_cm>100"
+    python scripts/query_content.py exhibitions --where gallery_count --where "!videos_count" --fields title,location
+    python scripts/query_content.py paintings --group category --lang all
+    python scripts/query_content.py paintings --sort=-width_cm --limit 5 --format csv
+    python scripts/query_content.py paintings --columns
+
+From Python:
+    from query_content import load_tables
+    tables = load_tables()
+    tables["paintings"].select(["status=available", ("width_cm", ">", 100)], order_by=["-width_cm"])
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from validate_content import COLLECTIONS, ROOT, parse_dimensions, parse_front_matter  # noqa: E402
+
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "query-content.json"
+CACHE_VERSION = 3  # bump when extract_row changes
+SIZES_PATH = ROOT / "data" / "paintingsizes.json"
+
+LANGS = ("nl", "en")
+DATE_FIELDS = ("date", "start_date", "end_date")
+MONTHS = {
+    name: i + 1
+    for names in (
+        ("januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus",
+         "september", "oktober", "november", "december"),
+        ("january", "february", "march", "april", "may", "june", "july", "august",
+         "september", "october", "november", "december"),
+    )
+    for i, name in enumerate(names)
+}
+CONDITION_RE = re.compile(r"^\s*(!?)(\w+)\s*(?:(>=|<=|!=|=|>|<|~)\s*(.*?))?\s*$")
+
+
+# --- Parsing ---
+
+def parse_date(value):
+    """ISO date string for a front matter date, or None if it can't be read."""
+    text = str(value).strip().lower()
+    m = re.match(r"^(\d{4})-(\d{2})-(\d{2})", text)
+    if m:
+        return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
+    m = re.match(r"^(\d{1,2})-(\d{1,2})-(\d{4})$", text)  # DD-MM-YYYY, as typed in some content
+    if m:
+        return f"{m.group(3)}-{int(m.group(2)):02d}-{int(m.group(1)):02d}"
+    m = re.match(r"^(?:(\d{1,2})\s+)?([a-z]+)\s+(\d{4})$", text)
+    if m and m.group(2) in MONTHS:
+        return f"{m.group(3)}-{MONTHS[m.group(2)]:02d}-{int(m.group(1) or 1):02d}"
+    m = re.match(r"^(\d{4})$", text)
+    if m:
+        return f"{m.group(1)}-01-01"
+    return None
+
+
+def extract_row(collection, lang, path):
+    """Cacheable row (JSON types only) for one content file, or None if unparseable."""
+    fm = parse_front_matter(path)
+    if not fm:
+        return None
+    row = {"lang": lang, "file": path.relative_to(ROOT).as_posix(), "slug": path.stem}
+    for key, value in fm.items():
+        row[key] = value
+        if isinstance(value, list):
+            row[f"{key}_count"] = len(value)
+    for key in ("gallery", "videos"):
+        if isinstance(row.get(key), str):  # single value written without list syntax
+            row[f"{key}_count"] = 1 if row[key] else 0
+    for key in DATE_FIELDS:
+        if key in row:
+            row[key] = parse_date(row[key]) or row[key]
+    if "weight" in row:
+        weight = str(row["weight"]).strip()
+        row["weight"] = int(weight) if re.fullmatch(r"-?\d+", weight) else None
+    if collection == "paintings":
+        row["height_cm"], row["width_cm"] = parse_dimensions(fm.get("dimensions", "")) or (None, None)
+        year = str(fm.get("year", "")).strip()
+        row["year"] = int(year) if year.isdigit() else None
+    return row
+
+
+def load_rows(cache_path=CACHE_PATH):
+    """{collection: [row, ...]}, re-parsing only files whose mtime/size changed."""
+    cache = {}
+    if cache_path.exists():
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cache.pop("_version", None) != CACHE_VERSION:
+            cache = {}
+    rows, fresh, parsed = {name: [] for name in COLLECTIONS}, {}, 0
+    for collection, langs in COLLECTIONS.items():
+        for lang in LANGS:
+            for path in sorted(langs[lang]["folder"].glob("*.md")):
+                if path.name == "_index.md":
+                    continue
+                rel = path.relative_to(ROOT).as_posix()
+                st = path.stat()
+                entry = cache.get(rel)
+                if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+                    entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "row": extract_row(collection, lang, path)}
+                    parsed += 1
+                fresh[rel] = entry
+                if entry["row"]:
+                    rows[collection].append(entry["row"])
+
+    if parsed or set(fresh) != set(cache):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"_version": CACHE_VERSION, **fresh}, sort_keys=True), encoding="utf-8")
+    return rows, parsed
+
+
+# --- Tables ---
+
+def _kind(values):
+    """Column type from its values: date, number, bool, list or str."""
+    kinds = set()
+    for v in values:
+        if v is None:
+            continue
+        if isinstance(v, bool):
+            kinds.add("bool")
+        elif isinstance(v, (int, float)):
+            kinds.add("number")
+        elif isinstance(v, list):
+            kinds.add("list")
+        elif isinstance(v, date):
+            kinds.add("date")
+        else:
+            kinds.add("str")
+    return kinds.pop() if len(kinds) == 1 else "str"
+
+
+class Table:
+    """Rows of one collection stored column-wise: {column: [value per row]}."""
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.size = len(rows)
+        names = []
+        for row in rows:
+            names.extend(k for k in row if k not in names)
+        self.columns = {c: [row.get(c) for row in rows] for c in names}
+        for c in DATE_FIELDS:
+            if c in self.columns:
+                self.columns[c] = [_to_date(v) for v in self.columns[c]]
+        self.kinds = {c: _kind(values) for c, values in self.columns.items()}
+        for c in DATE_FIELDS:
+            if c in self.columns:
+                self.kinds[c] = "date"  # unparseable free text stays a string and never matches a comparison
+        self._indexes = {}
+
+    def index(self, column):
+        """{value: [row ids]} for equality lookups, built on first use."""
+        if column not in self._indexes:
+            idx = {}
+            for i, v in enumerate(self.columns[column]):
+                for item in (v if isinstance(v, list) else [v]):
+                    idx.setdefault(_norm(item), []).append(i)
+            self._indexes[column] = idx
+        return self._indexes[column]
+
+    def row(self, i, fields=None):
+        return {c: self.columns[c][i] for c in (fields or self.columns)}
+
+    def _coerce(self, column, text):
+        kind = self.kinds[column]
+        try:
+            if kind == "number":
+                return float(text)
+            if kind == "date":
+                return _to_date(parse_date(text) or text)
+            if kind == "bool":
+                return text.lower() in ("true", "yes", "1")
+        except ValueError:
+            raise ValueError(f"{column}: can't compare {kind} column with {text!r}") from None
+        return text
+
+    def _matching(self, column, op, value, rows):
+        if column not in self.columns:
+            raise ValueError(f"unknown column {column!r} in {self.name} (see --columns)")
+        values = self.columns[column]
+        if op in ("truthy", "falsy"):
+            want = op == "truthy"
+            return [i for i in rows if bool(values[i]) == want]
+        if op == "~":
+            needle = str(value).lower()
+            return [i for i in rows if any(needle in str(item).lower()
+                                           for item in (values[i] if isinstance(values[i], list) else [values[i]])
+                                           if item is not None)]
+        target = self._coerce(column, str(value)) if isinstance(value, str) else value
+        if op == "=":
+            hits = set(self.index(column).get(_norm(target), ()))
+            return [i for i in rows if i in hits]
+        if op == "!=":
+            hits = set(self.index(column).get(_norm(target), ()))
+            return [i for i in rows if i not in hits]
+        compare = {">": lambda a, b: a > b, ">=": lambda a, b: a >= b,
+                   "<": lambda a, b: a < b, "<=": lambda a, b: a <= b}[op]
+        out = []
+        for i in rows:
+            v = values[i]
+            if v is None or isinstance(v, list):
+                continue
+            try:
+                if compare(v, target):
+                    out.append(i)
+            except TypeError:
+                continue  # e.g. free-text date that didn't parse
+        return out
+
+    def filter(self, where=()):
+        """Row ids matching every condition (strings like "width_cm>100" or (column, op, value) tuples)."""
+        rows = list(range(self.size))
+        for cond in where:
+            column, op, value = parse_condition(cond) if isinstance(cond, str) else cond
+            rows = self._matching(column, op, value, rows)
+        return rows
+
+    def select(self, where=(), order_by=(), fields=None, limit=None):
+        """Matching rows as dicts. order_by: column names, "-column" for descending; missing values last."""
+        for f in fields or ():
+            if f not in self.columns:
+                raise ValueError(f"unknown column {f!r} in {self.name} (see --columns)")
+        rows = self.filter(where)
+        for key in reversed(list(order_by)):
+            desc = key.startswith("-")
+            column = key.lstrip("-")
+            if column not in self.columns:
+                raise ValueError(f"unknown column {column!r} in {self.name} (see --columns)")
+            values = self.columns[column]
+            present = [i for i in rows if values[i] not in (None, "", [])]
+            missing = [i for i in rows if values[i] in (None, "", [])]
+            present.sort(key=lambda i: _sort_key(values[i]), reverse=desc)
+            rows = present + missing
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.row(i, fields) for i in rows]
+
+    def group(self, column, where=()):
+        """{value: row count} over matching rows, largest groups first."""
+        if column not in self.columns:
+            raise ValueError(f"unknown column {column!r} in {self.name} (see --columns)")
+        counts = {}
+        values = self.columns[column]
+        for i in self.filter(where):
+            for item in (values[i] if isinstance(values[i], list) else [values[i]]):
+                counts[item] = counts.get(item, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: (-kv[1], _sort_key(kv[0]))))
+
+
+def _to_date(value):
+    if isinstance(value, str) and re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+        return date.fromisoformat(value)
+    return value
+
+
+def _norm(value):
+    """Index key: case-insensitive for text, numbers compared as floats."""
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _sort_key(value):
+    if isinstance(value, str):
+        return (1, value.lower())
+    if isinstance(value, list):
+        return (1, str(value))
+    return (0, value) if value is not None else (2, "")
+
+
+def parse_condition(text):
+    """("width_cm", ">", "100") from "width_cm>100"; bare "gallery" / "!videos" test presence."""
+    m = CONDITION_RE.match(text)
+    if not m:
+        raise ValueError(f"can't parse condition {text!r}")
+    negate, column, op, value = m.groups()
+    if op is None:
+        return column, "falsy" if negate else "truthy", None
+    if negate:
+        raise ValueError(f"'!' only applies to bare fields: {text!r}")
+    return column, op, value
+
+
+def physical_size(row, sizes):
+    """(height_cm, width_cm) of a painting row, checked against its photo.
+
+    index_dimensions.py's entry wins when the photo agrees with it, with height
+    and width exchanged when it found them written the wrong way round. A
+    missing entry or an unexplained mismatch keeps the parsed front matter.
+    """
+    entry = sizes.get(str(row.get("image", "")).lstrip("/"))
+    if entry and entry.get("swapped"):
+        return entry["width_cm"], entry["height_cm"]
+    if entry and not entry.get("mismatch"):
+        return entry["height_cm"], entry["width_cm"]
+    return row["height_cm"], row["width_cm"]
+
+
+def load_tables(lang=None):
+    """{collection: Table}, optionally limited to one language."""
+    rows, _ = load_rows()
+    # Applied after the cache: data/paintingsizes.json changes without the content files changing
+    sizes = json.loads(SIZES_PATH.read_text(encoding="utf-8")) if SIZES_PATH.exists() else {}
+    for row in rows["paintings"]:
+        row["height_cm"], row["width_cm"] = physical_size(row, sizes)
+    return {
+        name: Table(name, [r for r in collection_rows if lang in (None, r["lang"])])
+        for name, collection_rows in rows.items()
+    }
+
+
+# --- Output ---
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value == int(value):
+        return str(int(value))
+    return str(value)
+
+
+def print_rows(rows, fields, fmt):
+    if fmt == "json":
+        print(json.dumps(rows, indent=2, ensure_ascii=False, default=_cell))
+    elif fmt == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: _cell(v) for k, v in row.items()})
+    else:
+        cells = [[_cell(row.get(f)) for f in fields] for row in rows]
+        widths = [min(max([len(f)] + [len(c[i]) for c in cells]), 48) for i, f in enumerate(fields)]
+        print("  ".join(f.ljust(w) for f, w in zip(fields, widths)))
+        print("  ".join("-" * w for w in widths))
+        for c in cells:
+            print("  ".join(v[:w].ljust(w) for v, w in zip(c, widths)))
+        print(f"\n{len(rows)} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filter, sort and group content front matter")
+    parser.add_argument("collection", choices=sorted(COLLECTIONS), help="Collection to query")
+    parser.add_argument("--where", action="append", default=[], metavar="COND", help="Condition, e.g. status=available or width_cm>100 (repeatable)")
+    parser.add_argument("--sort", default="", help="Comma-separated columns; prefix with - for descending (--sort=-width_cm)")
+    parser.add_argument("--group", metavar="COLUMN", help="Count matching rows per value of COLUMN")
+    parser.add_argument("--fields", default="", help="Comma-separated columns to output (default: title, file and the columns used)")
+    parser.add_argument("--limit", type=int, help="Maximum number of rows")
+    parser.add_argument("--lang", choices=[*LANGS, "all"], default="nl", help="Language tree (default: nl)")
+    parser.add_argument("--format", choices=["table", "json", "csv"], default="table", help="Output format")
+    parser.add_argument("--columns", action="store_true", help="List the collection's columns and their types")
+    args = parser.parse_args()
+
+    table = load_tables(None if args.lang == "all" else args.lang)[args.collection]
+
+    if args.columns:
+        for column, kind in table.kinds.items():
+            filled = sum(1 for v in table.columns[column] if v not in (None, "", []))
+            print(f"  {column:<16} {kind:<7} {filled}/{table.size} set")
+        return
+
+    try:
+        if args.group:
+            groups = table.group(args.group, args.where)
+            rows = [{args.group: value, "count": count} for value, count in groups.items()]
+            print_rows(rows, [args.group, "count"], args.format)
+            return
+
+        fields = [f for f in args.fields.split(",") if f]
+        if not fields:
+            used = [parse_condition(c)[0] for c in args.where] + [s.lstrip("-") for s in args.sort.split(",") if s]
+            fields = ["title"] + [c for c in dict.fromkeys(used) if c != "title"] + ["file"]
+            fields = [f for f in fields if f in table.columns]
+        rows = table.select(args.where, [s for s in args.sort.split(",") if s], fields, args.limit)
+    except ValueError as e:
+        print(f"  [ERROR] {e}")
+        sys.exit(2)
+    print_rows(rows, fields, args.format)
+
+
+if __name__ == "__main__":
+    main()
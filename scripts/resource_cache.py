@@ -0,0 +1,263 @@
+"""
+Manage Hugo's image cache (resources/_gen/images): hit/miss report, stale
+derivative GC, and a deterministic cache key for CI.
+
+Hugo names each derivative <name>_hu_<hash>.<ext>, with the hash taken over
+the source image and the processing spec, and never removes old ones. Specs
+that are no longer used and images that were deleted or replaced stay in
+the cache forever. The CI cache is restored all-or-nothing, so it only grows.
+
+Hugo's hash can't be recomputed outside Hugo, so this works from a ledger,
+resources/_gen/derivatives.json, written by --record after a build. It
+contains each source image's derivatives, as published in public/, together
+with an inputs hash. The inputs hash covers everything that decides those
+derivatives:
+  - the source image bytes
+  - its entries in data/imagesizes.json and data/imagequality.json
+  - the templates that process images (picture.html and its callers)
+  - the [imaging] settings in hugo.toml and HUGO_VERSION
+The images the site needs are read from the content front matter (image,
+gallery) and the literal resources.Get paths in the layouts.
+
+  (default)   before a build: which images are cached (hit) and which Hugo
+              will have to process (miss: new, changed inputs, or files gone)
+  --record    after a build: update the ledger from public/, and the byte
+              size of each derivative in data/imagebytes.json (read by the
+              lightbox prefetch manifest; commit it when it changes)
+  --gc        delete cached derivatives that no needed image uses any more
+  --key       print the cache key: a hash of the inputs of every needed
+              image, unaffected by text, CSS or unrelated template edits
+
+Usage:
+    python scripts/resource_cache.py                       # hit/miss report
+    hugo --minify && python scripts/resource_cache.py --record --gc
+    python scripts/resource_cache.py --gc --dry-run
+    python scripts/resource_cache.py --key                 # e.g. for actions/cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_header import IMAGE_EXTS  # noqa: E402
+from validate_content import COLLECTIONS, ROOT, parse_front_matter  # noqa: E402
+
+ASSETS = ROOT / "assets"
+LAYOUTS = ROOT / "layouts"
+PUBLIC = ROOT / "public"
+GEN = ROOT / "resources" / "_gen"
+GEN_IMAGES = GEN / "images"
+LEDGER_PATH = GEN / "derivatives.json"
+LEDGER_VERSION = 1
+BYTES_PATH = ROOT / "data" / "imagebytes.json"
+
+# Templates whose text decides which derivatives exist
+PROCESSING_RE = re.compile(r"\.(?:Resize|Fill|Fit|Crop|Process|Filter)\b|partial \"picture\.html\"")
+RESOURCE_GET_RE = re.compile(r'resources\.Get "([^"]+)"')
+DERIVATIVE_RE = re.compile(r"^(?P<stem>.+)_hu_[0-9a-f]+\.(?:jpe?g|png|webp|gif)$")
+
+
+def needed_images():
+    """Source images the site processes: "images/..." keys that exist under assets/."""
+    keys = set()
+    for langs in COLLECTIONS.values():
+        for config in langs.values():
+            for md_file in config["folder"].glob("*.md"):
+                fm = parse_front_matter(md_file) or {}
+                values = [fm["image"]] if fm.get("image") else []
+                if isinstance(fm.get("gallery"), list):
+                    values += fm["gallery"]
+                keys.update(str(v).lstrip("/") for v in values)
+    for template in LAYOUTS.rglob("*.html"):
+        keys.update(RESOURCE_GET_RE.findall(template.read_text(encoding="utf-8")))
+    return sorted(k for k in keys if k.lower().endswith(IMAGE_EXTS) and (ASSETS / k).is_file())
+
+
+def shared_inputs():
+    """Hash of what applies to every image: processing templates, [imaging] config, Hugo version."""
+    h = hashlib.sha256()
+    for template in sorted(LAYOUTS.rglob("*.html")):
+        text = template.read_text(encoding="utf-8")
+        if PROCESSING_RE.search(text):
+            h.update(template.relative_to(ROOT).as_posix().encode() + b"\0" + text.encode("utf-8"))
+    toml = (ROOT / "hugo.toml").read_text(encoding="utf-8")
+    imaging = re.search(r"^\[imaging\].*?(?=^\[(?!imaging)|\Z)", toml, re.MULTILINE | re.DOTALL)
+    h.update((imaging.group(0) if imaging else "").encode("utf-8"))
+    h.update(os.environ.get("HUGO_VERSION", "").encode())
+    return h.hexdigest()
+
+
+def load_data(name):
+    path = ROOT / "data" / name
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def image_inputs(keys):
+    """{key: inputs hash} for each source image."""
+    shared = shared_inputs()
+    sizes, quality = load_data("imagesizes.json"), load_data("imagequality.json")
+    inputs = {}
+    for key in keys:
+        h = hashlib.sha256(shared.encode())
+        h.update(hashlib.sha256((ASSETS / key).read_bytes()).digest())
+        h.update(json.dumps([sizes.get(key), quality.get(key)], sort_keys=True).encode())
+        inputs[key] = h.hexdigest()[:20]
+    return inputs
+
+
+def cache_key(inputs):
+    h = hashlib.sha256()
+    for key, digest in sorted(inputs.items()):
+        h.update(f"{key}\0{digest}\n".encode("utf-8"))
+    return h.hexdigest()[:24]
+
+
+def load_ledger():
+    if LEDGER_PATH.exists():
+        ledger = json.loads(LEDGER_PATH.read_text(encoding="utf-8"))
+        if ledger.get("version") == LEDGER_VERSION:
+            return ledger["images"]
+    return {}
+
+
+def published_derivatives(public):
+    """{source key: [derivative path below images cache]} from the files Hugo published."""
+    sources = {}
+    for path in (public / "images").rglob("*_hu_*"):
+        m = DERIVATIVE_RE.match(path.name)
+        if not m:
+            continue
+        rel_dir = path.parent.relative_to(public).as_posix()
+        candidates = [p for p in (ASSETS / rel_dir).glob(f"{m.group('stem')}.*") if p.suffix.lower() in IMAGE_EXTS]
+        if len(candidates) != 1:
+            continue  # source gone or ambiguous stem: nothing to attribute it to
+        key = candidates[0].relative_to(ASSETS).as_posix()
+        sources.setdefault(key, []).append(f"{rel_dir}/{path.name}")
+    return {key: sorted(files) for key, files in sources.items()}
+
+
+def record(public, inputs):
+    published = published_derivatives(public)
+    images = {key: {"inputs": inputs[key], "files": files} for key, files in published.items() if key in inputs}
+    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+    LEDGER_PATH.write_text(json.dumps({"version": LEDGER_VERSION, "images": images}, indent=1, sort_keys=True),
+                           encoding="utf-8")
+    return images
+
+
+def record_bytes(public, images):
+    """Write {derivative path: bytes} for the recorded derivatives; True if the file changed."""
+    sizes = {}
+    for entry in images.values():
+        for rel in entry["files"]:
+            path = public / rel
+            if path.is_file():
+                sizes[rel] = path.stat().st_size
+    text = json.dumps(sizes, indent=1, sort_keys=True) + "\n"
+    if BYTES_PATH.exists() and BYTES_PATH.read_text(encoding="utf-8") == text:
+        return False
+    BYTES_PATH.write_text(text, encoding="utf-8")
+    return True
+
+
+def status(inputs, ledger):
+    """{key: (state, files)} with state "hit", "missing files" or "miss"."""
+    result = {}
+    for key, digest in inputs.items():
+        entry = ledger.get(key)
+        if not entry or entry["inputs"] != digest:
+            result[key] = ("miss", entry["files"] if entry else [])
+            continue
+        missing = [f for f in entry["files"] if not (GEN_IMAGES / f).is_file()]
+        result[key] = ("missing files", missing) if missing else ("hit", entry["files"])
+    return result
+
+
+def stale_files(inputs, ledger):
+    """Cached derivatives not used by any needed image with unchanged inputs."""
+    keep = set()
+    for key, digest in inputs.items():
+        entry = ledger.get(key)
+        if entry and entry["inputs"] == digest:
+            keep.update(entry["files"])
+    if not GEN_IMAGES.is_dir():
+        return []
+    return sorted(p for p in GEN_IMAGES.rglob("*")
+                  if p.is_file() and p.relative_to(GEN_IMAGES).as_posix() not in keep)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report, record and clean Hugo's image derivative cache")
+    parser.add_argument("--record", action="store_true", help="Update the ledger from public/ (run after a build)")
+    parser.add_argument("--gc", action="store_true", help="Delete cached derivatives no needed image uses")
+    parser.add_argument("--dry-run", action="store_true", help="With --gc: list what would be deleted")
+    parser.add_argument("--key", action="store_true", help="Print the cache key and exit")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Built site directory (default: public/)")
+    parser.add_argument("--verbose", action="store_true", help="List every missed image")
+    args = parser.parse_args()
+
+    inputs = image_inputs(needed_images())
+    if args.key:
+        print(cache_key(inputs))
+        return
+
+    if args.record:
+        if not args.public.is_dir():
+            print(f"{args.public} not found — run `hugo --minify` first")
+            sys.exit(2)
+        images = record(args.public, inputs)
+        print(f"Recorded:   {sum(len(e['files']) for e in images.values())} derivatives of {len(images)} images")
+        label = "Written:" if record_bytes(args.public, images) else "Unchanged:"
+        print(f"{label:<12}{BYTES_PATH.relative_to(ROOT).as_posix()}")
+
+    ledger = load_ledger()
+    if args.gc:
+        if not ledger:
+            print(f"No ledger at {LEDGER_PATH.relative_to(ROOT)} — build, then run with --record first")
+            sys.exit(2)
+        stale = stale_files(inputs, ledger)
+        freed = sum(p.stat().st_size for p in stale)
+        for path in stale:
+            if args.dry_run:
+                print(f"  would delete {path.relative_to(ROOT).as_posix()}")
+            else:
+                path.unlink()
+        if not args.dry_run:
+            for folder in sorted((p for p in GEN_IMAGES.rglob("*") if p.is_dir()), reverse=True):
+                if not any(folder.iterdir()):
+                    folder.rmdir()
+        label = "Would free:" if args.dry_run else "Freed:"
+        print(f"{label:<12}{freed / 1e6:.1f} MB in {len(stale)} stale derivatives")
+        if not args.record:
+            return
+
+    if args.record:
+        return
+
+    states = status(inputs, ledger)
+    hits = [k for k, (s, _) in states.items() if s == "hit"]
+    partial = {k: files for k, (s, files) in states.items() if s == "missing files"}
+    misses = {k: files for k, (s, files) in states.items() if s == "miss"}
+    if args.verbose:
+        for key, files in sorted(misses.items()):
+            was = f" (had {len(files)} derivatives)" if files else " (new)"
+            print(f"  [MISS] {key}{was}")
+        for key, files in sorted(partial.items()):
+            print(f"  [MISS] {key}: {len(files)} cached files gone")
+    cached = sum(len(states[k][1]) for k in hits)
+    print(f"Images:     {len(inputs)} needed")
+    print(f"Hit:        {len(hits)} ({cached} derivatives cached)")
+    print(f"Miss:       {len(misses) + len(partial)} to process "
+          f"({len(misses)} new or changed, {len(partial)} with cached files gone)")
+    if not ledger:
+        print("No ledger yet — after the next build run: python scripts/resource_cache.py --record")
+    print(f"Cache key:  {cache_key(inputs)}")
+
+
+if __name__ == "__main__":
+    main()
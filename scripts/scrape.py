@@ -2,14 +2,27 @@
 Scraper for sanderveen-artshop.nl
 Crawls all painting detail pages, downloads images, and outputs a JSON manifest.
 
+Every image on a detail page is kept: the first becomes the painting's image,
+the rest (detail shots, framed views) its gallery, in page order. A painting's
+variants are downloaded in parallel (IMAGE_WORKERS). Reuse is decided by
+content, never by file name: a download whose bytes (sha256) match an image
+already on disk reuses that file, and an image URL is only skipped when the
+bytes it gave last time (scripts/.cache/scrape-images.json) are still on disk.
+Variants are named <slug>--N: slugify never produces "--", so they can't
+collide with a painting whose slug ends in a number.
+
 Usage:
     python scripts/scrape.py
 
 Output:
     scripts/manifest.json
-    assets/images/paintings/*.jpg
+    assets/images/paintings/<slug>.jpg, <slug>--2.jpg, ...
+
+Set ARTSHOP_BASE_URL to crawl a different host, e.g. the local stand-in
+server from scripts/artshop_stub.py.
 """
 
+import hashlib
 import json
 import os
 import re
@@ -17,12 +30,19 @@ import sys
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 from pathlib import Path
 
-BASE_URL = "https://sanderveen-artshop.nl"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from manifest_schema import Painting, save_manifest  # noqa: E402
+
+BASE_URL = os.environ.get("ARTSHOP_BASE_URL", "https://sanderveen-artshop.nl")
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "images" / "paintings"
 MANIFEST_PATH = Path(__file__).parent / "manifest.json"
+URL_CACHE_PATH = Path(__file__).parent / ".cache" / "scrape-images.json"  # {url: {name, sha256}}
+POLITE_DELAY = 0.5  # seconds between detail pages; the stub harness sets 0
+IMAGE_WORKERS = 4  # parallel image downloads per painting
 
 CATEGORIES = {
     "abstract": "/webshop/schilderijenpaintings/abstract/",
@@ -30,15 +50,15 @@ CATEGORIES = {
 }
 
 
-def fetch(url, retries=3):
-    """Fetch URL content with retry logic."""
+def fetch_bytes(url, retries=3):
+    """Fetch URL body with retry logic; None if every attempt failed."""
     for attempt in range(retries):
         try:
             req = urllib.request.Request(url, headers={
                 "User-Agent": "Mozilla/5.0 (sanderveen.art migration script)"
             })
             with urllib.request.urlopen(req, timeout=30) as resp:
-                return resp.read().decode("utf-8", errors="replace")
+                return resp.read()
         except Exception as e:
             print(f"  Attempt {attempt + 1} failed for {url}: {e}")
             if attempt < retries - 1:
@@ -46,23 +66,87 @@ def fetch(url, retries=3):
     return None
 
 
-def download_image(url, dest_path):
-    """Download an image file."""
-    if dest_path.exists():
-        print(f"  Image already exists: {dest_path.name}")
-        return True
-    try:
-        req = urllib.request.Request(url, headers={
-            "User-Agent": "Mozilla/5.0 (sanderveen.art migration script)"
-        })
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            dest_path.write_bytes(resp.read())
-            print(f"  Downloaded: {dest_path.name}")
-            return True
-    except Exception as e:
-        print(f"  Failed to download {url}: {e}")
-        return False
+def fetch(url, retries=3):
+    """Fetch URL content as text with retry logic."""
+    body = fetch_bytes(url, retries)
+    return body.decode("utf-8", errors="replace") if body is not None else None
+
+
+def hash_index(folder):
+    """{sha256: file name} of the images already in `folder`."""
+    if not folder.exists():
+        return {}
+    return {hashlib.sha256(p.read_bytes()).hexdigest(): p.name
+            for p in sorted(folder.iterdir()) if p.is_file()}
+
+
+def variant_filename(slug, index, url):
+    """<slug>.jpg for the first image, <slug>--2.jpg, <slug>--3.jpg, ... for the rest."""
+    ext = os.path.splitext(urllib.parse.urlparse(url).path)[1] or ".jpg"
+    return f"{slug}{ext}" if index == 0 else f"{slug}--{index + 1}{ext}"
+
+
+def free_filename(slug, index, url):
+    """variant_filename, or the next <slug>--N not yet on disk if that is taken."""
+    name = variant_filename(slug, index, url)
+    n = index + 1
+    while (OUTPUT_DIR / name).exists():
+        n += 1
+        name = variant_filename(slug, n - 1, url)
+    return name
+
+
+def load_url_cache():
+    if URL_CACHE_PATH.exists():
+        return json.loads(URL_CACHE_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_url_cache(cache):
+    URL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    URL_CACHE_PATH.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def download_variants(urls, slug, pool, known, url_cache):
+    """Download a painting's images; returns their local paths in page order.
+
+    A URL whose bytes from an earlier run are still on disk (`url_cache`, see
+    load_url_cache) is not fetched; the rest are fetched in parallel on
+    `pool`. `known` ({sha256: file name}, see hash_index) is checked and
+    updated, so identical bytes are stored once. A new image is never written
+    over an existing file.
+    """
+    def on_disk(url):
+        entry = url_cache.get(url)
+        return entry["name"] if entry and known.get(entry["sha256"]) == entry["name"] else None
+
+    todo = [url for url in urls if not on_disk(url)]
+    fetched = dict(zip(todo, pool.map(fetch_bytes, todo)))
+
+    local = []
+    for index, url in enumerate(urls):
+        if url not in fetched:
+            name = on_disk(url)
+            print(f"  Image already exists: {name}")
+        elif fetched[url] is None:
+            print(f"  Failed to download {url}")
+            continue
+        else:
+            digest = hashlib.sha256(fetched[url]).hexdigest()
+            if digest in known:
+                name = known[digest]
+                print(f"  Same image as {name}: {url}")
+            else:
+                name = free_filename(slug, index, url)
+                OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+                (OUTPUT_DIR / name).write_bytes(fetched[url])
+                known[digest] = name
+                print(f"  Downloaded: {name}")
+            url_cache[url] = {"name": name, "sha256": digest}
+        path = f"images/paintings/{name}"
+        if path not in local:
+            local.append(path)
+    return local
 
 
 class LinkExtractor(HTMLParser):
@@ -229,6 +313,9 @@ def slugify(text):
 
 def main():
     paintings = []
+    known = hash_index(OUTPUT_DIR)
+    url_cache = load_url_cache()
+    pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
 
     for category, cat_path in CATEGORIES.items():
         print(f"\n--- Category: {category} ---")
@@ -262,35 +349,33 @@ def main():
             # Generate slug from Dutch title
             data["slug"] = slugify(data["title_nl"])
 
-            # Download primary image
+            # Download every image variant; the first one is the painting's image
             if data["images"]:
-                img_url = data["images"][0]
-                if not img_url.startswith("http"):
-                    img_url = BASE_URL + img_url
-
-                # Determine file extension
-                ext = os.path.splitext(urllib.parse.urlparse(img_url).path)[1] or ".jpg"
-                img_filename = data["slug"] + ext
-                img_path = OUTPUT_DIR / img_filename
-                data["local_image"] = f"images/paintings/{img_filename}"
-
-                download_image(img_url, img_path)
+                urls = [u if u.startswith("http") else BASE_URL + u for u in data["images"]]
+                local = download_variants(urls, data["slug"], pool, known, url_cache)
+                data["local_image"] = local[0] if local else ""
+                data["gallery"] = local[1:]
             else:
                 data["local_image"] = ""
                 print("  No image found!")
 
-            paintings.append(data)
-            time.sleep(0.5)  # Be polite
+            try:
+                paintings.append(Painting.from_dict(data, link))
+            except ValueError as e:
+                print(f"  Skipped: {e}")
+                continue
+            time.sleep(POLITE_DELAY)  # Be polite
+
+    pool.shutdown()
+    save_url_cache(url_cache)
 
     # Sort by ID
-    paintings.sort(key=lambda p: p.get("id", 0), reverse=True)
+    paintings.sort(key=lambda p: p.id, reverse=True)
 
     # Write manifest
-    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
-        json.dump(paintings, f, indent=2, ensure_ascii=False)
+    save_manifest(paintings, MANIFEST_PATH)
 
-    print(f"\n\nDone! Scraped {len(paintings)} paintings.")
+    print(f"\n\nDone! Scraped {len(paintings)} paintings ({sum(len(p.gallery) for p in paintings)} gallery images).")
     print(f"Manifest written to: {MANIFEST_PATH}")
 
 
@@ -0,0 +1,347 @@
+"""
+Subset the self-hosted web fonts to the characters the site actually uses.
+
+static/fonts holds the full latin Inter (400/500/600) and Playfair Display
+700 files. This tool collects the code points rendered in each font family
+and writes a subset woff2 per font to static/fonts/subset/, named by content
+hash, plus data/fonts.json mapping each original to its subset. head.html
+rewrites the @font-face URLs and the font preloads from that file. The
+originals stay in place as the masters and the fallback when the data file is
+missing.
+
+Where the characters come from:
+  - default: every built page in public/. Each text node (and placeholder/
+    alt/value/data-* attribute) is attributed to the family the stylesheets
+    give its element: font-family rules matched with the critical_css.py
+    selector matcher, by specificity, inherited otherwise.
+  - --content: every NL/EN content file, the i18n TOML files, hugo.toml, the
+    layouts and main.js. No cascade here, so all families get all characters.
+Printable ASCII, Latin-1 Supplement (U+00A0-U+00FF: é, è, ü, ç, ...), General
+Punctuation (“ ” … – —) and € are always kept, about 4 KB per Inter face
+(13.6-14.1 KB -> 17.2-17.8 KB), so search input and titles edited through the
+CMS render without a re-run (CI deploys content without running this). The
+Inter weights share one character set: which weight a string ends up in
+depends on state (hover, bold in markdown).
+
+A subset is only rebuilt when its character set or master file changes (the
+key in data/fonts.json). Characters missing from a stale subset fall back
+to the next font in the stack, so run this after adding content with new
+accented characters, or let --check catch it.
+
+Usage:
+    hugo --minify && python scripts/subset_fonts.py   # from the built site (most precise)
+    python scripts/subset_fonts.py --content          # from content + i18n, no build needed
+    python scripts/subset_fonts.py --check            # exit 1 if a subset is stale (same source as the last run)
+    # then rebuild: hugo --minify
+
+Requires fontTools and brotli (pip install fonttools brotli).
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from critical_css import (  # noqa: E402
+    CSS_DIR, EXCLUDE, JS_DIR, PUBLIC, ROOT, DomBuilder, Matcher, js_words, load_rules, parse_css,
+)
+
+STATIC = ROOT / "static"
+FONTS_DIR = STATIC / "fonts"
+SUBSET_DIR = FONTS_DIR / "subset"
+DATA_PATH = ROOT / "data" / "fonts.json"
+FONT_CSS = CSS_DIR / "_typography.css"
+SUBSET_VERSION = 2  # bump when the subsetter options change
+
+# Always in every subset, whatever the site uses today: CMS edits are deployed without a re-run
+ALWAYS_KEEP = (
+    {chr(c) for c in range(0x20, 0x7F)}         # printable ASCII
+    | {chr(c) for c in range(0xA0, 0x100)}      # Latin-1 Supplement
+    | {chr(c) for c in range(0x2000, 0x2070)}   # General Punctuation
+    | {"\u20ac"}                                 # €
+)
+TEXT_ATTRS = ("alt", "placeholder", "value")
+SKIP_TAGS = {"script", "style", "noscript", "template", "head"}
+
+
+# --- Fonts declared in the stylesheets ---
+
+def declared_fonts():
+    """[(family, weight, "fonts/x.woff2")] from the @font-face rules in _typography.css."""
+    fonts = []
+    for rule in parse_css(FONT_CSS.read_text(encoding="utf-8"), FONT_CSS.name):
+        if rule["selectors"] is not None or not rule["prelude"].startswith("@font-face"):
+            continue
+        family = re.search(r"font-family\s*:\s*['\"]?([^;'\"]+)", rule["body"])
+        weight = re.search(r"font-weight\s*:\s*(\w+)", rule["body"])
+        url = re.search(r"url\(\s*['\"]?\.\./(fonts/[^'\")]+)", rule["body"])
+        if family and url:
+            fonts.append((family.group(1).strip(), weight.group(1) if weight else "400", url.group(1)))
+    return fonts
+
+
+def css_variables(rules):
+    """Custom properties (--font-heading...) declared anywhere, last one wins."""
+    variables = {}
+    for rule in rules:
+        if rule["selectors"] is None:
+            continue
+        for name, value in re.findall(r"(--[\w-]+)\s*:\s*([^;]+)", rule["body"]):
+            variables[name] = value.strip()
+    return variables
+
+
+def first_family(value, variables):
+    """First family of a font-family value, resolving var(); None for inherit/unknown."""
+    m = re.fullmatch(r"var\(\s*(--[\w-]+)\s*\)", value.strip())
+    if m:
+        value = variables.get(m.group(1), "")
+    name = value.split(",")[0].strip().strip("'\"")
+    return None if name in ("", "inherit") else name
+
+
+def specificity(steps):
+    ids = classes = tags = 0
+    for _, tests in steps:
+        for test in tests:
+            if test[0] == "id":
+                ids += 1
+            elif test[0] == "tag":
+                tags += 1
+            else:
+                classes += 1
+    return ids, classes, tags
+
+
+def family_rules(rules, matcher):
+    """[(specificity, order, selector, family)] for every rule that sets font-family."""
+    variables = css_variables(rules)
+    out = []
+    for order, rule in enumerate(rules):
+        if rule["selectors"] is None:
+            continue
+        decl = re.search(r"(?:^|;)\s*font(?:-family)?\s*:\s*([^;]+)", rule["body"])
+        if not decl:
+            continue
+        family = first_family(decl.group(1), variables)
+        if family is None:
+            continue  # font: inherit in the reset
+        for selector in rule["selectors"]:
+            out.append((specificity(matcher.steps(selector)), order, selector, family))
+    return out
+
+
+# --- Collecting characters ---
+
+class TextDom(DomBuilder):
+    """DomBuilder that also keeps rendered text per element."""
+
+    def __init__(self):
+        super().__init__()
+        self.texts = []  # [(element, text)]
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        el = self.elements[-1]
+        for name, value in el.attrs.items():
+            if value and (name in TEXT_ATTRS or name.startswith("data-")):
+                self.texts.append((el, value))
+
+    def handle_data(self, data):
+        super().handle_data(data)
+        if data.strip() and not self._in_script:
+            self.texts.append((self._stack[-1], data))
+
+
+def chars_from_public(public, families):
+    """{family: set of characters} rendered in the built site."""
+    rules = load_rules()
+    matcher = None
+    used = {family: set() for family in families}
+    pages = [p for p in sorted(public.rglob("*.html"))
+             if not p.relative_to(public).as_posix().startswith(EXCLUDE)]
+    for page in pages:
+        dom = TextDom()
+        dom.feed(page.read_text(encoding="utf-8"))
+        if matcher is None:
+            matcher = Matcher(js_words(dom.scripts))
+            declarations = family_rules(rules, matcher)
+
+        computed = {}
+
+        def family_of(el):
+            if el is None or el.tag == "#document":
+                return None
+            if el not in computed:
+                winners = [(spec, order, family) for spec, order, selector, family in declarations
+                           if matcher.matches(el, selector)]
+                computed[el] = max(winners)[2] if winners else family_of(el.parent)
+            return computed[el]
+
+        for el, text in dom.texts:
+            if _inside(el, SKIP_TAGS):
+                continue
+            family = family_of(el)
+            if family in used:
+                used[family].update(text)
+    return used, len(pages)
+
+
+def _inside(el, tags):
+    while el is not None:
+        if el.tag in tags:
+            return True
+        el = el.parent
+    return False
+
+
+def chars_from_content():
+    """All characters in content, i18n, site config, layouts and scripts."""
+    sources = [ROOT / "hugo.toml"]
+    sources += sorted((ROOT / "content").rglob("*.md"))
+    sources += sorted((ROOT / "i18n").glob("*.toml"))
+    sources += sorted((ROOT / "layouts").rglob("*.html"))
+    sources += sorted(JS_DIR.glob("*.js"))
+    chars = set()
+    for path in sources:
+        chars.update(path.read_text(encoding="utf-8"))
+    return {c for c in chars if c.isprintable()}, len(sources)
+
+
+# --- Subsetting ---
+
+def subset_key(master_bytes, chars):
+    h = hashlib.sha256()
+    h.update(f"v{SUBSET_VERSION}\n".encode())
+    h.update(hashlib.sha256(master_bytes).digest())
+    h.update("".join(sorted(chars)).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def coverage(master_bytes):
+    """Code points the master font has glyphs for."""
+    from fontTools.ttLib import TTFont
+
+    return set(TTFont(io.BytesIO(master_bytes)).getBestCmap())
+
+
+def make_subset(master_bytes, chars):
+    """woff2 bytes of the master reduced to `chars` (layout features kept)."""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    font = TTFont(io.BytesIO(master_bytes))
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted(ord(c) for c in chars))
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(out)
+    return out.getvalue(), len(font.getGlyphOrder())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Subset static/fonts to the characters the site uses")
+    parser.add_argument("--public", type=Path, default=PUBLIC, help="Built site directory (default: public/)")
+    parser.add_argument("--content", action="store_true", help="Read content/i18n sources instead of public/")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a subset is missing or stale")
+    args = parser.parse_args()
+
+    try:
+        import brotli  # noqa: F401
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("fontTools/brotli not installed (pip install fonttools brotli)")
+        sys.exit(2)
+
+    fonts = declared_fonts()
+    families = sorted({family for family, _, _ in fonts})
+    manifest = json.loads(DATA_PATH.read_text(encoding="utf-8")) if DATA_PATH.exists() else {}
+    # --check compares against the same source the data file was made from
+    source = "content" if args.content or (args.check and manifest.get("source") == "content") else "public"
+    if source == "content":
+        chars, scanned = chars_from_content()
+        per_family = {family: set(chars) for family in families}
+        print(f"Sources:    {scanned} content/i18n/layout files")
+    else:
+        if not args.public.is_dir():
+            print(f"{args.public} not found — run `hugo --minify` first, or use --content")
+            sys.exit(2)
+        per_family, scanned = chars_from_public(args.public, families)
+        print(f"Pages:      {scanned} in {args.public}")
+
+    previous = manifest.get("files", {})
+    files, stale = {}, []
+    for family, weight, rel in fonts:
+        master = STATIC / rel
+        master_bytes = master.read_bytes()
+        chars = per_family[family] | ALWAYS_KEEP
+        missing = sorted(c for c in per_family[family] if not c.isspace() and ord(c) not in coverage(master_bytes))
+        if missing:
+            sample = "".join(missing[:40]) + ("..." if len(missing) > 40 else "")
+            print(f"  [WARNING] {rel}: {len(missing)} characters rendered in {family} {weight} are not in the font "
+                  f"(shown in the fallback font): {sample}")
+        key = subset_key(master_bytes, chars)
+        entry = previous.get(rel)
+        if entry and entry["key"] == key and (STATIC / entry["file"]).exists():
+            files[rel] = entry
+            continue
+        stale.append(rel)
+        if args.check:
+            continue
+        data, glyphs = make_subset(master_bytes, chars)
+        digest = hashlib.sha256(data).hexdigest()[:10]
+        out = SUBSET_DIR / f"{master.stem}.{digest}.woff2"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(data)
+        files[rel] = {
+            "family": family,
+            "weight": weight,
+            "file": out.relative_to(STATIC).as_posix(),
+            "key": key,
+            "codepoints": len(chars),
+            "glyphs": glyphs,
+            "bytes": len(data),
+            "original_bytes": len(master_bytes),
+        }
+
+    if args.check:
+        for rel in stale:
+            print(f"  [WARNING] {rel}: subset missing or made for another character set")
+        if stale:
+            print("Font subsets are out of date — run: python scripts/subset_fonts.py")
+            sys.exit(1)
+        print(f"Font subsets are up to date ({len(files)} fonts)")
+        return
+
+    text = json.dumps({"source": source, "files": files}, indent=2, sort_keys=True) + "\n"
+    if DATA_PATH.exists() and DATA_PATH.read_text(encoding="utf-8") == text:
+        text = None
+    else:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+    keep = {STATIC / e["file"] for e in files.values()}
+    for old in SUBSET_DIR.glob("*.woff2"):
+        if old not in keep:
+            old.unlink()
+
+    for rel, entry in sorted(files.items()):
+        print(f"  {rel:<42} {entry['original_bytes'] / 1024:5.1f} KB -> {entry['bytes'] / 1024:5.1f} KB"
+              f"  ({entry['codepoints']} chars, {entry['glyphs']} glyphs)")
+    before = sum(e["original_bytes"] for e in files.values())
+    after = sum(e["bytes"] for e in files.values())
+    print(f"Fonts:      {before / 1024:.1f} KB -> {after / 1024:.1f} KB ({len(stale)} rebuilt, {len(files) - len(stale)} unchanged)")
+    print(f"Written:    {DATA_PATH.relative_to(ROOT)}" if text else "Unchanged:  data/fonts.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Synthetic content corpus: a copy of the site with N generated works, for
+scaling benchmarks (bench_scale.py).
+
+The corpus is a standalone site tree. It has this repo's hugo.toml, layouts,
+i18n, data, static files, non-image assets and scripts, so
+`hugo -s <corpus>` and `python <corpus>/scripts/validate_content.py` run
+against it unchanged. The collections are replaced by generated files:
+  - schilderijen / en/paintings: bilingual pairs with matching translationKey,
+    title, medium, dimensions matching the photo's aspect ratio, status,
+    category, featured and year
+  - exposities / en/exhibitions: cover image plus a 2-6 image gallery
+  - workshops (NL and EN)
+The front matter follows validate_content.COLLECTIONS (required fields,
+type_value, category_options, status_options). A field added there that this
+generator doesn't know stops generation instead of producing invalid files.
+Generated content validates without errors.
+
+Images are placeholder JPEGs (Pillow) in a few aspect ratios. A small pool is
+rendered once, and every content image is a hard link to a pool file, so
+10,000 works cost little disk space. Hugo still processes each image
+separately, as it would real photos.
+
+Output is deterministic for a given --seed. corpus.json in the output folder
+records the parameters; re-running into a folder without one is refused.
+
+Usage:
+    python scripts/synth_corpus.py /tmp/corpus-1000 --paintings 1000
+    python scripts/synth_corpus.py /tmp/corpus --paintings 10000 --exhibitions 500 --seed 7
+    hugo -s /tmp/corpus-1000 && python /tmp/corpus-1000/scripts/validate_content.py
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from generate_content import slugify  # noqa: E402
+from image_header import read_header  # noqa: E402
+from resource_cache import RESOURCE_GET_RE  # noqa: E402
+from validate_content import COLLECTIONS, ROOT  # noqa: E402
+
+CORPUS_VERSION = 1
+MARKER = "corpus.json"
+
+# Copied as they are; static/search is generated per corpus, not copied
+SITE_FILES = ["hugo.toml"]
+SITE_DIRS = ["archetypes", "i18n", "layouts", "data", "static"]
+SKIP_STATIC = {"search"}
+
+# (width, height) ratios of the placeholder photos
+ASPECTS = [(3, 4), (4, 5), (2, 3), (1, 1), (4, 3), (3, 2), (16, 9)]
+
+# Parallel NL/EN vocabulary, so titles translate one to one
+ADJECTIVES = [
+    ("Stille", "Silent"), ("Rode", "Red"), ("Verloren", "Lost"), ("Gouden", "Golden"),
+    ("Donkere", "Dark"), ("Vrije", "Free"), ("Gebroken", "Broken"), ("Late", "Late"),
+    ("Blauwe", "Blue"), ("Wilde", "Wild"), ("Eerste", "First"), ("Open", "Open"),
+]
+NOUNS = [
+    ("Horizon", "Horizon"), ("Stad", "City"), ("Stroom", "Current"), ("Kloof", "Rift"),
+    ("Groep", "Group"), ("Tuin", "Garden"), ("Droom", "Dream"), ("Brug", "Bridge"),
+    ("Storm", "Storm"), ("Bloem", "Flower"), ("Reis", "Journey"), ("Stilte", "Silence"),
+]
+MEDIUMS = [
+    ("Acryl op doek", "Acrylic on canvas"),
+    ("Olieverf op doek", "Oil on canvas"),
+    ("Olieverf, acryl, epoxy op doek", "Oil paint, acrylic, epoxy on canvas"),
+    ("Gemengde techniek op paneel", "Mixed media on panel"),
+]
+PLACES = ["Veenendaal", "Ede", "Wageningen", "Utrecht", "Amersfoort", "Gorinchem", "Aalsmeer", "Arnhem"]
+SENTENCES = {
+    "nl": [
+        "Een selectie van recente werken werd gepresenteerd aan een breed publiek.",
+        "Kleur en vorm staan centraal in deze reeks.",
+        "Het werk ontstond in het atelier in Veenendaal.",
+        "Bezoekers konden de schilderijen van dichtbij bekijken.",
+    ],
+    "en": [
+        "A selection of recent works was presented to a wide audience.",
+        "Colour and form are central to this series.",
+        "The work was made in the studio in Veenendaal.",
+        "Visitors could see the paintings up close.",
+    ],
+}
+# Weighted towards what the real catalogue looks like
+STATUS_WEIGHTS = {"available": 6, "sold": 3, "not-for-sale": 1}
+
+
+def yaml_value(value):
+    """Front matter value in the quoting style of the existing content files."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, date)):
+        return str(value)
+    if isinstance(value, list):
+        return "".join(f"\n  - {json.dumps(v, ensure_ascii=False)}" for v in value)
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def write_page(path, fields, body=""):
+    lines = ["---"]
+    for key, value in fields.items():
+        lines.append(f"{key}:{'' if isinstance(value, list) else ' '}{yaml_value(value)}")
+    lines += ["---", ""]
+    if body:
+        lines += [body, ""]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def check_schema(collection, fields):
+    """Stop if validate_content.COLLECTIONS asks for fields this generator doesn't write."""
+    for lang, config in COLLECTIONS[collection].items():
+        missing = [f for f in config["required_fields"] if f not in fields[lang]]
+        unknown = [f for f in fields[lang] if f not in config["required_fields"] + config["optional_fields"]]
+        if missing or unknown:
+            raise SystemExit(f"synth_corpus.py is out of date with COLLECTIONS[{collection!r}][{lang!r}]: "
+                             f"missing {missing}, unexpected {unknown}")
+
+
+def corpus_folder(dest, collection, lang):
+    return dest / COLLECTIONS[collection][lang]["folder"].relative_to(ROOT)
+
+
+def link_or_copy(src, dst):
+    """Hard link when possible (same file system), otherwise copy."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def copy_site(dest):
+    """Everything but the generated collections and content images."""
+    for name in SITE_FILES:
+        shutil.copy2(ROOT / name, dest / name)
+    for name in SITE_DIRS:
+        if (ROOT / name).is_dir():
+            ignore = shutil.ignore_patterns(*SKIP_STATIC) if name == "static" else None
+            shutil.copytree(ROOT / name, dest / name, ignore=ignore, copy_function=link_or_copy)
+    shutil.copytree(ROOT / "assets", dest / "assets", ignore=shutil.ignore_patterns("images"),
+                    copy_function=link_or_copy)
+    (dest / "scripts").mkdir()
+    for script in (ROOT / "scripts").glob("*.py"):
+        shutil.copy2(script, dest / "scripts" / script.name)
+
+    # Section pages, about and contact; the collection folders only keep _index.md
+    collection_dirs = {c["folder"] for langs in COLLECTIONS.values() for c in langs.values()}
+
+    def ignore_content(folder, names):
+        if Path(folder) in collection_dirs:
+            return [n for n in names if n != "_index.md"]
+        return []
+
+    shutil.copytree(ROOT / "content", dest / "content", ignore=ignore_content)
+
+    # Images the layouts load by literal path (logo, fallback painting)
+    literal = set()
+    for template in (ROOT / "layouts").rglob("*.html"):
+        literal.update(RESOURCE_GET_RE.findall(template.read_text(encoding="utf-8")))
+    images = sorted(k for k in literal if k.startswith("images/") and (ROOT / "assets" / k).is_file())
+    for key in images:
+        target = dest / "assets" / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        link_or_copy(ROOT / "assets" / key, target)
+    return images
+
+
+def render_pool(folder, count, long_edge, rng):
+    """[(path, width, height)] placeholder photos: gradient, noise and a few shapes."""
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        print("Pillow is required for the placeholder images: pip install Pillow")
+        sys.exit(2)
+
+    folder.mkdir(parents=True)
+    pool = []
+    for i in range(count):
+        aw, ah = ASPECTS[i % len(ASPECTS)]
+        scale = long_edge / max(aw, ah)
+        width, height = round(aw * scale), round(ah * scale)
+        top, bottom = (tuple(rng.randrange(256) for _ in range(3)) for _ in range(2))
+        gradient = Image.linear_gradient("L").resize((width, height))
+        image = Image.composite(Image.new("RGB", (width, height), top), Image.new("RGB", (width, height), bottom), gradient)
+        draw = ImageDraw.Draw(image)
+        for _ in range(rng.randint(3, 8)):
+            x, y = rng.randrange(width), rng.randrange(height)
+            r = rng.randint(long_edge // 20, long_edge // 4)
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+        # Noise so the JPEGs weigh (and encode) like photos rather than flat colour
+        noise = Image.effect_noise((width, height), 48).convert("RGB")
+        image = Image.blend(image, noise, 0.18)
+        path = folder / f"pool-{i:02d}.jpg"
+        image.save(path, "JPEG", quality=88)
+        pool.append((path, width, height))
+    return pool
+
+
+def place_image(source, dest, key):
+    path = dest / "assets" / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    link_or_copy(source, path)
+
+
+def unique_slug(base, used):
+    slug, n = base, 2
+    while slug in used:
+        slug, n = f"{base}-{n}", n + 1
+    used.add(slug)
+    return slug
+
+
+def generate_paintings(dest, count, pool, reserved, rng):
+    """Paintings in both languages; `reserved` images (loaded by the layouts) are used first."""
+    nl_config, en_config = COLLECTIONS["paintings"]["nl"], COLLECTIONS["paintings"]["en"]
+    nl_dir, en_dir = corpus_folder(dest, "paintings", "nl"), corpus_folder(dest, "paintings", "en")
+    statuses = [s for s in nl_config["status_options"] for _ in range(STATUS_WEIGHTS.get(s, 1))]
+    used, start = set(), date(2015, 1, 1)
+    for i in range(count):
+        adjective, noun = rng.choice(ADJECTIVES), rng.choice(NOUNS)
+        title_nl, title_en = f"{adjective[0]} {noun[0]}", f"{adjective[1]} {noun[1]}"
+        if i < len(reserved):
+            image = reserved[i]
+            slug = unique_slug(Path(image).stem, used)
+            header = read_header(dest / "assets" / image)
+            width, height = header.width, header.height
+        else:
+            slug = unique_slug(slugify(title_nl), used)
+            image = f"images/paintings/{slug}.jpg"
+            source, width, height = rng.choice(pool)
+            place_image(source, dest, image)
+        height_cm = rng.randint(30, 120)
+        width_cm = max(10, round(height_cm * width / height))
+        category = rng.randrange(len(nl_config["category_options"]))
+        medium = rng.choice(MEDIUMS)
+        day = start + timedelta(days=rng.randrange(3650))
+        status, featured = rng.choice(statuses), rng.random() < 0.1
+        fields = {}
+        for lang, config, title, medium_text in (("nl", nl_config, title_nl, medium[0]), ("en", en_config, title_en, medium[1])):
+            fields[lang] = {
+                "title": title,
+                "date": day,
+                "draft": False,
+                "translationKey": slug,
+                "type": config["type_value"],
+                "medium": medium_text,
+                "dimensions": f"{height_cm} x {width_cm} cm",
+                "year": str(day.year),
+                "status": status,
+                "featured": featured,
+                "image": image,
+                "category": config["category_options"][category],
+            }
+        if i == 0:
+            check_schema("paintings", fields)
+        write_page(nl_dir / f"{slug}.md", fields["nl"])
+        write_page(en_dir / f"{slug}.md", fields["en"])
+
+
+def generate_exhibitions(dest, count, pool, rng):
+    nl_dir, en_dir = corpus_folder(dest, "exhibitions", "nl"), corpus_folder(dest, "exhibitions", "en")
+    type_value = COLLECTIONS["exhibitions"]["nl"]["type_value"]
+    used = set()
+    for i in range(count):
+        place = rng.choice(PLACES)
+        day = date(2015, 1, 1) + timedelta(days=rng.randrange(4000))
+        slug = unique_slug(slugify(f"expositie {place} {day.year}"), used)
+        images = []
+        for n in range(1, rng.randint(3, 7) + 1):
+            key = f"images/exhibitions/{slug}-{n}.jpg"
+            place_image(rng.choice(pool)[0], dest, key)
+            images.append(key)
+        shared = {
+            "translationKey": slug,
+            "type": type_value,
+            "date": day,
+            "start_date": day.isoformat(),
+            "end_date": (day + timedelta(days=rng.randint(2, 60))).isoformat(),
+            "location": place,
+            "image": images[0],
+            "gallery": images[1:],
+            "weight": (i + 1) * 10,
+        }
+        fields = {
+            "nl": {"title": f"Expositie {place} {day.year}", "description": f"Expositie in {place}, {day.year}", **shared},
+            "en": {"title": f"Exhibition {place} {day.year}", "description": f"Exhibition in {place}, {day.year}", **shared},
+        }
+        if i == 0:
+            check_schema("exhibitions", fields)
+        for lang, folder in (("nl", nl_dir), ("en", en_dir)):
+            write_page(folder / f"{slug}.md", fields[lang], " ".join(rng.sample(SENTENCES[lang], 2)))
+
+
+def generate_workshops(dest, count, rng):
+    nl_dir, en_dir = corpus_folder(dest, "workshops", "nl"), corpus_folder(dest, "workshops", "en")
+    type_value = COLLECTIONS["workshops"]["nl"]["type_value"]
+    used = set()
+    for i in range(count):
+        adjective, noun = rng.choice(ADJECTIVES), rng.choice(NOUNS)
+        slug = unique_slug(slugify(f"workshop {adjective[0]} {noun[0]}"), used)
+        lessons = rng.randint(1, 8)
+        shared = {
+            "translationKey": slug,
+            "type": type_value,
+            "location": "Atelier Sander Veen",
+            "price": f"{rng.choice([25, 35, 40, 45])} per les",
+            "weight": (i + 1) * 10,
+        }
+        fields = {
+            "nl": {"title": f"{adjective[0]} {noun[0]} schilderen", "description": f"Workshop in {lessons} lessen",
+                   "workshop_date": "Zaterdagen 10:00–12:00", **shared},
+            "en": {"title": f"Painting the {adjective[1]} {noun[1]}", "description": f"Workshop in {lessons} lessons",
+                   "workshop_date": "Saturdays 10:00–12:00", **shared},
+        }
+        if i == 0:
+            check_schema("workshops", fields)
+        for lang, folder in (("nl", nl_dir), ("en", en_dir)):
+            write_page(folder / f"{slug}.md", fields[lang], " ".join(rng.sample(SENTENCES[lang], 2)))
+
+
+def make_corpus(dest, paintings, exhibitions=None, workshops=None, seed=1, long_edge=1600, pool_size=12):
+    """Generate a corpus in `dest` (replacing an earlier corpus there); returns its parameters."""
+    dest = Path(dest)
+    if dest.exists():
+        if not (dest / MARKER).exists():
+            raise SystemExit(f"{dest} exists and is not a generated corpus (no {MARKER}); refusing to overwrite")
+        shutil.rmtree(dest)
+    exhibitions = max(1, paintings // 4) if exhibitions is None else exhibitions
+    workshops = max(1, paintings // 10) if workshops is None else workshops
+    params = {"version": CORPUS_VERSION, "paintings": paintings, "exhibitions": exhibitions,
+              "workshops": workshops, "seed": seed, "long_edge": long_edge}
+
+    start = time.perf_counter()
+    dest.mkdir(parents=True)
+    rng = random.Random(seed)
+    reserved = [k for k in copy_site(dest) if k.startswith("images/paintings/")]
+    pool = render_pool(dest / "_pool", pool_size, long_edge, rng)
+    generate_paintings(dest, paintings, pool, reserved, rng)
+    generate_exhibitions(dest, exhibitions, pool, rng)
+    generate_workshops(dest, workshops, rng)
+    (dest / MARKER).write_text(json.dumps(params, indent=2) + "\n", encoding="utf-8")
+    params["seconds"] = time.perf_counter() - start
+    return params
+
+
+def read_params(dest):
+    """Parameters of the corpus in `dest`, or None."""
+    marker = Path(dest) / MARKER
+    return json.loads(marker.read_text(encoding="utf-8")) if marker.exists() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic bilingual content corpus for scaling benchmarks")
+    parser.add_argument("dest", type=Path, help="Output folder (a standalone Hugo site)")
+    parser.add_argument("--paintings", type=int, default=1000, help="Paintings per language")
+    parser.add_argument("--exhibitions", type=int, help="Exhibitions per language (default: paintings / 4)")
+    parser.add_argument("--workshops", type=int, help="Workshops per language (default: paintings / 10)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed; same seed, same corpus")
+    parser.add_argument("--long-edge", type=int, default=1600, help="Long edge of the placeholder photos (px)")
+    args = parser.parse_args()
+
+    params = make_corpus(args.dest, args.paintings, args.exhibitions, args.workshops, args.seed, args.long_edge)
+    print(f"Corpus:     {args.dest}")
+    print(f"Works:      {params['paintings']} paintings, {params['exhibitions']} exhibitions, "
+          f"{params['workshops']} workshops (x2 languages)")
+    print(f"Generated:  {params['seconds']:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Per-image WebP/JPEG quality search for the Hugo image pipeline.
+
+For every image under assets/images, a reference derivative (800px wide,
+Lanczos, like Hugo's resampleFilter) is encoded at several qualities in a
+process pool. The lowest quality whose SSIM against the reference stays at or
+above the target in every channel (Y, Cb and Cr) is kept, so images that compress well (flat colour fields,
+soft phone photos) stop paying for the quality that textured work needs. Results are cached by content hash and written
+to data/imagequality.json, which picture.html and schilderijen/single.html
+read instead of the fixed q85.
+
+Qualities never go above 85 (the previous site-wide setting), so no page gets
+heavier. AVIF is not searched: Hugo's pipeline only encodes WebP and JPEG.
+
+Usage:
+    python scripts/tune_quality.py                  # update data/imagequality.json
+    python scripts/tune_quality.py --target 0.985   # stricter quality target
+    python scripts/tune_quality.py --workers 4
+    python scripts/tune_quality.py --check          # exit 1 if the data file is stale
+
+Requires Pillow with WebP support (pip install pillow).
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ASSETS = ROOT / "assets"
+IMAGES = ASSETS / "images"
+DATA_PATH = ROOT / "data" / "imagequality.json"
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "image-quality.json"
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+FORMATS = {"webp": "WEBP", "jpeg": "JPEG"}
+QUALITIES = [40, 50, 60, 65, 70, 75, 80, 85]  # ascending; the last is the fallback
+DEFAULT_TARGET = 0.95
+REFERENCE_WIDTH = 800
+METRIC = "ssim-ycbcr-min"  # part of the cache key; change when ssim() changes
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _mean(im):
+    from PIL import Image
+    return im.resize((1, 1), Image.BOX).getpixel((0, 0))
+
+
+def _ssim_channel(x, y):
+    """Mean SSIM of two same-size float ("F") images over 8×8 blocks."""
+    from PIL import Image, ImageMath
+
+    size = (max(x.width // 8, 1), max(x.height // 8, 1))
+
+    def block_mean(expr):
+        return ImageMath.lambda_eval(expr, x=x, y=y).resize(size, Image.BOX)
+
+    mx = x.resize(size, Image.BOX)
+    my = y.resize(size, Image.BOX)
+    mxx = block_mean(lambda d: d["x"] * d["x"])
+    myy = block_mean(lambda d: d["y"] * d["y"])
+    mxy = block_mean(lambda d: d["x"] * d["y"])
+
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    ssim_map = ImageMath.lambda_eval(
+        lambda d: ((2 * d["mx"] * d["my"] + c1) * (2 * (d["mxy"] - d["mx"] * d["my"]) + c2))
+        / ((d["mx"] * d["mx"] + d["my"] * d["my"] + c1)
+           * ((d["mxx"] - d["mx"] * d["mx"]) + (d["myy"] - d["my"] * d["my"]) + c2)),
+        mx=mx, my=my, mxx=mxx, myy=myy, mxy=mxy,
+    )
+    return _mean(ssim_map)
+
+
+def ssim(a, b):
+    """SSIM of two same-size images: the lowest of the Y, Cb and Cr channel scores.
+
+    Luma alone misses chroma loss (4:2:0 subsampling, colour banding at low
+    qualities), which is what gives flat colour fields away first. Pure Pillow:
+    block means via BOX downsampling of float images, so no numpy.
+    """
+    channels = zip(a.convert("YCbCr").split(), b.convert("YCbCr").split())
+    return min(_ssim_channel(x.convert("F"), y.convert("F")) for x, y in channels)
+
+
+def encode(ref, fmt, quality):
+    from PIL import Image
+    buf = io.BytesIO()
+    ref.save(buf, FORMATS[fmt], quality=quality)
+    size = buf.tell()
+    buf.seek(0)
+    return size, Image.open(buf).convert("RGB")
+
+
+def search_quality(ref, fmt, target):
+    """Binary search QUALITIES for the lowest quality meeting `target`.
+
+    Returns (quality, bytes, ssim, bytes_at_fallback).
+    """
+    results = {}
+
+    def trial(q):
+        if q not in results:
+            size, decoded = encode(ref, fmt, q)
+            results[q] = (size, ssim(ref, decoded))
+        return results[q]
+
+    lo, hi = 0, len(QUALITIES) - 1
+    best = QUALITIES[-1]
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if trial(QUALITIES[mid])[1] >= target:
+            best = QUALITIES[mid]
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    size, score = trial(best)
+    return best, size, score, trial(QUALITIES[-1])[0]
+
+
+def tune_image(args):
+    """Worker: (path, target) -> result dict. Runs in a separate process."""
+    path, target = args
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.mode in ("RGBA", "LA", "P"):
+            im = im.convert("RGBA")
+            flat = Image.new("RGB", im.size, (255, 255, 255))
+            flat.paste(im, mask=im.getchannel("A"))
+            im = flat
+        else:
+            im = im.convert("RGB")
+        width = min(REFERENCE_WIDTH, im.width)
+        ref = im.resize((width, max(round(im.height * width / im.width), 1)), Image.LANCZOS)
+
+    result = {}
+    for fmt in FORMATS:
+        q, size, score, fallback = search_quality(ref, fmt, target)
+        result[fmt] = {"quality": q, "bytes": size, "ssim": round(score, 4), "bytes_default": fallback}
+    return result
+
+
+def params_key(target):
+    return f"metric={METRIC};target={target};width={REFERENCE_WIDTH};q={','.join(map(str, QUALITIES))}"
+
+
+def run(target, workers):
+    cache = json.loads(CACHE_PATH.read_text(encoding="utf-8")) if CACHE_PATH.exists() else {}
+    key = params_key(target)
+
+    images = {}
+    for path in sorted(IMAGES.rglob("*")):
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTS:
+            images[path.relative_to(ASSETS).as_posix()] = (path, file_hash(path))
+
+    todo = sorted({(str(p), h) for p, h in images.values() if cache.get(h, {}).get("params") != key})
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (path, digest), result in zip(todo, pool.map(tune_image, [(p, target) for p, _ in todo])):
+                cache[digest] = {"params": key, **result}
+                print(f"  {Path(path).relative_to(ASSETS).as_posix()}: webp q{result['webp']['quality']}, jpeg q{result['jpeg']['quality']}")
+
+    # Drop cache entries for content that no longer exists
+    live = {h for _, h in images.values()}
+    cache = {h: v for h, v in cache.items() if h in live}
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+    plan = {rel: {fmt: cache[h][fmt]["quality"] for fmt in FORMATS} for rel, (_, h) in sorted(images.items())}
+    stats = {rel: cache[h] for rel, (_, h) in images.items()}
+    return plan, stats, len(todo)
+
+
+def render(plan):
+    return json.dumps(plan, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search per-image WebP/JPEG quality against an SSIM target")
+    parser.add_argument("--target", type=float, default=DEFAULT_TARGET, help="Minimum SSIM vs. the uncompressed derivative")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Encoder processes")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if data/imagequality.json is out of date")
+    args = parser.parse_args()
+
+    try:
+        from PIL import features
+    except ImportError:
+        print("Pillow not installed (pip install pillow)")
+        sys.exit(2)
+    if not features.check("webp"):
+        print("Pillow was built without WebP support")
+        sys.exit(2)
+
+    plan, stats, encoded = run(args.target, args.workers)
+    text = render(plan)
+    current = DATA_PATH.read_text(encoding="utf-8") if DATA_PATH.exists() else ""
+
+    if args.check:
+        if current != text:
+            print(f"{DATA_PATH.relative_to(ROOT)} is out of date — run: python scripts/tune_quality.py")
+            sys.exit(1)
+        print(f"{DATA_PATH.relative_to(ROOT)} is up to date ({len(plan)} images)")
+        return
+
+    if current != text:
+        DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DATA_PATH.write_text(text, encoding="utf-8")
+
+    print(f"\nImages:   {len(plan)} ({encoded} searched, {len(plan) - encoded} from cache)")
+    for fmt in FORMATS:
+        chosen = sum(s[fmt]["bytes"] for s in stats.values())
+        default = sum(s[fmt]["bytes_default"] for s in stats.values())
+        saved = (1 - chosen / default) * 100 if default else 0.0
+        print(f"{fmt.upper():<5}     {chosen / 1e6:.2f} MB vs. {default / 1e6:.2f} MB at q{QUALITIES[-1]} "
+              f"({saved:.1f}% smaller, {REFERENCE_WIDTH}px reference derivatives)")
+
+
+if __name__ == "__main__":
+    main()
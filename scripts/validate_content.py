@@ -2,7 +2,8 @@
 Content validation for sanderveen.art
 
 Validates all Hugo content files against the CMS schema (Sveltia CMS config.yml).
-Checks bilingual parity, front matter schema, enums, image paths, and cross-references.
+Checks bilingual parity, front matter schema, enums, image paths and headers
+(resolution, real format, EXIF orientation), and cross-references.
 
 Usage:
     python scripts/validate_content.py          # Run all checks
@@ -18,6 +19,9 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_header import EXTENSION_FORMATS, read_headers  # noqa: E402
+
 # --- Configuration ---
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -29,7 +33,7 @@ COLLECTIONS = {
         "nl": {
             "folder": ROOT / "content" / "schilderijen",
             "required_fields": ["title", "date", "draft", "translationKey", "type", "medium", "dimensions", "status", "featured", "image", "category"],
-            "optional_fields": ["year"],
+            "optional_fields": ["year", "gallery"],
             "type_value": "schilderijen",
             "category_options": ["Abstract", "Surrealistisch"],
             "status_options": ["available", "sold", "not-for-sale"],
@@ -37,7 +41,7 @@ COLLECTIONS = {
         "en": {
             "folder": ROOT / "content" / "en" / "paintings",
             "required_fields": ["title", "date", "draft", "translationKey", "type", "medium", "dimensions", "status", "featured", "image", "category"],
-            "optional_fields": ["year"],
+            "optional_fields": ["year", "gallery"],
             "type_value": "schilderijen",
             "category_options": ["Abstract", "Surrealist"],
             "status_options": ["available", "sold", "not-for-sale"],
@@ -74,6 +78,10 @@ COLLECTIONS = {
 }
 
 
+# Smallest long edge (px) for content images; below this the largest srcset step is upscaled
+MIN_LONG_EDGE = {"paintings": 800, "exhibitions": 600}
+
+
 @dataclass
 class Issue:
     severity: str  # ERROR, WARNING
@@ -99,6 +107,17 @@ class ValidationResult:
         return [i for i in self.issues if i.severity == "WARNING"]
 
 
+DIMENSIONS_RE = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*x\s*(\d+(?:[.,]\d+)?)\s*cm\s*$")
+
+
+def parse_dimensions(value) -> Optional[tuple]:
+    """(height_cm, width_cm) from "77,5 x 44,5 cm", or None if not in 'N x N cm' form."""
+    m = DIMENSIONS_RE.match(str(value))
+    if not m:
+        return None
+    return tuple(float(n.replace(",", ".")) for n in m.groups())
+
+
 def parse_front_matter(filepath: Path) -> Optional[dict]:
     """Parse YAML front matter from a Hugo content file."""
     text = filepath.read_text(encoding="utf-8")
@@ -223,7 +242,7 @@ def validate_collection(collection_name: str, lang: str, config: dict, result: V
         # Check dimensions format (paintings only)
         if collection_name == "paintings" and "dimensions" in fm and fm["dimensions"]:
             dim = str(fm["dimensions"])
-            if not re.match(r'^\d+[\d,.]?\d*\s*x\s*\d+[\d,.]?\d*\s*cm$', dim):
+            if parse_dimensions(dim) is None:
                 result.issues.append(Issue("WARNING", collection_name, lang, str(relpath), "dimensions", f"Unusual dimensions format: '{dim}' (expected 'N x N cm')"))
 
         # Check weight is numeric (workshops/exhibitions)
@@ -422,6 +441,8 @@ def check_orphaned_images(result: ValidationResult):
                 fm = parse_front_matter(md_file)
                 if fm and "image" in fm:
                     referenced.add(str(fm["image"]).lstrip("/"))
+                if fm and isinstance(fm.get("gallery"), list):
+                    referenced.update(str(v).lstrip("/") for v in fm["gallery"])
 
     # Check all images in paintings dir
     for img_file in paintings_dir.rglob("*"):
@@ -433,6 +454,46 @@ def check_orphaned_images(result: ValidationResult):
                 result.issues.append(Issue("WARNING", "paintings", "-", str(rel), "image", f"Orphaned image not referenced by any content: {img_ref}"))
 
 
+def check_image_headers(result: ValidationResult):
+    """Check resolution, real format and EXIF orientation of every image and gallery entry.
+
+    Reads image headers only (image_header.py), in parallel, so this stays fast
+    on multi-megabyte masters.
+    """
+    refs = []  # (collection, lang, relpath, field, value, path)
+    for collection_name, langs in COLLECTIONS.items():
+        for lang, config in langs.items():
+            for md_file in sorted(config["folder"].glob("*.md")):
+                if md_file.name == "_index.md":
+                    continue
+                fm = parse_front_matter(md_file)
+                if not fm:
+                    continue
+                relpath = md_file.relative_to(ROOT)
+                values = [("image", fm["image"])] if fm.get("image") else []
+                if isinstance(fm.get("gallery"), list):
+                    values += [("gallery", v) for v in fm["gallery"]]
+                for field_name, value in values:
+                    path = ROOT / "assets" / str(value).lstrip("/")
+                    if path.is_file():  # missing files are reported by validate_collection
+                        refs.append((collection_name, lang, str(relpath), field_name, value, path))
+
+    headers = read_headers(sorted({r[5] for r in refs}))
+    for collection_name, lang, relpath, field_name, value, path in refs:
+        info = headers[path]
+        if isinstance(info, Exception):
+            result.issues.append(Issue("ERROR", collection_name, lang, relpath, field_name, f"Can't read image {value}: {info}"))
+            continue
+        expected = EXTENSION_FORMATS.get(path.suffix.lower())
+        if expected and info.format != expected:
+            result.issues.append(Issue("ERROR", collection_name, lang, relpath, field_name, f"{value} is a {info.format} file with a '{path.suffix}' extension (Hugo goes by the extension)"))
+        min_edge = MIN_LONG_EDGE.get(collection_name)
+        if min_edge and max(info.width, info.height) < min_edge:
+            result.issues.append(Issue("WARNING", collection_name, lang, relpath, field_name, f"{value} is only {info.width}x{info.height} px (long edge below {min_edge} px)"))
+        if info.orientation not in (0, 1):
+            result.issues.append(Issue("WARNING", collection_name, lang, relpath, field_name, f"{value} has EXIF orientation {info.orientation}: Hugo's resized copies ignore it, so save the photo with the rotation applied"))
+
+
 def run_validation() -> ValidationResult:
     """Run all validation checks."""
     result = ValidationResult()
@@ -461,6 +522,7 @@ def run_validation() -> ValidationResult:
     check_cms_config_sync(result)
     check_cms_field_media_folder_trap(result)
     check_orphaned_images(result)
+    check_image_headers(result)
     check_video_references(result)
 
     return result